@@ -0,0 +1,188 @@
+# Suite de benchmarks del optimizador: evaluaciones/s del simulador (escalar y vectorizado),
+# operaciones/s de los operadores de cruce y mutación y segundos por procesar_generacion, sobre
+# escenarios sintéticos de Rosario con semilla fija de 60 a 5000 tareas (curvas de escalado).
+# Los resultados se guardan como JSON y se comparan contra una línea base para marcar regresiones.
+#
+#   python benchmark.py                          # corre y compara contra benchmarks/baseline.json si existe
+#   python benchmark.py --actualizar             # corre y guarda el resultado como nueva línea base
+#   python benchmark.py --tamanos 60 500 --salida resultados/bench.json
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+import numpy as np
+import config
+import genetic_algorithm as ga
+import problem_setup as ps
+import simulation as sim
+import utils.crossover as crossover
+import utils.mutation as mutation
+import utils.construction as construction
+import utils.repair as repair
+from distance_matrix import construir_matriz_distancias
+from points_generator import generar_puntos_aleatorios
+
+logger = logging.getLogger(__name__)
+
+TAMANOS = (60, 250, 1000, 5000)
+TAREAS_POR_DRON = 6
+PLAZOS_MIN = (150, 180) # Plazos holgados (como las corridas de main.py) para que haya individuos viables
+SEMILLA = 12345
+TIEMPO_MINIMO = 0.2 # Segundos mínimos de cada repetición (se repite la operación hasta superarlos)
+REPETICIONES = 3 # Se informa la mejor de las repeticiones (la menos afectada por ruido del sistema)
+TOLERANCIA = 0.20 # Empeoramiento relativo a partir del cual se marca una regresión
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "baseline.json")
+
+def escenario_sintetico(num_tareas, semilla=SEMILLA):
+    """Tareas, drones, estaciones y distancias de un escenario reproducible dentro de POLIGONO_ROSARIO."""
+    random.seed(semilla + num_tareas)
+    num_drones = max(2, num_tareas // TAREAS_POR_DRON)
+    estaciones = generar_puntos_aleatorios(config.NUM_ESTACIONES, config.POLIGONO_ROSARIO)
+    escenario = ps.generar_escenario(num_tareas, num_drones, config.POLIGONO_ROSARIO, estaciones)
+    escenario.tiempos_max[:] = [random.randint(PLAZOS_MIN[0] * 60, PLAZOS_MIN[1] * 60) for _ in range(num_tareas)]
+    tareas, drones = escenario.tareas, escenario.drones
+    return tareas, drones, estaciones, construir_matriz_distancias(tareas, drones, estaciones)
+
+def medir(operacion, tiempo_minimo=TIEMPO_MINIMO, repeticiones=REPETICIONES):
+    """
+    Segundos por llamada de operacion(): cada repetición duplica la cantidad de llamadas hasta
+    superar tiempo_minimo y se devuelve la mejor repetición.
+    """
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        llamadas = 1
+        while True:
+            inicio = time.perf_counter()
+            for _ in range(llamadas):
+                operacion()
+            duracion = time.perf_counter() - inicio
+            if duracion >= tiempo_minimo:
+                break
+            llamadas *= 2
+        mejor = min(mejor, duracion / llamadas)
+    return mejor
+
+def _metrica(valor, unidad, mayor_es_mejor):
+    return {"valor": valor, "unidad": unidad, "mayor_es_mejor": mayor_es_mejor}
+
+def medir_escenario(num_tareas, tiempo_minimo=TIEMPO_MINIMO, repeticiones=REPETICIONES):
+    """Todas las métricas de un tamaño de escenario, como dict nombre -> métrica."""
+    tareas, drones, estaciones, distancias = escenario_sintetico(num_tareas)
+    with config.usar(NUM_TAREAS=len(tareas), NUM_DRONES=len(drones)): # crear_individuo y las mutaciones los leen de config
+        random.seed(SEMILLA)
+        poblacion = ga.crear_poblacion_inicial()
+        permutaciones, cortes = sim.poblacion_a_matrices(poblacion)
+        padre1, padre2 = poblacion[0].c_i.tolist(), poblacion[1].c_i.tolist()
+        cortes_padre = poblacion[0].c_ii.tolist()
+        tiempo = lambda operacion: medir(operacion, tiempo_minimo, repeticiones)
+
+        metricas = {
+            "funcion_objetivo": _metrica(1 / tiempo(lambda: sim.funcion_objetivo(poblacion[0], tareas, drones, estaciones, distancias)), "eval/s", True),
+            "evaluar_poblacion": _metrica(len(poblacion) / tiempo(lambda: sim.evaluar_poblacion(permutaciones, cortes, tareas, drones, estaciones, distancias)), "eval/s", True),
+        }
+        for nombre in crossover.OPERADORES:
+            operador = crossover.obtener_operador(nombre)
+            metricas[f"cruce_{nombre}"] = _metrica(1 / tiempo(lambda: operador(padre1, padre2)), "op/s", True)
+        metricas["swap_mutation"] = _metrica(1 / tiempo(lambda: mutation.swap_mutation(list(padre1))), "op/s", True)
+        metricas["reverse_segment"] = _metrica(1 / tiempo(lambda: mutation.reverse_segment(list(padre1))), "op/s", True)
+        metricas["cuts_mutation"] = _metrica(1 / tiempo(lambda: mutation.cuts_mutation(cortes_padre, len(tareas))), "op/s", True)
+
+        # Una generación completa sin cache de fitness, siempre desde la misma población viable (como en
+        # régimen, sin medir la reparación de una población aleatoria inviable): semillas de las heurísticas
+        # reparadas, más individuos aleatorios, pasadas por una primera generación
+        semillas = construction.sembrar(max(2, config.TAMANO_POBLACION // 5), tareas, drones, distancias)
+        sembrada = [repair.reparar_individuo(semilla, tareas, drones, distancias) for semilla in semillas]
+        sembrada += poblacion[len(sembrada):]
+        evaluada, inviable = ga.procesar_generacion(sembrada, tareas, drones, estaciones, distancias)
+        base = sembrada if inviable else evaluada
+        metricas["procesar_generacion"] = _metrica(tiempo(lambda: ga.procesar_generacion(base, tareas, drones, estaciones, distancias)), "s", False)
+    return metricas
+
+def ejecutar(tamanos=TAMANOS, tiempo_minimo=TIEMPO_MINIMO, repeticiones=REPETICIONES):
+    """Corre la suite y devuelve {"metadatos": ..., "resultados": {tamaño: {métrica: ...}}}."""
+    resultados = {}
+    for num_tareas in tamanos:
+        inicio = time.perf_counter()
+        resultados[str(num_tareas)] = medir_escenario(num_tareas, tiempo_minimo, repeticiones)
+        logger.info("%d tareas medidas en %.1f s", num_tareas, time.perf_counter() - inicio)
+    return {
+        "metadatos": {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "procesador": platform.processor() or platform.machine(),
+            "semilla": SEMILLA,
+            "tamano_poblacion": config.TAMANO_POBLACION,
+        },
+        "resultados": resultados,
+    }
+
+def comparar(actual, baseline, tolerancia=TOLERANCIA):
+    """
+    Compara dos resultados de ejecutar(). Devuelve la lista de regresiones (dicts con tamaño, métrica,
+    valores y cambio relativo) de las métricas que empeoraron más que `tolerancia`.
+    """
+    regresiones = []
+    for tamano, metricas in actual["resultados"].items():
+        for nombre, metrica in metricas.items():
+            base = baseline.get("resultados", {}).get(tamano, {}).get(nombre)
+            if base is None or base["valor"] <= 0:
+                continue
+            cambio = metrica["valor"] / base["valor"] - 1 # > 0: el valor creció
+            empeora = -cambio if metrica["mayor_es_mejor"] else cambio
+            if empeora > tolerancia:
+                regresiones.append({"tamano": int(tamano), "metrica": nombre, "baseline": base["valor"],
+                                    "actual": metrica["valor"], "unidad": metrica["unidad"], "cambio": cambio})
+    return regresiones
+
+def guardar(resultado, ruta):
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(resultado, archivo, indent=2, ensure_ascii=False)
+
+def cargar(ruta):
+    with open(ruta, encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmarks del simulador, los operadores y procesar_generacion.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=list(TAMANOS), help="Cantidades de tareas a medir")
+    parser.add_argument("--tiempo-minimo", type=float, default=TIEMPO_MINIMO, help="Segundos mínimos por repetición")
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES)
+    parser.add_argument("--baseline", default=BASELINE, help="JSON de referencia para detectar regresiones")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA, help="Empeoramiento relativo tolerado (0.2 = 20%%)")
+    parser.add_argument("--actualizar", action="store_true", help="Guardar el resultado como nueva línea base")
+    parser.add_argument("--salida", help="Guardar además el resultado en este JSON")
+    args = parser.parse_args(argumentos)
+    logging.basicConfig(level=config.NIVEL_LOG, format="%(message)s")
+
+    resultado = ejecutar(args.tamanos, args.tiempo_minimo, args.repeticiones)
+    for tamano, metricas in resultado["resultados"].items():
+        for nombre, metrica in metricas.items():
+            print(f"{tamano:>6} tareas  {nombre:<20} {metrica['valor']:>14.4g} {metrica['unidad']}")
+    if args.salida:
+        guardar(resultado, args.salida)
+
+    if args.actualizar:
+        guardar(resultado, args.baseline)
+        print(f"\nLínea base guardada en {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"\nNo hay línea base en {args.baseline} (usar --actualizar para crearla)")
+        return 0
+
+    regresiones = comparar(resultado, cargar(args.baseline), args.tolerancia)
+    for r in regresiones:
+        print(f"REGRESIÓN {r['tamano']} tareas {r['metrica']}: {r['baseline']:.4g} -> {r['actual']:.4g} {r['unidad']} ({100 * r['cambio']:+.0f}%)")
+    if not regresiones:
+        print(f"\nSin regresiones respecto de {args.baseline} (tolerancia {100 * args.tolerancia:.0f}%)")
+    return 1 if regresiones else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
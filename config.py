@@ -20,9 +20,48 @@ NUM_ESTACIONES = 15
 TAMANO_POBLACION = 50 # cantidad de individuos (flotas) por generación
 PROBABILIDAD_MUTACION = 0.05
 PROBABILIDAD_CRUCE = 0.3 #0.3 da buenos resultados. Mayor a 0.3 puede ser inestable
+FRACCION_SEMILLAS_HEURISTICAS = 0.0 # Fracción de la población inicial construida con heurísticas (ver utils/construction.py); 0 = toda aleatoria
+MUESTREO_SUPERVIVIENTES = "ruleta" # Completar P' con "ruleta" (giros independientes) o "sus" (stochastic universal sampling)
+BUSQUEDA_LOCAL = False # Etapa memética: 2-opt / or-opt / relocate sobre los mejores individuos de cada generación
+BUSQUEDA_LOCAL_ELITE = 5 # Cuántos de los mejores individuos se mejoran por generación
+BUSQUEDA_LOCAL_PASADAS = 3 # Pasadas máximas de búsqueda local por individuo
+REPARACION_INDIVIDUOS = 20 # Individuos inviables que se reparan cuando toda la población es inviable (ver utils/repair.py)
+REPARACION_MAX_MOVIMIENTOS = 30 # Movimientos de tareas máximos por individuo reparado
+OPERADOR_CRUCE = "pmx" # Cruce de c_i: "pmx", "ox" (order), "cx" (cycle) o "erx" (edge recombination)
 NUM_GENERACIONES = 20
-N_BEST = math.floor((0.5)*TAMANO_POBLACION)  # Cantidad de mejores individuos que se mantienen en cada generación de la población (P Unión POPP).
-K_TORNEO = math.floor((3/4)*TAMANO_POBLACION) # Número de individuos en cada torneo (mínimo 2)
+EPSILON = 1e-4 # Mejora mínima (MJ) de la mejor energía para considerar que la búsqueda sigue avanzando
+NCONV = 20 # Generaciones seguidas sin mejorar más de EPSILON para cortar por convergencia (None desactiva)
+TIEMPO_MAXIMO_SEGUNDOS = None # Presupuesto blando por corrida: no se empiezan generaciones después, pero la que está en curso termina (None = sin límite)
+def _n_best(tamano_poblacion):
+    return math.floor((0.5)*tamano_poblacion)
+def _k_torneo(tamano_poblacion):
+    return math.floor((3/4)*tamano_poblacion)
+# N_BEST y K_TORNEO se derivan de TAMANO_POBLACION: Configuracion.reemplazar los recalcula si cambia el tamaño y no se dan explícitos
+N_BEST = _n_best(TAMANO_POBLACION)  # Cantidad de mejores individuos que se mantienen en cada generación de la población (P Unión POPP).
+K_TORNEO = _k_torneo(TAMANO_POBLACION) # Número de individuos en cada torneo (mínimo 2)
+TAMANO_CACHE_FITNESS = 20000 # Cromosomas evaluados que se recuerdan por corrida (0 desactiva el cache)
+TAMANO_CACHE_RUTAS = 100000 # Rutas de dron simuladas que se recuerdan, para re-simular sólo las que cambian (0 lo desactiva)
+EVALUACION_PARALELA = False # Si es True la población se evalúa repartida en procesos (ver parallel_evaluation.py)
+NUM_PROCESOS = None # Procesos para la evaluación paralela (None = todos los núcleos)
+MIN_INDIVIDUOS_POR_BLOQUE = 256 # Por debajo de este tamaño de bloque conviene evaluar en serie
+
+# --- BARRIDO DE CORRIDAS (ver sweep.py) ---
+SEMILLA = None # Semilla base del barrido (None = aleatoria); cada corrida recibe una derivada
+TIMEOUT_CORRIDA_SEGUNDOS = None # Tiempo máximo por corrida del barrido (None = sin límite)
+
+# --- DESCOMPOSICIÓN POR GRUPOS (ver decomposition.py) ---
+NUM_GRUPOS = 1 # Grupos espaciales de tareas (k-means) resueltos por separado y en paralelo (1 = sin descomposición)
+ITERACIONES_KMEANS = 50 # Iteraciones máximas de k-means al agrupar las tareas
+
+# --- RE-OPTIMIZACIÓN EN LÍNEA (ver rolling_horizon.py) ---
+TIEMPO_REOPTIMIZACION_SEGUNDOS = 5 # Presupuesto de cada re-optimización al llegar o completarse tareas
+GENERACIONES_REOPTIMIZACION = 30 # Generaciones máximas de cada re-optimización
+
+# --- MODELO DE ISLAS (ver islands.py) ---
+NUM_ISLAS = 1 # Poblaciones independientes en procesos separados (1 = una sola población, sin islas)
+INTERVALO_MIGRACION = 5 # Generaciones entre migraciones
+NUM_MIGRANTES = 2 # Mejores individuos que cada isla envía en cada migración
+TOPOLOGIA_MIGRACION = "anillo" # "anillo" (a la isla siguiente) o "todos" (a todas las demás)
 
 # --- PARÁMETROS DE LA SIMULACIÓN ---
 VELOCIDAD_DRON = 10  # m/s
@@ -42,4 +81,108 @@ AREA_ROTOR = 0.89383 #[m^2] Ar, área del rotor
 EFICIENCIA_GLOBAL = 0.9 # eta, eficiencia global del sistema
 G = 9.81 # Aceleración gravitacional
 
-ESTACIONES_DE_CARGA = None
+ESTACIONES_DE_CARGA = None # Lista de [lat, lon]; si es None se cargan de cache/ con station_loader.py
+ESTACIONES_OSMNX = False # Si no hay estaciones en cache/, consultarlas con osmnx (requiere red)
+
+# --- REGISTRO Y EVENTOS ---
+NIVEL_LOG = "INFO" # Nivel de logging de main.py ("DEBUG" muestra cada recarga y penalización del simulador)
+REGISTRAR_EVENTOS = False # Si es True se cuentan recargas, penalizaciones e inviables por generación (ver events.py)
+REGISTRAR_TIEMPOS = True # Tiempos por fase y evaluaciones de cada generación (ver timing.py); se exportan a resultados/
+PERFILAR_GENERACION = None # Número de generación a correr bajo cProfile (None = ninguna)
+ARCHIVO_PERFIL = "resultados/perfil_generacion.prof" # Dónde se guarda ese perfil (abrir con pstats o snakeviz)
+
+# --- CONFIGURACIÓN POR CORRIDA ---
+# Los parámetros de arriba son los valores por defecto. Una corrida trabaja con una Configuracion
+# inmutable activada con `with config.usar(...)`: mientras está activa, `config.X` devuelve su valor
+# en ese hilo o tarea (contextvars), así varias corridas pueden compartir un proceso sin pisarse.
+import contextvars
+import sys
+import threading
+import types
+from contextlib import contextmanager
+
+class Configuracion:
+    """Parámetros inmutables de una corrida (se leen como atributos: configuracion.NUM_TAREAS)."""
+    __slots__ = ("_valores",)
+
+    def __init__(self, valores):
+        object.__setattr__(self, "_valores", types.MappingProxyType(dict(valores)))
+
+    def __getattr__(self, nombre):
+        try:
+            return self._valores[nombre]
+        except KeyError:
+            raise AttributeError(nombre) from None
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError("Configuracion es inmutable: usar reemplazar()")
+
+    def reemplazar(self, **cambios):
+        """
+        Nueva Configuracion con esos parámetros cambiados (sólo se aceptan parámetros existentes).
+        Si cambia TAMANO_POBLACION, N_BEST y K_TORNEO se recalculan salvo que vengan en cambios.
+        """
+        desconocidos = sorted(set(cambios) - set(self._valores))
+        if desconocidos:
+            raise ValueError(f"Parámetros de configuración desconocidos: {desconocidos}")
+        if "TAMANO_POBLACION" in cambios:
+            cambios.setdefault("N_BEST", _n_best(cambios["TAMANO_POBLACION"]))
+            cambios.setdefault("K_TORNEO", _k_torneo(cambios["TAMANO_POBLACION"]))
+        return Configuracion({**self._valores, **cambios})
+
+    def como_dict(self):
+        return dict(self._valores)
+
+    def __repr__(self):
+        return f"Configuracion({self.como_dict()!r})"
+
+_corrida = contextvars.ContextVar("configuracion_corrida", default=None)
+
+def actual():
+    """Configuracion activa en este contexto, o una con los valores del módulo si no hay ninguna."""
+    corrida = _corrida.get()
+    if corrida is not None:
+        return corrida
+    return Configuracion({nombre: valor for nombre, valor in globals().items() if nombre.isupper()})
+
+_activas = 0 # Corridas activas en todo el proceso (ver usar)
+_candado = threading.Lock()
+
+@contextmanager
+def usar(configuracion=None, **cambios):
+    """
+    Activa `configuracion` (o la actual) con `cambios` aplicados durante el bloque y la devuelve.
+    Mientras haya alguna corrida activa el módulo resuelve sus atributos con _ModuloConfig; sin
+    corridas vuelve a ser un módulo común, así la lectura de config.X no tiene costo extra.
+    """
+    global _activas
+    token = _corrida.set((configuracion or actual()).reemplazar(**cambios))
+    with _candado:
+        _activas += 1
+        _modulo.__class__ = _ModuloConfig
+    try:
+        yield _corrida.get()
+    finally:
+        with _candado:
+            _activas -= 1
+            if _activas == 0:
+                _modulo.__class__ = types.ModuleType
+        _corrida.reset(token)
+
+class _ModuloConfig(types.ModuleType):
+    """Módulo config cuyos parámetros se resuelven primero en la Configuracion activa del contexto."""
+
+    def __getattribute__(self, nombre):
+        corrida = _corrida.get()
+        if corrida is not None:
+            valores = corrida._valores
+            if nombre in valores:
+                return valores[nombre]
+        return types.ModuleType.__getattribute__(self, nombre)
+
+    def __setattr__(self, nombre, valor):
+        if nombre.isupper() and _corrida.get() is not None:
+            raise AttributeError(f"No se puede modificar config.{nombre} dentro de una corrida (usar config.usar)")
+        types.ModuleType.__setattr__(self, nombre, valor)
+
+_modulo = sys.modules[__name__]
@@ -0,0 +1,240 @@
+# Descomposición "primero agrupar, después rutear" para escenarios grandes: el cromosoma de una sola
+# permutación global hace crecer el espacio de búsqueda factorialmente con NUM_TAREAS. Las tareas se
+# agrupan con k-means sobre sus pickups y dropoffs proyectados a metros (punto medio), cada grupo
+# recibe los drones más cercanos (en proporción a sus tareas) y se resuelve con el mismo algoritmo
+# genético en procesos separados. Las sub-soluciones se unen en un solo plan de flota y una pasada de reparación con el
+# simulador completo mueve las tareas que fallan, también entre drones de grupos distintos (frontera).
+import logging
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import config
+import genetic_algorithm as ga
+import utils.repair as repair
+from distance_matrix import construir_matriz_distancias
+from fitness_cache import CacheFitness
+from individual import Individuo
+from parallel_evaluation import parametros_config
+from scenario import Escenario, arrays_tareas, arrays_bases, como_escenario
+from station_index import R_TIERRA
+from stopping import CriterioParada
+from utils.construction import a_individuo
+from utils.selection import generador
+
+logger = logging.getLogger(__name__)
+
+MIN_POR_GRUPO = 2 # Tareas y drones mínimos por grupo: con uno solo los operadores genéticos no tienen qué permutar ni cortar
+
+def proyectar(coords, lat0):
+    """Proyecta coordenadas (lat, lon) a metros en un plano tangente a la latitud lat0 (radianes)."""
+    coords = np.radians(np.asarray(coords, dtype=float).reshape(-1, 2))
+    return np.column_stack([R_TIERRA * np.cos(lat0) * coords[:, 1], R_TIERRA * coords[:, 0]])
+
+def kmeans(puntos, k, iteraciones=None, rng=None):
+    """
+    k-means (Lloyd) con inicialización k-means++. Devuelve (etiquetas (P,), centros (k, dim)).
+    Un grupo que se queda vacío se reinicia en el punto más lejano a su centro, así todos tienen puntos.
+    """
+    iteraciones = iteraciones or config.ITERACIONES_KMEANS
+    rng = rng or generador()
+    puntos = np.asarray(puntos, dtype=float)
+    centros = [puntos[rng.integers(len(puntos))]]
+    for _ in range(1, k):
+        d2 = np.min(((puntos[:, None, :] - np.asarray(centros)[None, :, :]) ** 2).sum(axis=2), axis=1)
+        centros.append(puntos[rng.choice(len(puntos), p=d2 / d2.sum())] if d2.sum() > 0 else puntos[rng.integers(len(puntos))])
+    centros = np.asarray(centros)
+
+    etiquetas = None
+    for _ in range(iteraciones):
+        d2 = ((puntos[:, None, :] - centros[None, :, :]) ** 2).sum(axis=2)
+        nuevas = np.argmin(d2, axis=1)
+        for g in np.setdiff1d(np.arange(k), nuevas):
+            lejano = int(np.argmax(d2[np.arange(len(puntos)), nuevas]))
+            nuevas[lejano] = g
+        if etiquetas is not None and np.array_equal(nuevas, etiquetas):
+            break
+        etiquetas = nuevas
+        centros = np.array([puntos[etiquetas == g].mean(axis=0) for g in range(k)])
+    return etiquetas, centros
+
+def repartir_drones(num_tareas_grupo, distancia_dron_grupo):
+    """
+    Cantidad de drones de cada grupo, proporcional a sus tareas (al menos MIN_POR_GRUPO y nunca más
+    que tareas), y asignación golosa de cada dron al grupo más cercano que todavía tiene cupo.
+    distancia_dron_grupo es (D, G), con D no mayor que el total de tareas; con más de un grupo, cada
+    uno tiene al menos MIN_POR_GRUPO tareas y D es al menos MIN_POR_GRUPO * G (ver agrupar).
+    Devuelve un array (D,) con el grupo de cada dron.
+    """
+    num_tareas_grupo = np.asarray(num_tareas_grupo)
+    num_drones, num_grupos = distancia_dron_grupo.shape
+    if num_grupos == 1:
+        return np.zeros(num_drones, dtype=np.int64)
+    ideal = num_drones * num_tareas_grupo / num_tareas_grupo.sum()
+    cupo = np.clip(np.floor(ideal).astype(int), MIN_POR_GRUPO, num_tareas_grupo)
+    while cupo.sum() < num_drones: # Resto mayor entre los grupos que admiten otro dron
+        g = int(np.argmax(np.where(cupo < num_tareas_grupo, ideal - cupo, -np.inf)))
+        cupo[g] += 1
+    while cupo.sum() > num_drones:
+        g = int(np.argmax(np.where(cupo > MIN_POR_GRUPO, cupo - ideal, -np.inf)))
+        cupo[g] -= 1
+
+    grupo_dron = np.full(num_drones, -1, dtype=np.int64)
+    for indice in np.argsort(distancia_dron_grupo, axis=None, kind="stable"):
+        d, g = divmod(int(indice), num_grupos)
+        if grupo_dron[d] < 0 and cupo[g] > 0:
+            grupo_dron[d] = g
+            cupo[g] -= 1
+    return grupo_dron
+
+def fusionar_grupos_chicos(puntos, etiquetas):
+    """
+    Une cada grupo con menos de MIN_POR_GRUPO puntos al grupo de centro más cercano (k-means puede
+    dejar grupos de un punto) y renumera los grupos desde 0. Devuelve (etiquetas, centros).
+    """
+    etiquetas = np.unique(etiquetas, return_inverse=True)[1]
+    while True:
+        tamanos = np.bincount(etiquetas)
+        centros = np.array([puntos[etiquetas == g].mean(axis=0) for g in range(len(tamanos))])
+        chico = int(np.argmin(tamanos))
+        if len(tamanos) == 1 or tamanos[chico] >= MIN_POR_GRUPO:
+            return etiquetas, centros
+        distancia = np.linalg.norm(centros - centros[chico], axis=1)
+        distancia[chico] = np.inf
+        etiquetas[etiquetas == chico] = int(np.argmin(distancia))
+        etiquetas = np.unique(etiquetas, return_inverse=True)[1]
+
+def agrupar(tareas, drones, num_grupos, rng=None):
+    """
+    Agrupa las tareas con k-means sobre el punto medio de su pickup y su dropoff proyectados y reparte
+    los drones entre los grupos (ver repartir_drones). Agrupar por [pickup, dropoff] (4 coordenadas)
+    junta tareas que salen de una zona y van a otra, y cada encadenamiento dropoff -> pickup del grupo
+    sería un vuelo en vacío de vuelta; con el punto medio el grupo queda compacto en el plano.
+    Cada grupo recibe al menos MIN_POR_GRUPO tareas y drones: se piden menos grupos si no alcanzan y
+    los grupos chicos que deje k-means se unen al más cercano.
+    Devuelve (grupo de cada tarea (N,), grupo de cada dron (D,)).
+    """
+    pickups, dropoffs, _, _ = arrays_tareas(tareas)
+    bases = arrays_bases(drones)
+    num_grupos = max(1, min(num_grupos, min(len(pickups), len(bases)) // MIN_POR_GRUPO))
+    lat0 = np.radians(np.vstack([pickups, dropoffs])[:, 0].mean())
+    puntos = (proyectar(pickups, lat0) + proyectar(dropoffs, lat0)) / 2
+    grupo_tarea, centros = fusionar_grupos_chicos(puntos, kmeans(puntos, num_grupos, rng=rng)[0])
+    num_grupos = len(centros)
+    # Cada dron va al grupo más cercano con cupo. Con menos tareas que drones se usan los primeros:
+    # el cromosoma sólo puede dejar sin ruta a los últimos
+    candidatos = bases[:len(pickups)]
+    distancia_dron_grupo = np.linalg.norm(proyectar(candidatos, lat0)[:, None, :] - centros[None, :, :], axis=2)
+    grupo_dron = np.full(len(bases), -1, dtype=np.int64)
+    grupo_dron[:len(candidatos)] = repartir_drones(np.bincount(grupo_tarea, minlength=num_grupos), distancia_dron_grupo)
+    return grupo_tarea, grupo_dron
+
+def _resolver_grupo(tareas, drones, estaciones, parametros, semilla, limite=None):
+    """
+    Corre el algoritmo genético de un grupo (en su propio proceso) con la configuración del padre,
+    sin pasarse de `limite` (instante de time.monotonic(), que es el mismo reloj en todos los procesos).
+    Devuelve (mejor individuo, su energía, generaciones, motivo de parada); si ninguno fue viable, el
+    primero de la última población con energía 0, para que la reparación de la unión lo intente.
+    """
+    random.seed(semilla)
+    with config.usar(config.Configuracion(parametros), NUM_TAREAS=len(tareas), NUM_DRONES=len(drones)):
+        criterio = CriterioParada(tiempo_maximo=None if limite is None else max(0.0, limite - time.monotonic()))
+        distancias = construir_matriz_distancias(tareas, drones, estaciones)
+        cache = CacheFitness(config.TAMANO_CACHE_FITNESS, config.TAMANO_CACHE_RUTAS) if config.TAMANO_CACHE_FITNESS > 0 else None
+        poblacion = ga.crear_poblacion_inicial(tareas, drones, estaciones, distancias)
+        ga.evaluar_pendientes(poblacion, tareas, drones, estaciones, distancias, cache)
+        mejor = min((individuo for individuo in poblacion if individuo.viable), key=lambda individuo: individuo.energia, default=None)
+        criterio.comenzar_generaciones()
+        for _ in range(config.NUM_GENERACIONES):
+            if criterio.agotado(): # Por ejemplo, si el grupo esperó un proceso libre: queda la población inicial
+                break
+            nueva, inviable = ga.procesar_generacion(poblacion, tareas, drones, estaciones, distancias, cache)
+            if inviable:
+                break
+            poblacion = nueva
+            candidato = min(poblacion, key=lambda individuo: individuo.energia)
+            if mejor is None or candidato.energia <= mejor.energia:
+                mejor = candidato
+            if criterio.registrar(mejor.energia) is not None:
+                break
+    if mejor is None:
+        return poblacion[0], 0.0, criterio.generaciones, criterio.motivo
+    return mejor, mejor.energia, criterio.generaciones, criterio.motivo
+
+def unir(soluciones, tareas_grupo, drones_grupo, num_drones):
+    """
+    Une las rutas de cada grupo (numeradas dentro del grupo) en un Individuo de la flota completa:
+    la ruta del dron global drones_grupo[g][d] es tareas_grupo[g][ruta d del grupo g].
+    """
+    rutas = [[] for _ in range(num_drones)]
+    for individuo, ids_tareas, ids_drones in zip(soluciones, tareas_grupo, drones_grupo):
+        c_i, c_ii = individuo
+        for d, ruta in enumerate(np.split(np.asarray(c_i, dtype=np.int64), np.asarray(c_ii, dtype=np.int64))):
+            rutas[ids_drones[d]] = ids_tareas[ruta].tolist()
+    rutas = rutas[:min(num_drones, sum(len(ids) for ids in tareas_grupo))] # Con menos tareas que drones sobran los últimos
+    if rutas[0] and rutas[-1]: # Las rutas vacías intermedias quedan como cortes repetidos, igual que en el cruce y la mutación
+        return Individuo(np.concatenate(rutas), np.cumsum([len(ruta) for ruta in rutas[:-1]]))
+    return a_individuo(rutas)
+
+def resolver_por_grupos(tareas, drones, estaciones, distancias=None, num_grupos=None, num_procesos=None, semilla=None,
+                        tiempo_maximo=None):
+    """
+    Resuelve el escenario por grupos espaciales en paralelo y une las soluciones (ver comentario del
+    módulo). Todos los grupos terminan dentro de tiempo_maximo segundos desde la llamada (por defecto
+    TIEMPO_MAXIMO_SEGUNDOS). Devuelve un dict con el mejor individuo de la flota (evaluado), su energía
+    (None si la unión reparada no es viable), las energías de cada grupo, el grupo de cada tarea y dron y
+    las distancias usadas para la unión (bajo demanda si no se pasaron).
+    """
+    tiempo_maximo = tiempo_maximo if tiempo_maximo is not None else config.TIEMPO_MAXIMO_SEGUNDOS
+    limite = None if tiempo_maximo is None else time.monotonic() + tiempo_maximo
+    num_grupos = num_grupos or config.NUM_GRUPOS
+    generador_semillas = random.Random(semilla)
+    tareas, drones = como_escenario(tareas, drones, estaciones)
+    grupo_tarea, grupo_dron = agrupar(tareas, drones, num_grupos, rng=np.random.default_rng(generador_semillas.randrange(2**32)))
+    num_grupos = int(grupo_tarea.max()) + 1
+    pickups, dropoffs, pesos, tiempos_max = arrays_tareas(tareas)
+    bases = arrays_bases(drones)
+    tareas_grupo = [np.flatnonzero(grupo_tarea == g) for g in range(num_grupos)]
+    drones_grupo = [np.flatnonzero(grupo_dron == g) for g in range(num_grupos)]
+    logger.info("Descomposición en %d grupos: tareas %s, drones %s", num_grupos,
+                [len(ids) for ids in tareas_grupo], [len(ids) for ids in drones_grupo])
+
+    parametros = parametros_config()
+    argumentos = []
+    for ids_tareas, ids_drones in zip(tareas_grupo, drones_grupo):
+        sub = Escenario(pickups[ids_tareas], dropoffs[ids_tareas], pesos[ids_tareas], tiempos_max[ids_tareas], bases[ids_drones])
+        argumentos.append((sub.tareas, sub.drones, estaciones, parametros, generador_semillas.randrange(2**32), limite))
+
+    num_procesos = min(num_grupos, num_procesos or config.NUM_PROCESOS or num_grupos)
+    if num_procesos > 1:
+        with ProcessPoolExecutor(max_workers=num_procesos) as pool:
+            resultados = list(pool.map(_resolver_grupo, *zip(*argumentos)))
+    else:
+        resultados = [_resolver_grupo(*args) for args in argumentos]
+    for g, (_, energia, generaciones, _) in enumerate(resultados):
+        logger.info("Grupo %d: energía %.2f MJ en %d generaciones%s", g + 1, energia, generaciones, "" if energia > 0 else " (inviable)")
+
+    # Unión y reparación de frontera sobre el escenario completo
+    with config.usar(NUM_TAREAS=len(pesos), NUM_DRONES=len(bases)):
+        if distancias is None: # Sólo se evalúa y repara la unión: no hace falta la matriz completa (D+N+S, N)
+            distancias = construir_matriz_distancias(tareas, drones, estaciones, bajo_demanda=True)
+        unido = unir([individuo for individuo, _, _, _ in resultados], tareas_grupo, drones_grupo, len(bases))
+        ga.evaluar_pendientes([unido], tareas, drones, estaciones, distancias)
+        reparado = False
+        if not unido.viable:
+            unido = repair.reparar_individuo(unido, tareas, drones, distancias)
+            ga.evaluar_pendientes([unido], tareas, drones, estaciones, distancias)
+            reparado = True
+
+    return {
+        "mejor_individuo": unido,
+        "mejor_energia": unido.energia if unido.viable else None,
+        "energias_grupos": [energia for _, energia, _, _ in resultados],
+        "generaciones_grupos": [generaciones for _, _, generaciones, _ in resultados],
+        "motivos_grupos": [motivo for _, _, _, motivo in resultados],
+        "grupo_tarea": grupo_tarea,
+        "grupo_dron": grupo_dron,
+        "reparado": reparado,
+        "parametros_inviables": not unido.viable,
+        "distancias": distancias,
+    }
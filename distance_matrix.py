@@ -0,0 +1,87 @@
+# Precalcula todas las distancias de un escenario (bases, pickups, dropoffs y estaciones)
+# para que el simulador las consulte por índice en lugar de recalcular haversine en cada evaluación.
+from points_generator import distancias_metros_matriz, distancias_metros_pares, _haversine_radianes
+from station_index import IndiceEstaciones
+from scenario import arrays_tareas, arrays_bases
+import numpy as np
+
+class OrigenPickupBajoDemanda:
+    """
+    Reemplazo de la matriz origen_pickup que calcula haversine sólo para los índices que se consultan.
+    Admite la misma indexación [origen, tarea] que usan el simulador, la reparación y las heurísticas
+    (enteros, arrays con broadcasting y slices) y devuelve float32 como la matriz densa. Sirve cuando
+    sólo se evalúan pocos individuos sobre un escenario grande (la unión de los grupos en
+    decomposition.py), donde la matriz completa (D+N+S, N) no entra en memoria.
+    """
+    def __init__(self, origenes, pickups):
+        self.origenes = np.radians(origenes)
+        self.pickups = np.radians(pickups)
+        self.shape = (len(origenes), len(pickups))
+        self.dtype = np.dtype(np.float32)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, clave):
+        o, t = clave
+        if isinstance(o, slice): # Como en numpy, un slice combinado con índices agrega su eje adelante
+            o = np.arange(self.shape[0])[o].reshape((-1,) + (1,) * np.ndim(t if not isinstance(t, slice) else 0))
+        if isinstance(t, slice):
+            t = np.arange(self.shape[1])[t]
+            o = np.asarray(o)[..., None]
+        origenes, pickups = self.origenes[o], self.pickups[t]
+        distancias = _haversine_radianes(origenes[..., 0], origenes[..., 1], pickups[..., 0], pickups[..., 1])
+        return np.asarray(distancias, dtype=np.float32)[()]
+
+def construir_matriz_distancias(tareas, drones, estaciones, bajo_demanda=False):
+    """
+    Construye la estructura de distancias del escenario.
+    tareas y drones pueden ser listas de dicts o las vistas de un Escenario (ver scenario.py);
+    con las vistas se usan directamente sus arrays. Con bajo_demanda=True, origen_pickup es un
+    OrigenPickupBajoDemanda en lugar de la matriz densa (el resto de las entradas son O(N)).
+
+    Los "orígenes" son todos los puntos desde donde un dron puede partir hacia un pickup
+    o una estación, indexados así:
+        [0, D)          -> base de cada dron
+        [D, D+N)        -> dropoff de cada tarea
+        [D+N, D+N+S)    -> cada estación de carga
+
+    Devuelve un dict con:
+        pickup_dropoff          (N,)          distancia L2 de cada tarea
+        origen_pickup           (D+N+S, N)    distancia de cada origen a cada pickup (float32: a 10k tareas
+                                              ocupa ~0.4 GB en lugar de ~0.8 GB; las energías se acumulan en float64)
+        estacion_cercana        (D+N+S,)      índice de la estación más cercana a cada origen
+        dist_estacion_cercana   (D+N+S,)      distancia a esa estación
+        indice_estaciones       IndiceEstaciones usado para calcularlas
+    """
+    num_drones, num_tareas, num_estaciones = len(drones), len(tareas), len(estaciones)
+
+    pickups, dropoffs, _, _ = arrays_tareas(tareas)
+    bases = arrays_bases(drones)
+    origenes = np.vstack([bases, dropoffs, np.asarray(estaciones, dtype=float).reshape(-1, 2)])
+    indice_estaciones = IndiceEstaciones(estaciones)
+    estacion_cercana, dist_estacion_cercana = indice_estaciones.mas_cercanas(origenes)
+
+    return {
+        "num_drones": num_drones,
+        "num_tareas": num_tareas,
+        "num_estaciones": num_estaciones,
+        "pickup_dropoff": distancias_metros_pares(pickups, dropoffs),
+        "origen_pickup": (OrigenPickupBajoDemanda(origenes, pickups) if bajo_demanda
+                          else distancias_metros_matriz(origenes, pickups, dtype=np.float32)),
+        "estacion_cercana": estacion_cercana,
+        "dist_estacion_cercana": dist_estacion_cercana,
+        "indice_estaciones": indice_estaciones,
+    }
+
+def indice_base(id_dron, distancias):
+    """Índice de origen de la base de un dron."""
+    return id_dron
+
+def indice_dropoff(id_tarea, distancias):
+    """Índice de origen del dropoff de una tarea."""
+    return distancias["num_drones"] + id_tarea
+
+def indice_estacion(idx_estacion, distancias):
+    """Índice de origen de una estación de carga."""
+    return distancias["num_drones"] + distancias["num_tareas"] + idx_estacion
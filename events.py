@@ -0,0 +1,77 @@
+# Registro de eventos de la simulación y del algoritmo genético (recargas, penalizaciones, inviables...).
+# Reemplaza los prints del camino caliente: cuando está deshabilitado no cuesta nada porque los
+# llamadores consultan events.HABILITADO antes de registrar; cuando está habilitado se acumulan
+# contadores que se cierran y guardan una vez por generación.
+# Cada corrida (ver corrida()) tiene sus propios contadores, historial y HABILITADO en una ContextVar,
+# así las corridas en hilos del mismo proceso no se mezclan; fuera de una corrida se usa un registro
+# global del proceso (workers, tests).
+import contextvars
+import logging
+from collections import Counter
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+def _nuevo_registro(habilitado):
+    return {"habilitado": bool(habilitado), "contadores": Counter(), "historial": []}
+
+_global = _nuevo_registro(False)
+_registro_corrida = contextvars.ContextVar("eventos_corrida", default=None)
+
+def _registro():
+    registro = _registro_corrida.get()
+    return _global if registro is None else registro
+
+def __getattr__(nombre):
+    # events.HABILITADO se resuelve en el registro de la corrida activa
+    if nombre == "HABILITADO":
+        return _registro()["habilitado"]
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+@contextmanager
+def corrida(habilitado=False):
+    """Registro de eventos propio (vacío) para el bloque; se usa junto con config.usar en cada corrida."""
+    token = _registro_corrida.set(_nuevo_registro(habilitado))
+    try:
+        yield
+    finally:
+        _registro_corrida.reset(token)
+
+def habilitar(activo=True):
+    """Activa o desactiva el registro de eventos (de la corrida activa)."""
+    _registro()["habilitado"] = bool(activo)
+
+def registrar(evento, cantidad=1):
+    """Suma `cantidad` al contador del evento en la generación actual."""
+    _registro()["contadores"][evento] += int(cantidad)
+
+def cerrar_generacion(generacion):
+    """Guarda los contadores acumulados como los de `generacion`, los reinicia y los devuelve."""
+    registro = _registro()
+    resumen = dict(registro["contadores"])
+    registro["historial"].append({"generacion": generacion, **resumen})
+    registro["contadores"].clear()
+    if resumen:
+        logger.info("Generación %d - eventos: %s", generacion, resumen)
+    return resumen
+
+def extraer():
+    """Devuelve los contadores acumulados y los reinicia sin guardarlos en el historial (usado en procesos worker)."""
+    contadores = _registro()["contadores"]
+    extraidos = dict(contadores)
+    contadores.clear()
+    return extraidos
+
+def sumar(contadores):
+    """Suma contadores extraídos en otro proceso a los de la generación actual."""
+    _registro()["contadores"].update(contadores)
+
+def historial():
+    """Lista de resúmenes por generación ({"generacion": g, evento: cantidad, ...})."""
+    return list(_registro()["historial"])
+
+def reiniciar():
+    """Borra contadores e historial (al comenzar una corrida nueva)."""
+    registro = _registro()
+    registro["contadores"].clear()
+    registro["historial"].clear()
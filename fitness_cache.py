@@ -0,0 +1,93 @@
+# Caches LRU de evaluaciones: evitan volver a simular individuos que ya se evaluaron
+# (padres copiados sin cruzar, individuos sin mutar, élite que sobrevive entre generaciones)
+# y rutas de drones que no cambiaron (una mutación o un cruce suele tocar sólo una o dos rutas).
+from collections import OrderedDict
+import numpy as np
+
+class CacheLRU:
+    """Cache acotado con política LRU y contadores de aciertos/fallos por generación."""
+
+    def __init__(self, capacidad):
+        self.capacidad = capacidad
+        self._datos = OrderedDict()
+        self._aciertos = 0
+        self._fallos = 0
+        self._historial = []
+
+    def obtener(self, clave):
+        """Devuelve el valor guardado para la clave, o None."""
+        valor = self._datos.get(clave)
+        if valor is None:
+            self._fallos += 1
+            return None
+        self._datos.move_to_end(clave)
+        self._aciertos += 1
+        return valor
+
+    def guardar(self, clave, valor):
+        """Guarda un valor, descartando el menos usado si se supera la capacidad."""
+        self._datos[clave] = valor
+        self._datos.move_to_end(clave)
+        while len(self._datos) > self.capacidad:
+            self._datos.popitem(last=False)
+
+    def cerrar_generacion(self, generacion):
+        """Guarda aciertos/fallos de la generación, reinicia los contadores y devuelve el resumen."""
+        consultas = self._aciertos + self._fallos
+        resumen = {
+            "generacion": generacion,
+            "aciertos": self._aciertos,
+            "fallos": self._fallos,
+            "tasa_aciertos": self._aciertos / consultas if consultas else 0.0,
+            "tamano": len(self._datos),
+        }
+        self._historial.append(resumen)
+        self._aciertos = 0
+        self._fallos = 0
+        return resumen
+
+    def historial(self):
+        """Resúmenes de aciertos/fallos por generación."""
+        return list(self._historial)
+
+    def __len__(self):
+        return len(self._datos)
+
+
+class CacheRutas(CacheLRU):
+    """
+    Asocia la ruta de un dron (id del dron + secuencia de tareas) al resultado de simularla:
+    (energia, bateria, tiempo, penalizada, excede_plazo, recargas de cada paso).
+    Cada ruta se simula de forma independiente (sale de su base con batería llena), así que el
+    resultado no depende del resto del individuo.
+    """
+
+    @staticmethod
+    def claves(rutas, fila_dron):
+        """Claves (bytes) de cada fila de la matriz de rutas (R, Lmax) rellenada con -1."""
+        largos = (rutas >= 0).sum(axis=1)
+        filas = np.ascontiguousarray(np.hstack([fila_dron[:, None], rutas]), dtype=np.int32)
+        return [fila[:largo + 1].tobytes() for fila, largo in zip(filas, largos)]
+
+
+class CacheFitness(CacheLRU):
+    """
+    Cache que asocia cada cromosoma [c_i, c_ii] a su energía y su plan de recargas.
+    Es válido para un único escenario (tareas, drones y estaciones): se crea uno por corrida.
+    Si se indica capacidad_rutas también guarda un CacheRutas para simular sólo las rutas nuevas
+    de los individuos que no estén en el cache.
+    """
+
+    def __init__(self, capacidad, capacidad_rutas=0):
+        super().__init__(capacidad)
+        self.rutas = CacheRutas(capacidad_rutas) if capacidad_rutas > 0 else None
+
+    @staticmethod
+    def claves(permutaciones, cortes):
+        """Claves (bytes) de cada fila de la matriz de permutaciones (P, N) y de cortes (P, K)."""
+        filas = np.ascontiguousarray(np.hstack([permutaciones, cortes]), dtype=np.int32)
+        return [fila.tobytes() for fila in filas]
+
+    def guardar(self, clave, energia, recargas):
+        """Guarda la evaluación (energía, recargas) de un cromosoma."""
+        super().guardar(clave, (energia, recargas))
@@ -1,13 +1,24 @@
 # Contiene los operadores genéticos: selección, cruce y mutación.
+import logging
 import random
+import numpy as np
 import config
+import events
+import timing
 import utils.crossover as crossover
 import utils.selection as selection
 import utils.mutation as mutation
+import utils.local_search as local_search
+import utils.construction as construction
+import utils.repair as repair
 import simulation as sim
+from individual import Individuo, como_individuo
+from distance_matrix import construir_matriz_distancias
+
+logger = logging.getLogger(__name__)
 
 def crear_individuo():
-    """Crea un individuo de doble cromosoma."""
+    """Crea un individuo de doble cromosoma (sin evaluar)."""
     c_i = list(range(config.NUM_TAREAS))
     random.shuffle(c_i)
     num_cortes = config.NUM_DRONES - 1
@@ -18,34 +29,58 @@ def crear_individuo():
     else:
         puntos_de_corte = []
     c_ii = puntos_de_corte
-    return [c_i, c_ii]
+    return Individuo(c_i, c_ii)
+
+def crear_poblacion_inicial(tareas=None, drones=None, estaciones=None, distancias=None):
+    """
+    Población inicial de TAMANO_POBLACION individuos aleatorios. Si se pasa el escenario y
+    FRACCION_SEMILLAS_HEURISTICAS > 0, esa fracción se construye con las heurísticas de
+    utils/construction.py (plazo, vecino más cercano y ahorros) y el resto es aleatorio.
+    """
+    cantidad_semillas = 0
+    if tareas is not None and config.FRACCION_SEMILLAS_HEURISTICAS > 0:
+        cantidad_semillas = round(config.FRACCION_SEMILLAS_HEURISTICAS * config.TAMANO_POBLACION)
+    if cantidad_semillas == 0:
+        return [crear_individuo() for _ in range(config.TAMANO_POBLACION)]
 
-def crear_poblacion_inicial():
-    return [crear_individuo() for _ in range(config.TAMANO_POBLACION)]
+    if distancias is None:
+        distancias = construir_matriz_distancias(tareas, drones, estaciones)
+    semillas = construction.sembrar(cantidad_semillas, tareas, drones, distancias)
+    if events.HABILITADO:
+        events.registrar("semillas_heuristicas", len(semillas))
+    return semillas + [crear_individuo() for _ in range(config.TAMANO_POBLACION - len(semillas))]
 
 
 def generar_poblacion_opuesta(P, num_tareas):
     """Genera la población opuesta POPP a partir de P usando Opposition-Based Learning."""
     POPP = []
-    for (c_i, c_ii) in P:
-        ci_opuesto = [(num_tareas - 1) - gene for gene in c_i]
-        opuesto = [ci_opuesto, c_ii] 
+    for individuo in P:
+        c_i, c_ii = como_individuo(individuo)
+        ci_opuesto = (num_tareas - 1) - c_i
+        opuesto = Individuo(ci_opuesto, c_ii.copy())
         POPP.append(opuesto)
     return POPP
 
 
 
-def procesar_generacion(poblacion_P, tareas, drones, estaciones):
+def procesar_generacion(poblacion_P, tareas, drones, estaciones, distancias=None, cache=None, paralelo=None):
     """
     Procesa una generación completa siguiendo la secuencia estándar:
     1. Crear población opuesta (POPP)
     2. Aplicar crossover y mutación a P y POPP
-    3. Evaluar fitness de P y POPP procesados
+    3. Evaluar fitness de P y POPP procesados (sólo los individuos que cambiaron)
     4. Crear población descendiente P' usando esos fitness
+    Devuelve P' ya evaluada: cada Individuo trae su energía y su plan de recargas.
+    `distancias` es la matriz del escenario (ver distance_matrix.py); si no se pasa se construye acá.
+    `cache` es un CacheFitness opcional (ver fitness_cache.py) para no re-simular individuos repetidos.
+    `paralelo` es un EvaluadorParalelo opcional (ver parallel_evaluation.py) para simular en varios procesos.
     """
+    if distancias is None:
+        distancias = construir_matriz_distancias(tareas, drones, estaciones)
     
     # Paso 1: Crear población opuesta
-    POPP = generar_poblacion_opuesta(poblacion_P, config.NUM_TAREAS)
+    with timing.fase("opuesta"):
+        POPP = generar_poblacion_opuesta(poblacion_P, config.NUM_TAREAS)
     
     # Paso 2: Aplicar crossover y mutación a P y POPP
     #print("Aplicando crossover y mutación a P...")
@@ -58,53 +93,151 @@ def procesar_generacion(poblacion_P, tareas, drones, estaciones):
     # Paso 3: Evaluar fitness de P y POPP procesados
     poblacion_total_procesada = P_procesada + POPP_procesada
     
-    energias_totales = []
-    for ind in poblacion_total_procesada:
-        #print("Individuo a evaluar:", ind)
-        energias_totales.append((sim.funcion_objetivo(ind, tareas, drones, estaciones))[0])
+    evaluar_pendientes(poblacion_total_procesada, tareas, drones, estaciones, distancias, cache, paralelo)
+    energias_totales = [individuo.energia for individuo in poblacion_total_procesada]
 
     # 2. Detectar índices inviables (energía = 0)
-    indices_inviables = [idx for idx, energia in enumerate(energias_totales) if energia == 0]
+    indices_inviables = {idx for idx, energia in enumerate(energias_totales) if energia == 0}
 
     # 3. Filtrar población y energías
     poblacion_total_filtrada = [
         ind for idx, ind in enumerate(poblacion_total_procesada) if idx not in indices_inviables
     ]
 
-    contador = 0
     parametros_inviables = False
-    while len(poblacion_total_filtrada) == 0 and contador < 10:
-        print("Advertencia: Todos los individuos son inviables. Regenerando población...")
-        poblacion_nueva = [crear_individuo() for _ in range(config.TAMANO_POBLACION)]
-        poblacion_nueva_procesada = aplicar_operadores_geneticos(poblacion_nueva)
-        poblacion_POPP_nueva = generar_poblacion_opuesta(poblacion_nueva, config.NUM_TAREAS)
-        poblacion_POPP_nueva_procesada = aplicar_operadores_geneticos(poblacion_POPP_nueva)
-        poblacion_total_nueva = poblacion_nueva_procesada + poblacion_POPP_nueva_procesada
-        energias_totales = [(sim.funcion_objetivo(ind, tareas, drones, estaciones))[0] for ind in poblacion_total_nueva]
-        indices_inviables = [idx for idx, energia in enumerate(energias_totales) if energia == 0]
+    if len(poblacion_total_filtrada) == 0:
+        logger.warning("Advertencia: Todos los individuos son inviables. Reparando población...")
+        with timing.fase("reparacion"):
+            poblacion_total_procesada = aplicar_reparacion(poblacion_total_procesada, tareas, drones, estaciones, distancias, cache, paralelo)
+        energias_totales = [individuo.energia for individuo in poblacion_total_procesada]
+        indices_inviables = {idx for idx, energia in enumerate(energias_totales) if energia == 0}
         poblacion_total_filtrada = [
-            ind for idx, ind in enumerate(poblacion_total_filtrada) if idx not in indices_inviables
+            ind for idx, ind in enumerate(poblacion_total_procesada) if idx not in indices_inviables
         ]
-        contador += 1
 
-    if contador == 10:
-        parametros_inviables = True
-        print("Se alcanzó el límite de regeneraciones. PARÁMETROS MUY RESTRICTIVOS. Intente agregando drones o quitando tareas")
+    if len(poblacion_total_filtrada) == 0:
+        logger.warning("La reparación no encontró individuos viables. PARÁMETROS MUY RESTRICTIVOS. Intente agregando drones o quitando tareas")
         #Si son pocos drones --> Aumentar bateria
         #Si la bateria es suficiente, pero son muchas tareas --> Aumentar tiempos de entrega
-    
+        return [], True
+
     energias_filtradas = [
         energia for idx, energia in enumerate(energias_totales) if idx not in indices_inviables
     ]
     #Hay que asegurarse que poblacion_total_filtrada tenga al menos TAMANO_POBLACION individuos
         
-    fitness_filtrados = obtener_fitnesses_local(energias_filtradas)
-
-    P_prima = crear_poblacion_descendiente_con_fitness(
-        poblacion_total_filtrada, fitness_filtrados
-    )
+    with timing.fase("supervivientes"):
+        fitness_filtrados = obtener_fitnesses_local(energias_filtradas)
+
+        P_prima = crear_poblacion_descendiente_con_fitness(
+            poblacion_total_filtrada, fitness_filtrados
+        )
+    if config.BUSQUEDA_LOCAL and P_prima:
+        with timing.fase("busqueda_local"):
+            P_prima = aplicar_busqueda_local(P_prima, tareas, drones, estaciones, distancias, cache, paralelo)
     
-    return P_prima, parametros_inviables #P_prima contiene todos individuos viables solamente. Pero podria pasar que contenga menos de TAMANO_POBLACION individuos.
+    return P_prima, parametros_inviables #P_prima contiene todos individuos viables (y evaluados) solamente. Pero podria pasar que contenga menos de TAMANO_POBLACION individuos.
+
+
+def evaluar_individuos(poblacion, tareas, drones, estaciones, distancias, cache=None, paralelo=None):
+    """
+    Evalúa la población completa con el simulador vectorizado.
+    Devuelve las energías (P,) en MJ y la matriz de recargas (P, N).
+    Si se pasa un cache sólo se simulan los cromosomas que no estén en él (y cada uno una sola vez);
+    si además tiene cache de rutas, de esos cromosomas sólo se simulan las rutas nuevas.
+    Si se pasa un EvaluadorParalelo la simulación se reparte entre sus procesos.
+    """
+    def simular(permutaciones, cortes):
+        cache_rutas = cache.rutas if cache is not None else None
+        if paralelo is not None:
+            return paralelo.evaluar(permutaciones, cortes, cache_rutas)
+        return sim.evaluar_poblacion(permutaciones, cortes, tareas, drones, estaciones, distancias, devolver_recargas=True,
+                                     cache_rutas=cache_rutas)
+
+    permutaciones, cortes = sim.poblacion_a_matrices(poblacion)
+    if cache is None:
+        return simular(permutaciones, cortes)
+
+    energias = np.zeros(len(poblacion))
+    recargas = np.full((len(poblacion), len(tareas)), -1, dtype=np.int64)
+    pendientes = {} # clave -> filas de la población con ese cromosoma
+    claves = cache.claves(permutaciones, cortes)
+    for fila, clave in enumerate(claves):
+        if clave in pendientes:
+            pendientes[clave].append(fila)
+            continue
+        guardado = cache.obtener(clave)
+        if guardado is None:
+            pendientes[clave] = [fila]
+        else:
+            energias[fila], recargas[fila] = guardado
+
+    if pendientes:
+        filas_a_simular = [filas[0] for filas in pendientes.values()]
+        energias_nuevas, recargas_nuevas = simular(permutaciones[filas_a_simular], cortes[filas_a_simular])
+        for i, (clave, filas) in enumerate(pendientes.items()):
+            cache.guardar(clave, energias_nuevas[i], recargas_nuevas[i])
+            energias[filas] = energias_nuevas[i]
+            recargas[filas] = recargas_nuevas[i]
+    return energias, recargas
+
+def evaluar_energias(poblacion, tareas, drones, estaciones, distancias, cache=None, paralelo=None):
+    """Evalúa la población completa y devuelve la lista de energías (MJ)."""
+    return evaluar_individuos(poblacion, tareas, drones, estaciones, distancias, cache, paralelo)[0].tolist()
+
+def evaluar_pendientes(poblacion, tareas, drones, estaciones, distancias, cache=None, paralelo=None):
+    """
+    Evalúa sólo los Individuo de la población que todavía no tienen energía y les asigna
+    energía y recargas. Los que pasaron sin cambios por cruce y mutación conservan su evaluación.
+    """
+    pendientes = [individuo for individuo in poblacion if not individuo.evaluado]
+    if pendientes:
+        with timing.fase("evaluacion"):
+            energias, recargas = evaluar_individuos(pendientes, tareas, drones, estaciones, distancias, cache, paralelo)
+            for individuo, energia, recargas_individuo in zip(pendientes, energias, recargas):
+                individuo.asignar_evaluacion(energia, recargas_individuo)
+        timing.contar("evaluaciones", len(pendientes))
+    return poblacion
+
+
+def aplicar_busqueda_local(poblacion, tareas, drones, estaciones, distancias, cache=None, paralelo=None):
+    """
+    Etapa memética: aplica la búsqueda local (utils/local_search.py) a los BUSQUEDA_LOCAL_ELITE
+    individuos de menor energía y reemplaza a los que mejoraron. Devuelve la población evaluada.
+    """
+    poblacion = list(poblacion)
+    orden = np.argsort([individuo.energia for individuo in poblacion], kind="stable")
+    vistos = set()
+    for i in orden[:config.BUSQUEDA_LOCAL_ELITE]:
+        clave = poblacion[i].clave()
+        if clave in vistos: # El mismo cromosoma repetido se mejora una sola vez
+            continue
+        vistos.add(clave)
+        poblacion[i] = local_search.mejorar_individuo(poblacion[i], tareas, drones, distancias)
+    return evaluar_pendientes(poblacion, tareas, drones, estaciones, distancias, cache, paralelo)
+
+
+def aplicar_reparacion(poblacion, tareas, drones, estaciones, distancias, cache=None, paralelo=None):
+    """
+    Repara (utils/repair.py) hasta REPARACION_INDIVIDUOS individuos inviables distintos de la población,
+    moviendo las tareas donde fallan sus rutas. Devuelve la población evaluada.
+    """
+    poblacion = list(poblacion)
+    vistos = set()
+    reparados = []
+    for i, individuo in enumerate(poblacion):
+        if len(vistos) == config.REPARACION_INDIVIDUOS:
+            break
+        clave = individuo.clave()
+        if individuo.viable or clave in vistos:
+            continue
+        vistos.add(clave)
+        poblacion[i] = repair.reparar_individuo(individuo, tareas, drones, distancias)
+        reparados.append(i)
+    evaluar_pendientes(poblacion, tareas, drones, estaciones, distancias, cache, paralelo)
+    if events.HABILITADO:
+        events.registrar("individuos_reparados", sum(poblacion[i].viable for i in reparados))
+    return poblacion
 
 
 def aplicar_operadores_geneticos(poblacion):
@@ -112,14 +245,18 @@ def aplicar_operadores_geneticos(poblacion):
     Aplica crossover y mutación a una población.
     """
     # Selección de padres para crossover
-    fitness_temp = [1.0 / len(poblacion)] * len(poblacion)  # Fitness uniforme temporal para selección
-    padres = seleccion(poblacion, fitness_temp)
+    with timing.fase("seleccion_padres"):
+        fitness_temp = [1.0 / len(poblacion)] * len(poblacion)  # Fitness uniforme temporal para selección
+        padres = seleccion(poblacion, fitness_temp)
     
     # Aplicar crossover
-    descendencia = cruce(padres)
+    with timing.fase("cruce"):
+        descendencia = cruce(padres)
     
     # Aplicar mutación
-    poblacion_procesada = [mutacion(ind) for ind in descendencia]
+    with timing.fase("mutacion"):
+        probabilidad = config.PROBABILIDAD_MUTACION # Se lee una vez por generación (ver config.usar)
+        poblacion_procesada = [mutacion(ind, probabilidad) for ind in descendencia]
     
     return poblacion_procesada
 
@@ -129,27 +266,40 @@ def crear_poblacion_descendiente_con_fitness(poblacion_filtrada, fitness_totales
     Crea la población descendiente P' usando los fitness ya calculados:
     1. Fusión: mitad de P, mitad de POPP --> Este es el elitismo. Se seleccionan los N_BEST de cada población
     PERO AHORA LA POBLACIÓN FILTRADA QUE LLEGA YA NO SABEMOS CUANTOS CONTIENE DE CADA POBLACIÓN, YO DIGO QUE TOMEMOS LOS N_BEST DE LA POBLACIÓN FILTRADA
-    3. Selección por ruleta del resto
+    3. Selección por ruleta (o SUS, ver config.MUESTREO_SUPERVIVIENTES) del resto, sin repetir cromosomas
     4. Mantenimiento del tamaño
+    Los sorteos se hacen en bloque con NumPy y los repetidos se detectan por la clave (bytes) de cada cromosoma.
     """
+    if not poblacion_filtrada:
+        return []
+    rng = selection.generador()
+    muestrear = selection.sus if config.MUESTREO_SUPERVIVIENTES == "sus" else selection.ruleta
 
     # 2. Inclusión de individuos élite de la población total
-    elite = selection.buscar_n_mejores(poblacion_filtrada, fitness_totales, config.N_BEST)
-    poblacion_descendiente = elite.copy()
+    elite = selection.indices_n_mejores(fitness_totales, config.N_BEST)
+    poblacion_descendiente = [poblacion_filtrada[i] for i in elite]
+    claves = [individuo.clave() for individuo in poblacion_filtrada]
+    vistos = {claves[i] for i in elite}
     # 3. Selección por ruleta para completar hasta TAMANO_POBLACION
     max_intentos = 10 * config.TAMANO_POBLACION
+    faltantes = config.TAMANO_POBLACION - len(poblacion_descendiente)
     intentos = 0
 
-    while len(poblacion_descendiente) < config.TAMANO_POBLACION and intentos < max_intentos:
-        individuo_ruleta = roulette_wheel_selection(poblacion_filtrada, fitness_totales)
-        if individuo_ruleta not in poblacion_descendiente:
-            poblacion_descendiente.append(individuo_ruleta)
-        else:
-            intentos += 1
-    
-    while len(poblacion_descendiente) < config.TAMANO_POBLACION: #Permitimos que los de elite se repitan
-            individuo_ruleta = roulette_wheel_selection(poblacion_filtrada, fitness_totales)
-            poblacion_descendiente.append(individuo_ruleta)
+    if faltantes > 0:
+        # Un sorteo por lugar libre más reservas (por ruleta) para reemplazar a los repetidos
+        candidatos = np.concatenate([muestrear(fitness_totales, faltantes, rng), selection.ruleta(fitness_totales, max_intentos, rng)])
+        for i in candidatos:
+            if len(poblacion_descendiente) >= config.TAMANO_POBLACION or intentos >= max_intentos:
+                break
+            if claves[i] not in vistos:
+                vistos.add(claves[i])
+                poblacion_descendiente.append(poblacion_filtrada[i])
+            else:
+                intentos += 1
+
+    faltantes = config.TAMANO_POBLACION - len(poblacion_descendiente)
+    if faltantes > 0: #Permitimos que los de elite se repitan
+        poblacion_descendiente.extend(poblacion_filtrada[i] for i in selection.ruleta(fitness_totales, faltantes, rng))
     
     return poblacion_descendiente[:config.TAMANO_POBLACION]
 
@@ -158,32 +308,10 @@ def roulette_wheel_selection(pop, fitnesses):
     """Selección por ruleta"""
     # Ahora los fitness ya están correctos: mayor fitness = mejor individuo
     
-    if not pop or not fitnesses:
+    # Para varios giros conviene selection.ruleta, que calcula la suma acumulada una sola vez
+    if not pop or len(fitnesses) == 0:
         return random.choice(pop) if pop else None
-    
-    total = sum(fitnesses)
-    if total == 0:
-        # Caso extremo: todos los individuos tienen fitness 0
-        return random.choice(pop)
-    
-    # Los fitness ya están normalizados, así que son directamente probabilidades
-    probs = fitnesses  # Ya normalizados en obtener_fitnesses_local
-    
-    # Crear probabilidades acumuladas
-    probs_acumuladas, acum = [], 0
-    for p in probs:
-        acum += p
-        probs_acumuladas.append(acum)
-
-    r = random.random()
-    seleccionado = pop[-1]  # Por defecto, seleccionar el último individuo
-    
-    for i in range(len(probs_acumuladas)):
-        if r <= probs_acumuladas[i]:
-            seleccionado = pop[i]
-            break
-    
-    return seleccionado
+    return pop[selection.ruleta(fitnesses, 1)[0]]
 
 
 
@@ -196,18 +324,18 @@ def obtener_fitnesses_local(funcion_objetivo_values):
     
     # Transformar energías a fitness usando inverso
     # Menor energía → Mayor fitness
-    fitness_values = [1.0 / (f + EPS) for f in funcion_objetivo_values]
+    fitness_values = 1.0 / (np.asarray(funcion_objetivo_values, dtype=float) + EPS)
     
     # Normalizar para que sumen 1
-    total = sum(fitness_values)
+    total = fitness_values.sum()
     if total > 0:
-        fitness_values = [f / total for f in fitness_values]
+        fitness_values = fitness_values / total
     else:
         # Caso extremo: todos fitness infinitos --> todas las energias penalizadas
-        fitness_values = [1.0 / len(funcion_objetivo_values)] * len(funcion_objetivo_values)
+        fitness_values = np.full(len(fitness_values), 1.0 / len(fitness_values))
     
     # Debugging
-    print("Sumatoria de fitness (debe dar 1):", sum(fitness_values))
+    logger.debug("Sumatoria de fitness (debe dar 1): %s", fitness_values.sum())
     #print(f"Energías: min={min(funcion_objetivo_values):.2f}, max={max(funcion_objetivo_values):.2f}")
     #print(f"Fitness: min={min(fitness_values):.6f}, max={max(fitness_values):.6f}")
     
@@ -225,53 +353,56 @@ def obtener_fitnesses_global(energias, energia_menor_global=None, energia_mayor_
 
 
 def seleccion(poblacion, fitness_scores):
-    """Selecciona padres usando selección por torneo """
-    if all(f == 0 for f in fitness_scores):
+    """Selecciona padres usando selección por torneo (todos los torneos de una vez, ver selection.torneos)"""
+    rng = selection.generador()
+    if not np.any(np.asarray(fitness_scores)):
         # Si todos los fitness son 0 --> Devuelve padres inviables al azar
-        return [random.choice(poblacion) for _ in range(config.TAMANO_POBLACION)]
-
-
-    padres = []
-    for _ in range(config.TAMANO_POBLACION):
-        padre = selection.tournament_selection(poblacion, fitness_scores, k=(config.TAMANO_POBLACION // 5))
-        padres.append(padre)
-    
+        return [poblacion[i] for i in rng.integers(0, len(poblacion), size=config.TAMANO_POBLACION)]
 
-    return padres
+    ganadores = selection.torneos(fitness_scores, config.TAMANO_POBLACION, config.TAMANO_POBLACION // 5, rng)
+    return [poblacion[i] for i in ganadores]
 
 
 def cruce(padres):
     """Genera descendencia a partir de los padres seleccionados."""
     descendencia = []
     if len(padres) < 2: return padres
+    operador_cruce = crossover.obtener_operador(config.OPERADOR_CRUCE)
+    probabilidad = config.PROBABILIDAD_CRUCE # Se lee una vez por generación (ver config.usar)
 
     for i in range(0, len(padres) - (len(padres) % 2), 2):
         padre1, padre2 = padres[i], padres[(i+1) % (len(padres))] #Se seleccionan los padres contiguos. En caso de que len(padres) sea impar, la operación módulo (% len(padres)) asegura que se toma el último padre junto con el primero del array (porque el módulo devuelve 0).
 
-        if random.random() < config.PROBABILIDAD_CRUCE:
-            c_i_hijo1, c_i_hijo2 = crossover.pmx(padre1[0], padre2[0])
+        if random.random() < probabilidad and len(padre1.c_i) > 1: # Con una tarea no hay nada que cruzar
+            c_i_hijo1, c_i_hijo2 = operador_cruce(padre1.c_i.tolist(), padre2.c_i.tolist())
             
-            corte_cruce = random.randint(0, len(padre1[1])) if len(padre1[1]) > 0 else 0
-            c_ii_hijo1 = sorted(padre1[1][:corte_cruce] + padre2[1][corte_cruce:])
-            c_ii_hijo2 = sorted(padre2[1][:corte_cruce] + padre1[1][corte_cruce:])
-            descendencia.append([c_i_hijo1, c_ii_hijo1])
-            descendencia.append([c_i_hijo2, c_ii_hijo2])
+            corte_cruce = random.randint(0, len(padre1.c_ii)) if len(padre1.c_ii) > 0 else 0
+            c_ii_hijo1 = np.sort(np.concatenate([padre1.c_ii[:corte_cruce], padre2.c_ii[corte_cruce:]]))
+            c_ii_hijo2 = np.sort(np.concatenate([padre2.c_ii[:corte_cruce], padre1.c_ii[corte_cruce:]]))
+            descendencia.append(Individuo(c_i_hijo1, c_ii_hijo1))
+            descendencia.append(Individuo(c_i_hijo2, c_ii_hijo2))
 
         else:
-            # --- No se cruzan, se copian los padres ---
+            # --- No se cruzan, pasan los padres (mutacion() los copia si los modifica) ---
             descendencia.append((padre1))
             descendencia.append((padre2))
     return descendencia
 
-def mutacion(individuo):
+def mutacion(individuo, probabilidad=None):
     """
     Orquesta la mutación para ambos cromosomas (orden y cortes)
-    con probabilidades independientes.
+    con probabilidades independientes (por defecto config.PROBABILIDAD_MUTACION).
+    Nunca modifica el individuo recibido (puede estar repetido en la población o ser un padre):
+    si muta devuelve un Individuo nuevo sin evaluar, si no devuelve el mismo con su evaluación.
     """
     c_i, c_ii = individuo
+    mutado = False
+    probabilidad = config.PROBABILIDAD_MUTACION if probabilidad is None else probabilidad
     
-    # 1. Mutar Cromosoma I (Orden de Tareas)
-    if random.random() < config.PROBABILIDAD_MUTACION:
+    # 1. Mutar Cromosoma I (Orden de Tareas); con una sola tarea no hay orden que cambiar
+    if random.random() < probabilidad and len(c_i) > 1:
+        c_i = c_i.copy()
+        mutado = True
         # Elige aleatoriamente entre swap o inversión para variar la estrategia
         #print("ocurre mutacion")
         if random.random() < 0.7: # 70% de probabilidad de hacer un swap simple
@@ -281,7 +412,9 @@ def mutacion(individuo):
             
     # 2. Mutar Cromosoma II (Asignación a Drones)
     # Se usa una probabilidad diferente para no alterar la asignación tan a menudo
-    if random.random() < config.PROBABILIDAD_MUTACION:
-        c_ii = mutation.cuts_mutation(c_ii, config.NUM_TAREAS)
+    # Sin cortes (un solo dron o una sola tarea) no hay asignación que mutar
+    if random.random() < probabilidad and len(c_ii) > 0:
+        c_ii = mutation.cuts_mutation(c_ii, len(c_i)) # c_i tiene las NUM_TAREAS tareas
+        mutado = True
         
-    return [c_i, c_ii]
+    return Individuo(c_i, c_ii) if mutado else individuo
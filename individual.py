@@ -0,0 +1,72 @@
+# Representación compacta de un individuo del algoritmo genético.
+# Guarda el doble cromosoma [c_i, c_ii] como arrays de enteros chicos y, una vez evaluado,
+# su energía y su plan de recargas, para que la evaluación viaje con el individuo y no se repita.
+import numpy as np
+
+def tipo_genes(num_tareas):
+    """Tipo entero más chico que alcanza para representar ids de tareas y puntos de corte."""
+    return np.int16 if num_tareas < np.iinfo(np.int16).max else np.int32
+
+class Individuo:
+    """
+    Individuo de doble cromosoma: c_i (orden de tareas) y c_ii (puntos de corte entre drones).
+    Se puede desempaquetar como la lista original (`c_i, c_ii = individuo`, `individuo[0]`).
+    energia es None mientras no fue evaluado (0 = inviable) y recargas es el array (N,) con la
+    estación de recarga previa a cada tarea (-1 si no recarga).
+    """
+    __slots__ = ("c_i", "c_ii", "energia", "recargas")
+
+    def __init__(self, c_i, c_ii, energia=None, recargas=None):
+        tipo = tipo_genes(len(c_i))
+        self.c_i = np.asarray(c_i, dtype=tipo)
+        self.c_ii = np.asarray(c_ii, dtype=tipo).reshape(-1)
+        self.energia = energia
+        self.recargas = recargas
+
+    @property
+    def evaluado(self):
+        return self.energia is not None
+
+    @property
+    def viable(self):
+        return self.energia is not None and self.energia > 0
+
+    def copiar(self):
+        """Copia independiente de los cromosomas (conserva la evaluación, que sigue siendo válida)."""
+        return Individuo(self.c_i.copy(), self.c_ii.copy(), self.energia, self.recargas)
+
+    def clave(self):
+        """Bytes que identifican al cromosoma (para detectar repetidos con un set o dict)."""
+        return self.c_i.tobytes() + self.c_ii.tobytes()
+
+    def asignar_evaluacion(self, energia, recargas):
+        self.energia = float(energia)
+        self.recargas = recargas
+
+    def __iter__(self):
+        yield self.c_i
+        yield self.c_ii
+
+    def __getitem__(self, indice):
+        return (self.c_i, self.c_ii)[indice]
+
+    def __len__(self):
+        return 2
+
+    def __eq__(self, otro):
+        if not isinstance(otro, Individuo):
+            return NotImplemented
+        # Comparar bytes es bastante más rápido que np.array_equal para arrays chicos (mismo dtype)
+        return self is otro or (self.c_i.tobytes() == otro.c_i.tobytes() and self.c_ii.tobytes() == otro.c_ii.tobytes())
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Individuo(c_i={self.c_i.tolist()}, c_ii={self.c_ii.tolist()}, energia={self.energia})"
+
+def como_individuo(individuo):
+    """Convierte un individuo en formato lista [c_i, c_ii] a Individuo (si ya lo es, lo devuelve igual)."""
+    if isinstance(individuo, Individuo):
+        return individuo
+    c_i, c_ii = individuo
+    return Individuo(c_i, c_ii)
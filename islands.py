@@ -0,0 +1,154 @@
+# Modelo de islas: varias poblaciones evolucionan en procesos separados con el mismo
+# procesar_generacion y cada INTERVALO_MIGRACION generaciones intercambian sus mejores individuos.
+import logging
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+import config
+import genetic_algorithm as ga
+from distance_matrix import construir_matriz_distancias
+from fitness_cache import CacheFitness
+from parallel_evaluation import parametros_config
+from scenario import como_escenario
+
+logger = logging.getLogger(__name__)
+
+_escenario_isla = None
+
+def _inicializar_isla(tareas, drones, estaciones, distancias, parametros):
+    """
+    Se ejecuta una vez por proceso: guarda la configuración del padre (se activa con config.usar en
+    cada época), las distancias que armó el padre y un cache local.
+    """
+    global _escenario_isla
+    configuracion = config.Configuracion(parametros)
+    cache = CacheFitness(configuracion.TAMANO_CACHE_FITNESS, configuracion.TAMANO_CACHE_RUTAS) if configuracion.TAMANO_CACHE_FITNESS > 0 else None
+    _escenario_isla = (tareas, drones, estaciones, distancias, cache, configuracion)
+
+def _evolucionar_isla(semilla, poblacion, num_generaciones, limite=None):
+    """
+    Corre hasta num_generaciones de procesar_generacion sobre la población de una isla, sin empezar
+    ninguna después de `limite` (instante de time.monotonic(), ver CriterioParada.limite).
+    Devuelve (poblacion, energias, inviable, generaciones corridas). Si la isla queda sin individuos
+    viables se devuelve la última población válida marcada como inviable.
+    """
+    tareas, drones, estaciones, distancias, cache, configuracion = _escenario_isla
+    with config.usar(configuracion):
+        random.seed(semilla)
+        inviable = False
+        generaciones = 0
+        for _ in range(num_generaciones):
+            if limite is not None and time.monotonic() >= limite:
+                break
+            nueva, inviable = ga.procesar_generacion(poblacion, tareas, drones, estaciones, distancias, cache)
+            if inviable:
+                break
+            poblacion = nueva
+            generaciones += 1
+        ga.evaluar_pendientes(poblacion, tareas, drones, estaciones, distancias, cache) # Sólo la población inicial llega sin evaluar
+    return poblacion, [individuo.energia for individuo in poblacion], inviable, generaciones
+
+def destinos_migracion(num_islas, topologia):
+    """Dict isla -> islas que reciben sus migrantes. Topologías: "anillo" o "todos"."""
+    if topologia == "anillo":
+        return {i: [(i + 1) % num_islas] for i in range(num_islas)}
+    if topologia == "todos":
+        return {i: [j for j in range(num_islas) if j != i] for i in range(num_islas)}
+    raise ValueError(f"Topología de migración desconocida: {topologia}")
+
+def migrar(poblaciones, energias, topologia, num_migrantes):
+    """
+    Copia los num_migrantes mejores individuos (menor energía viable) de cada isla a sus destinos,
+    reemplazando a los peores de cada destino. Modifica poblaciones y energias en el lugar.
+    """
+    def energia_orden(e):
+        return e if e > 0 else float("inf") # Energía 0 = inviable --> peor que cualquier viable
+
+    migrantes = {}
+    for i, energias_isla in enumerate(energias):
+        orden = sorted(range(len(energias_isla)), key=lambda k: energia_orden(energias_isla[k]))
+        migrantes[i] = [(poblaciones[i][k], energias_isla[k]) for k in orden[:num_migrantes]]
+
+    for origen, destinos in destinos_migracion(len(poblaciones), topologia).items():
+        for destino in destinos:
+            orden = sorted(range(len(energias[destino])), key=lambda k: energia_orden(energias[destino][k]), reverse=True)
+            for k, (individuo, energia) in zip(orden, migrantes[origen]):
+                poblaciones[destino][k] = individuo.copiar()
+                energias[destino][k] = energia
+
+def ejecutar_islas(tareas, drones, estaciones, distancias=None, num_islas=None, num_generaciones=None, intervalo=None,
+                   num_migrantes=None, topologia=None, semilla=None, criterio=None):
+    """
+    Evoluciona num_islas poblaciones en paralelo, migrando cada `intervalo` generaciones.
+    Devuelve un dict con el mejor individuo, su energía, la época/generación en que apareció,
+    el historial de la mejor energía por época y si todas las islas quedaron inviables.
+    criterio es un CriterioParada opcional (ver stopping.py) que se consulta al final de cada época;
+    su presupuesto de tiempo también corta las generaciones de cada isla dentro de la época.
+    distancias es la estructura de construir_matriz_distancias si ya se calculó (se arma si es None).
+    """
+    num_islas = num_islas or config.NUM_ISLAS
+    num_generaciones = num_generaciones or config.NUM_GENERACIONES
+    intervalo = intervalo or config.INTERVALO_MIGRACION
+    num_migrantes = num_migrantes if num_migrantes is not None else config.NUM_MIGRANTES
+    topologia = topologia or config.TOPOLOGIA_MIGRACION
+    generador = random.Random(semilla)
+    tareas, drones = como_escenario(tareas, drones, estaciones)
+
+    if distancias is None:
+        distancias = construir_matriz_distancias(tareas, drones, estaciones)
+    poblaciones = [ga.crear_poblacion_inicial(tareas, drones, estaciones, distancias) for _ in range(num_islas)]
+    activas = [True] * num_islas # Una isla que se queda sin descendencia viable deja de evolucionar
+    energias = [[0.0] * len(poblacion) for poblacion in poblaciones]
+    mejor = {"individuo": None, "energia": float("inf"), "generacion": 0}
+    historial = []
+
+    with ProcessPoolExecutor(max_workers=min(num_islas, config.NUM_PROCESOS or num_islas),
+                             initializer=_inicializar_isla,
+                             initargs=(tareas, drones, estaciones, distancias, parametros_config())) as pool:
+        limite = None
+        if criterio is not None:
+            criterio.comenzar_generaciones()
+            limite = criterio.limite()
+        generacion = 0
+        for epoca in range(math.ceil(num_generaciones / intervalo)):
+            if criterio is not None and criterio.agotado():
+                logger.info("Generación %d: se detiene por tiempo", generacion)
+                break
+            generaciones = min(intervalo, num_generaciones - epoca * intervalo)
+            futuros = {
+                i: pool.submit(_evolucionar_isla, generador.randrange(2**32), poblaciones[i], generaciones, limite)
+                for i in range(num_islas) if activas[i]
+            }
+            generaciones = 0 # Las que corrieron: con el presupuesto vencido una isla puede cortar antes
+            for i, futuro in futuros.items():
+                poblaciones[i], energias[i], inviable, generaciones_isla = futuro.result()
+                activas[i] = not inviable
+                generaciones = max(generaciones, generaciones_isla)
+            if not any(activas):
+                logger.warning("Todas las islas quedaron sin individuos viables.")
+                break
+
+            generacion += generaciones
+            for i in range(num_islas):
+                for individuo, energia in zip(poblaciones[i], energias[i]):
+                    if 0 < energia <= mejor["energia"]:
+                        mejor = {"individuo": individuo, "energia": energia, "generacion": generacion}
+            historial.append(mejor["energia"])
+            logger.info("Generación %d (época %d): mejor energía entre islas = %.2e", generacion, epoca + 1, mejor["energia"])
+            if criterio is not None and generaciones > 0:
+                criterio.registrar(mejor["energia"], generaciones)
+            if criterio is not None and (criterio.motivo is not None or criterio.agotado()):
+                logger.info("Generación %d: se detiene por %s", generacion, criterio.motivo)
+                break
+
+            if num_migrantes > 0 and num_islas > 1:
+                migrar(poblaciones, energias, topologia, num_migrantes)
+
+    return {
+        "mejor_individuo": mejor["individuo"],
+        "mejor_energia": mejor["energia"] if mejor["individuo"] is not None else None,
+        "mejor_generacion": mejor["generacion"],
+        "historial_mejor_energia": historial,
+        "parametros_inviables": not any(activas),
+    }
@@ -1,37 +1,67 @@
+import logging
 import random
 import config
+import events
+import timing
 import problem_setup as ps
 import genetic_algorithm as ga
 import simulation as sim
-import visualization as vis
+from distance_matrix import construir_matriz_distancias
+from fitness_cache import CacheFitness
+from parallel_evaluation import EvaluadorParalelo
+import islands
+import decomposition
+from stopping import CriterioParada
+from station_loader import cargar_estaciones
+import sweep
 import numpy as np
-from plotting import plot_fitness_evolution, plot_energia_evolution
-import pandas as pd
 import os
+from contextlib import nullcontext
+# plotting (matplotlib), visualization (folium) y pandas se importan sólo donde se usan:
+# las corridas sin salidas y los procesos del barrido no pagan esos imports.
+
+logger = logging.getLogger(__name__)
 
 energias_corridas = []
 tiempos_medio_entrega_corridas = []
 parametros_inviables_corridas = []
 
-def run_optimization(params=None, verbose=True):
+def run_optimization(params=None, verbose=True, generar_salidas=True, sufijo_salidas=""):
     """
     Corre una optimización con parámetros específicos (si params != None).
+    Los parámetros se aplican sobre una Configuracion propia de la corrida (ver config.usar), sin
+    modificar el módulo config: varias corridas pueden ejecutarse en hilos del mismo proceso.
+    Si generar_salidas es False no se guardan gráficos, mapa ni tiempos; sufijo_salidas se agrega al
+    nombre de esos archivos para que corridas concurrentes no se pisen (ver sweep.py).
     Devuelve un dict con KPIs de la corrida.
     """
-    if params:
-        # Override dinámico de parámetros
+    if params and verbose:
         for key, value in params.items():
-            setattr(config, key, value)
-            if verbose:
-                print(f"[CONFIG] {key} = {value}")
+            logger.info("[CONFIG] %s = %s", key, value)
+    # Eventos y tiempos también son de la corrida (ver events.corrida y timing.corrida)
+    with config.usar(**(params or {})), events.corrida(config.REGISTRAR_EVENTOS), timing.corrida(config.REGISTRAR_TIEMPOS):
+        return _correr_optimizacion(params, generar_salidas, sufijo_salidas)
+
+def _correr_optimizacion(params, generar_salidas, sufijo_salidas=""):
+    """Cuerpo de run_optimization, ya dentro de la Configuracion de la corrida."""
+    criterio = CriterioParada() # El presupuesto de tiempo cuenta desde acá
     
     # 1. Generar los datos del problema
-    tareas = ps.generar_tareas(config.NUM_TAREAS, config.POLIGONO_ROSARIO)
-    drones = ps.generar_drones(config.NUM_DRONES, config.POLIGONO_ROSARIO)
-    estaciones = config.ESTACIONES_DE_CARGA[:config.NUM_ESTACIONES]  # Usar las estaciones predefinidas en config.py
+    if config.ESTACIONES_DE_CARGA is not None:
+        estaciones = config.ESTACIONES_DE_CARGA[:config.NUM_ESTACIONES]  # Usar las estaciones predefinidas en config.py
+    else:
+        estaciones = cargar_estaciones(config.POLIGONO_ROSARIO)[:config.NUM_ESTACIONES].tolist() # Desde cache/ (ver station_loader.py)
+    escenario = ps.generar_escenario(config.NUM_TAREAS, config.NUM_DRONES, config.POLIGONO_ROSARIO, estaciones)
+    tareas, drones = escenario.tareas, escenario.drones # Vistas con forma de lista de dicts sobre los arrays del escenario
+    if config.NUM_GRUPOS > 1 and config.NUM_ISLAS <= 1: # Cada grupo arma sus distancias: no se calcula la matriz completa
+        return run_optimization_grupos(params, tareas, drones, estaciones, generar_salidas, criterio, sufijo_salidas)
+    distancias = construir_matriz_distancias(tareas, drones, estaciones) # Se calcula una sola vez por corrida
+    if config.NUM_ISLAS > 1:
+        return run_optimization_islas(params, tareas, drones, estaciones, distancias, generar_salidas, criterio, sufijo_salidas)
+    cache = CacheFitness(config.TAMANO_CACHE_FITNESS, config.TAMANO_CACHE_RUTAS) if config.TAMANO_CACHE_FITNESS > 0 else None # Válido sólo para este escenario
 
     # 2. Iniciar el algoritmo genético
-    poblacion = ga.crear_poblacion_inicial() #Contiene: [[ci,cii], [ci,cii], ...]
+    poblacion = ga.crear_poblacion_inicial(tareas, drones, estaciones, distancias) #Contiene Individuo (ver individual.py) con c_i, c_ii y su evaluación
     mejor_individuo_global = None
     mejor_generacion = 0  # Rastrear la mejor generación
     
@@ -39,7 +69,7 @@ def run_optimization(params=None, verbose=True):
     energia_menor_global = 0 #El limite mínimo de un individuo viable es > 0
     energia_mayor_global = 50e6 # El limite máximo es arbitrario. Se supone que en MJ no consumiran mas de 5MJ
     mejor_energia_global = float('inf') #Para almacenar la mejor energia global de los individuos
-    tareas_con_estaciones_carga_mejor = None #Las tareas del mejor individuo que incluyen las recargas previas
+    recargas_mejor = None #Estación de recarga previa a cada tarea del mejor individuo (-1 si no recarga)
 
     # Listas para guardar el historial del fitness
     max_fitness_history = []
@@ -52,84 +82,125 @@ def run_optimization(params=None, verbose=True):
 
     nmax = config.NUM_GENERACIONES
 
-    print("--- Iniciando Optimización ---")
-    for gen in range(nmax):
-        # Procesar generación completa: POPP → crossover/mutación → fitness → P'
-        poblacion, parametros_inviables = ga.procesar_generacion(poblacion, tareas, drones, estaciones)
-        #Acá los individuos que llegan son todos viables
-        #Acá las funciones fitness implementadas deben ser locales --> Los individuos compiten por ser seleccionados ante sus propios compañeros, no ante los globales.
-        if parametros_inviables is True:
-            break  # Si hay parámetros inviables, salir de la corrida
-        # Calcular energías y fitness de la nueva población para estadísticas
-        #energias es un array de floats, pero tareas_con_estaciones_carga tiene que llegar como un único array de diccionarios, no varios arrays
-        resultados = [sim.funcion_objetivo(ind, tareas, drones, estaciones) for ind in poblacion]
-        energias = [energia for energia, _ in resultados]
-        tareas_con_estaciones_carga = [tareas_mod for _, tareas_mod in resultados] #Array de arrays con diccionarios. Son Las tareas de cada individuo de la generación
+    logger.info("--- Iniciando Optimización ---")
+    paralelo = EvaluadorParalelo(tareas, drones, estaciones, distancias) if config.EVALUACION_PARALELA else None
+    criterio.comenzar_generaciones()
+    try:
+        for gen in range(nmax):
+            if criterio.agotado(): # También antes de la primera: armar el escenario pudo consumir el presupuesto
+                logger.info("Generación %d: se detiene por tiempo (%.1f s)", gen + 1, criterio.transcurrido())
+                break
+            # Procesar generación completa: POPP → crossover/mutación → fitness → P'
+            # La generación que indique PERFILAR_GENERACION se corre bajo cProfile; "otros" es lo que
+            # procesar_generacion hace fuera de sus fases medidas (ver timing.py)
+            perfil = timing.perfilar(config.ARCHIVO_PERFIL) if gen + 1 == config.PERFILAR_GENERACION else nullcontext()
+            with perfil, timing.fase("otros"):
+                poblacion, parametros_inviables = ga.procesar_generacion(poblacion, tareas, drones, estaciones, distancias, cache, paralelo)
+            #Acá los individuos que llegan son todos viables
+            #Acá las funciones fitness implementadas deben ser locales --> Los individuos compiten por ser seleccionados ante sus propios compañeros, no ante los globales.
+            if parametros_inviables is True:
+                break  # Si hay parámetros inviables, salir de la corrida
+            with timing.fase("estadisticas"):
+                # Energías y fitness de la nueva población para estadísticas
+                #procesar_generacion devuelve los individuos ya evaluados: cada uno trae su energía y sus recargas (índices de estación por tarea)
+                energias = [individuo.energia for individuo in poblacion]
         
-        print(f"Energías de la población: {[f'{e:.2e}' for e in energias[:5]]} ...")
-        #Las energias se suponen que son viables
-        if any(e <= 0 for e in energias):
-            print("Error: Se encontró una energía no positiva en la población que se pasará a la siguiente iteración (IMPOSIBLE)")
-            break
+                logger.debug("Energías de la población: %s ...", [f'{e:.2e}' for e in energias[:5]])
+                #Las energias se suponen que son viables
+                if any(e <= 0 for e in energias):
+                    logger.error("Error: Se encontró una energía no positiva en la población que se pasará a la siguiente iteración (IMPOSIBLE)")
+                    break
         
-        fitness_globales = ga.obtener_fitnesses_global(energias, energia_menor_global, energia_mayor_global)
+                fitness_globales = ga.obtener_fitnesses_global(energias, energia_menor_global, energia_mayor_global)
 
-        print(f"Fitnesses normalizados: {[f'{f:.6e}' for f in fitness_globales[:5]]}")
-        if all(f == 0 for f in fitness_globales):
-            print("Todos los individuos tuvieron consumo de energia = 0 (IMPOSIBLE)")
+                logger.debug("Fitnesses normalizados: %s", [f'{f:.6e}' for f in fitness_globales[:5]])
+                if all(f == 0 for f in fitness_globales):
+                    logger.error("Todos los individuos tuvieron consumo de energia = 0 (IMPOSIBLE)")
            
 
-        # Guardar datos para el gráfico
-        max_fitness_history.append(np.max(fitness_globales))
-        print(f"Generación {gen+1}: Max Fitness = {max_fitness_history[-1]:.6e}")
-        avg_fitness_history.append(np.mean(fitness_globales))
-        min_fitness_history.append(np.min(fitness_globales))
-
-        max_energias_history.append(np.max(energias))
-        avg_energias_history.append(np.mean(energias))
-        min_energias_history.append(np.min(energias))
-        print(f"Generación {gen+1}: Min Energía = {min_energias_history[-1]:.2e}")
-
-        # Encontrar y guardar la mejor solución (menor energía)
-        idx_mejor = energias.index(min(energias))  # El mejor es el de MENOR energía
-        energia_mejor = energias[idx_mejor]
-        #print("Mejor energía generación:", energia_mejor)
-
-        if energia_mejor <= mejor_energia_global:  
-            mejor_energia_global = energia_mejor
-            mejor_individuo_global = poblacion[idx_mejor]
-            #Reemplazar las tareas globales por las locales del mejor individuo
-            mejor_generacion = gen + 1 
-            tareas_con_estaciones_carga_mejor = tareas_con_estaciones_carga[idx_mejor]
-
-    print("\n--- Optimización Finalizada ---")
+                # Guardar datos para el gráfico
+                max_fitness_history.append(np.max(fitness_globales))
+                logger.info("Generación %d: Max Fitness = %.6e", gen + 1, max_fitness_history[-1])
+                avg_fitness_history.append(np.mean(fitness_globales))
+                min_fitness_history.append(np.min(fitness_globales))
+
+                max_energias_history.append(np.max(energias))
+                avg_energias_history.append(np.mean(energias))
+                min_energias_history.append(np.min(energias))
+                logger.info("Generación %d: Min Energía = %.2e", gen + 1, min_energias_history[-1])
+
+                # Encontrar y guardar la mejor solución (menor energía)
+                idx_mejor = energias.index(min(energias))  # El mejor es el de MENOR energía
+                energia_mejor = energias[idx_mejor]
+                #print("Mejor energía generación:", energia_mejor)
+
+                if energia_mejor <= mejor_energia_global:  
+                    mejor_energia_global = energia_mejor
+                    mejor_individuo_global = poblacion[idx_mejor]
+                    #Reemplazar las tareas globales por las locales del mejor individuo
+                    mejor_generacion = gen + 1 
+                    recargas_mejor = poblacion[idx_mejor].recargas
+
+            if events.HABILITADO:
+                events.cerrar_generacion(gen + 1)
+            if timing.HABILITADO:
+                resumen_tiempos = timing.cerrar_generacion(gen + 1)
+                logger.debug("Generación %d: tiempos %s", gen + 1, resumen_tiempos)
+            if cache is not None:
+                resumen_cache = cache.cerrar_generacion(gen + 1)
+                logger.info("Generación %d: cache de fitness %d aciertos / %d fallos (%.0f%%)", gen + 1,
+                            resumen_cache["aciertos"], resumen_cache["fallos"], 100 * resumen_cache["tasa_aciertos"])
+                if cache.rutas is not None:
+                    resumen_rutas = cache.rutas.cerrar_generacion(gen + 1)
+                    logger.info("Generación %d: cache de rutas %d aciertos / %d fallos (%.0f%%)", gen + 1,
+                                resumen_rutas["aciertos"], resumen_rutas["fallos"], 100 * resumen_rutas["tasa_aciertos"])
+
+            # Parada por convergencia (EPSILON/NCONV) o por presupuesto de tiempo
+            if criterio.registrar(mejor_energia_global) is not None:
+                logger.info("Generación %d: se detiene por %s (%d generaciones sin mejora, %.1f s)", gen + 1,
+                            criterio.motivo, criterio.generaciones_sin_mejora, criterio.transcurrido())
+                break
+    finally:
+        if paralelo is not None:
+            paralelo.cerrar()
+
+    logger.info("--- Optimización Finalizada ---")
+
+    # Tiempos por fase y evaluaciones de cada generación
+    if generar_salidas and timing.historial():
+        timing.exportar_csv(os.path.join("resultados", f"tiempos_generaciones{sufijo_salidas}.csv"))
+        timing.exportar_json(os.path.join("resultados", f"tiempos_generaciones{sufijo_salidas}.json"))
     
     # Generar y guardar los gráficos de evolución para distintas métricas
-    if max_fitness_history:
-        plot_fitness_evolution(
-            max_fitness_history,
-            avg_fitness_history,
-            min_fitness_history,
-            len(max_fitness_history),
-            mejor_generacion
-        )
-    if max_energias_history:
-        plot_energia_evolution(
-            max_energias_history,
-            avg_energias_history,
-            min_energias_history,
-            len(min_energias_history),
-            mejor_generacion
-        )
+    if generar_salidas:
+        from plotting import plot_fitness_evolution, plot_energia_evolution
+        if max_fitness_history:
+            plot_fitness_evolution(
+                max_fitness_history,
+                avg_fitness_history,
+                min_fitness_history,
+                len(max_fitness_history),
+                mejor_generacion,
+                filename=f"evolucion_fitness{sufijo_salidas}.png"
+            )
+        if max_energias_history:
+            plot_energia_evolution(
+                max_energias_history,
+                avg_energias_history,
+                min_energias_history,
+                len(min_energias_history),
+                mejor_generacion,
+                filename=f"evolucion_energia{sufijo_salidas}.png"
+            )
 
     # 3. Mostrar resultados
-    if mejor_individuo_global:
-        print(f"🏆 Mejor solución encontrada en la Generación {mejor_generacion}")
-        print(f"   Energía: {mejor_energia_global:.2e} J")
-        print(f"   Cromosoma: {mejor_individuo_global}")
-        print(f"Tareas: {tareas}")
-        print(f"Drones: {drones}")
-        print(f"Estaciones: {estaciones}")
+    if mejor_individuo_global is not None:
+        logger.info("🏆 Mejor solución encontrada en la Generación %d", mejor_generacion)
+        logger.info("   Energía: %.2e J", mejor_energia_global)
+        logger.info("   Cromosoma: %s", mejor_individuo_global)
+        logger.debug("Tareas: %s", tareas)
+        logger.debug("Drones: %s", drones)
+        logger.debug("Estaciones: %s", estaciones)
 
         # # Decodificar rutas de la mejor solución
         # #rutas_mejor = sim.decodificar_cromosoma(mejor_individuo_global, drones)
@@ -155,77 +226,148 @@ def run_optimization(params=None, verbose=True):
 
         # #     print(f"\n  *** Dron {id_dron} termina en {posicion_actual} ***")
 
-        # Visualización en el mapa
-        vis.visualizar_rutas(mejor_individuo_global, tareas_con_estaciones_carga_mejor, drones, config.POLIGONO_ROSARIO, estaciones, config)
+        # Visualización en el mapa (sólo acá se arman las tareas con sus recargas previas)
+        if generar_salidas:
+            import visualization as vis
+            tareas_con_estaciones_carga_mejor = sim.materializar_tareas_con_recargas(tareas, recargas_mejor, estaciones)
+            vis.visualizar_rutas(mejor_individuo_global, tareas_con_estaciones_carga_mejor, drones, config.POLIGONO_ROSARIO, estaciones, config,
+                             filename=f"rutas_drones_final{sufijo_salidas}.html")
 
         # 3. Retornar KPIs
-        return {
-            "params": params.copy() if params else {},
-            "mejor_energia": (mejor_energia_global), #En MegaJoules
-            "tiempo_medio_entrega": sim.calcular_tiempo_medio_entrega(mejor_individuo_global, tareas, drones, estaciones),
-            "parametros_inviables": parametros_inviables,
-        }
+        return _kpis(params, criterio, cache,
+                     mejor_energia=mejor_energia_global, #En MegaJoules
+                     tiempo_medio_entrega=sim.calcular_tiempo_medio_entrega(mejor_individuo_global, tareas, drones, estaciones, distancias),
+                     parametros_inviables=parametros_inviables)
     else:
-        print("❌ No se encontró una solución válida.")
-        return {
-            "params": params.copy() if params else {},
-            "mejor_energia": None,
-            "tiempo_medio_entrega": None,
-            "parametros_inviables": parametros_inviables,
-        }
+        logger.warning("❌ No se encontró una solución válida.")
+        return _kpis(params, criterio, cache, parametros_inviables=parametros_inviables)
+
+def _kpis(params, criterio, cache=None, **kpis):
+    """
+    KPIs de una corrida con las mismas claves en todas las variantes (una población, islas y grupos,
+    viables o no). kpis completa o reemplaza los valores por defecto (sin solución).
+    """
+    return {
+        "params": params.copy() if params else {},
+        "mejor_energia": None,
+        "tiempo_medio_entrega": None,
+        "parametros_inviables": True,
+        "eventos": events.historial(),
+        "tiempos": timing.historial(),
+        "cache_fitness": cache.historial() if cache is not None else [],
+        "cache_rutas": cache.rutas.historial() if cache is not None and cache.rutas is not None else [],
+        "generaciones": criterio.generaciones,
+        "motivo_parada": criterio.motivo or "generaciones",
+        "duracion_s": criterio.transcurrido(),
+        **kpis,
+    }
+
+
+def run_optimization_islas(params, tareas, drones, estaciones, distancias, generar_salidas=True, criterio=None, sufijo_salidas=""):
+    """
+    Variante de run_optimization con el modelo de islas (config.NUM_ISLAS > 1):
+    las poblaciones evolucionan en procesos separados y migran cada INTERVALO_MIGRACION generaciones.
+    """
+    logger.info("--- Iniciando Optimización con %d islas (%s) ---", config.NUM_ISLAS, config.TOPOLOGIA_MIGRACION)
+    criterio = criterio or CriterioParada()
+    resultado = islands.ejecutar_islas(tareas, drones, estaciones, distancias, criterio=criterio)
+    logger.info("--- Optimización Finalizada ---")
+
+    mejor_individuo_global = resultado["mejor_individuo"]
+    if mejor_individuo_global is None:
+        logger.warning("❌ No se encontró una solución válida.")
+        return _kpis(params, criterio, parametros_inviables=resultado["parametros_inviables"])
+
+    logger.info("🏆 Mejor solución encontrada en la Generación %d", resultado["mejor_generacion"])
+    logger.info("   Energía: %.2e J", resultado["mejor_energia"])
+    logger.info("   Cromosoma: %s", mejor_individuo_global)
+
+    if generar_salidas:
+        import visualization as vis
+        tareas_con_estaciones_carga_mejor = sim.materializar_tareas_con_recargas(tareas, mejor_individuo_global.recargas, estaciones)
+        vis.visualizar_rutas(mejor_individuo_global, tareas_con_estaciones_carga_mejor, drones, config.POLIGONO_ROSARIO, estaciones, config,
+                             filename=f"rutas_drones_final{sufijo_salidas}.html")
+
+    return _kpis(params, criterio,
+                 mejor_energia=resultado["mejor_energia"], #En MegaJoules
+                 tiempo_medio_entrega=sim.calcular_tiempo_medio_entrega(mejor_individuo_global, tareas, drones, estaciones, distancias),
+                 parametros_inviables=resultado["parametros_inviables"])
+
+def run_optimization_grupos(params, tareas, drones, estaciones, generar_salidas=True, criterio=None, sufijo_salidas=""):
+    """
+    Variante de run_optimization con descomposición por grupos (config.NUM_GRUPOS > 1): las tareas se
+    agrupan con k-means, cada grupo se resuelve con su propio algoritmo genético en paralelo y las
+    soluciones se unen y se reparan sobre el escenario completo (ver decomposition.py).
+    """
+    logger.info("--- Iniciando Optimización por %d grupos ---", config.NUM_GRUPOS)
+    criterio = criterio or CriterioParada()
+    restante = None if criterio.tiempo_maximo is None else max(0.0, criterio.tiempo_maximo - criterio.transcurrido())
+    resultado = decomposition.resolver_por_grupos(tareas, drones, estaciones, semilla=random.getrandbits(32),
+                                                  tiempo_maximo=restante)
+    logger.info("--- Optimización Finalizada ---")
+
+    mejor_individuo_global = resultado["mejor_individuo"]
+    kpis = _kpis(params, criterio,
+                 mejor_energia=resultado["mejor_energia"], #En MegaJoules
+                 parametros_inviables=resultado["parametros_inviables"],
+                 energias_grupos=resultado["energias_grupos"],
+                 generaciones=max(resultado["generaciones_grupos"]),
+                 motivo_parada="tiempo" if "tiempo" in resultado["motivos_grupos"] else "grupos")
+    if resultado["parametros_inviables"]:
+        logger.warning("❌ No se encontró una solución válida (ni reparando la unión de los grupos).")
+        return kpis
+
+    logger.info("🏆 Energía de la unión de los grupos: %.2e J%s", resultado["mejor_energia"], " (reparada)" if resultado["reparado"] else "")
+    logger.info("   Cromosoma: %s", mejor_individuo_global)
+
+    if generar_salidas:
+        import visualization as vis
+        tareas_con_estaciones_carga_mejor = sim.materializar_tareas_con_recargas(tareas, mejor_individuo_global.recargas, estaciones)
+        vis.visualizar_rutas(mejor_individuo_global, tareas_con_estaciones_carga_mejor, drones, config.POLIGONO_ROSARIO, estaciones, config,
+                             filename=f"rutas_drones_final{sufijo_salidas}.html")
+
+    kpis["tiempo_medio_entrega"] = sim.calcular_tiempo_medio_entrega(mejor_individuo_global, tareas, drones, estaciones, resultado["distancias"])
+    return kpis
 
 
 def main():
+    logging.basicConfig(level=config.NIVEL_LOG, format="%(message)s")
 
     corridas = [
         #Probamos con 10 drones
-        {"NUM_TAREAS": 60, "NUM_DRONES":20 , "TIEMPO_MIN": 150, "TIEMPO_MAX_MIN": 180},   
-        {"NUM_TAREAS": 90, "NUM_DRONES":20 , "TIEMPO_MIN": 135, "TIEMPO_MAX_MIN": 165},
-        {"NUM_TAREAS": 120, "NUM_DRONES":30 , "TIEMPO_MIN": 120, "TIEMPO_MAX_MIN": 150},
+        {"NUM_TAREAS": 60, "NUM_DRONES":20 , "TIEMPO_MIN_MIN": 150, "TIEMPO_MAX_MIN": 180},   
+        {"NUM_TAREAS": 90, "NUM_DRONES":20 , "TIEMPO_MIN_MIN": 135, "TIEMPO_MAX_MIN": 165},
+        {"NUM_TAREAS": 120, "NUM_DRONES":30 , "TIEMPO_MIN_MIN": 120, "TIEMPO_MAX_MIN": 150},
         # # Probamos reduciendo los tiempos de pedido --> Mejor servicio
-        {"NUM_TAREAS": 60, "NUM_DRONES":10 , "TIEMPO_MIN": 140, "TIEMPO_MAX_MIN": 170},   
-        {"NUM_TAREAS": 90, "NUM_DRONES":20 , "TIEMPO_MIN": 125, "TIEMPO_MAX_MIN": 155},
-        {"NUM_TAREAS": 120, "NUM_DRONES":30 , "TIEMPO_MIN": 110, "TIEMPO_MAX_MIN": 140},
+        {"NUM_TAREAS": 60, "NUM_DRONES":10 , "TIEMPO_MIN_MIN": 140, "TIEMPO_MAX_MIN": 170},   
+        {"NUM_TAREAS": 90, "NUM_DRONES":20 , "TIEMPO_MIN_MIN": 125, "TIEMPO_MAX_MIN": 155},
+        {"NUM_TAREAS": 120, "NUM_DRONES":30 , "TIEMPO_MIN_MIN": 110, "TIEMPO_MAX_MIN": 140},
     ]
 
-    resultados = []
-    for i in range(len(corridas)):
-        print(f"\n=== Iniciando Corrida {i+1}/{len(corridas)} con parámetros: {corridas[i]} ===")
-        try:
-            kpis = run_optimization(params=corridas[i], verbose=False)
-
-            if kpis.get("parametros_inviables", True): #Si parametros_inviables es True, se considera que la corrida fue inviable
-                print(f"❌ Corrida {i+1} inviable con parámetros {corridas[i]}")
-                resultados.append({
-                    "params": corridas[i],
-                    "status": "inviable",
-                    "mejor_energia": None,
-                    "tiempo_medio_entrega": None
-                })
-            else:
-                resultados.append({
-                    **kpis,
-                    "status": "ok"
-                })
-        except Exception as e:
-            print(f"⚠️ Error en la corrida {i+1}: {e}")
-            resultados.append({
-                "params": corridas[i],
-                "status": "inviable",
-                "mejor_energia": None,
-                "tiempo_medio_entrega": None
-            })
+    # Cada corrida se ejecuta en su propio proceso, con su copia de config y su semilla
+    resultados = sweep.ejecutar_barrido(
+        corridas,
+        max_procesos=config.NUM_PROCESOS,
+        timeout=config.TIMEOUT_CORRIDA_SEGUNDOS,
+        semilla=config.SEMILLA,
+        generar_salidas=True, # Cada corrida con sus archivos (sufijo _corrida<n>, ver sweep.py)
+    )
+    for i, resultado in enumerate(resultados):
+        if resultado["status"] != "ok":
+            logger.warning("❌ Corrida %d %s con parámetros %s", i + 1, resultado["status"], corridas[i])
     
     # Comparación de resultados
+    import pandas as pd
     df = pd.DataFrame(resultados)
     print("\n=== TABLA DE COMPARACIÓN DE CORRIDAS ===")
     print(df[["params", "status", "mejor_energia", "tiempo_medio_entrega"]])
 
     os.makedirs("resultados", exist_ok=True)
-    df.to_excel(f"resultados/resultados_corridas{random.randint(1, 1000)}.xlsx", 
+    archivo = f"resultados/resultados_corridas{random.randint(1, 1000)}.xlsx"
+    df.to_excel(archivo, 
             index=False, 
             engine="openpyxl")
-    print(f"\nResultados guardados en resultados_corridas{random.randint(1, 1000)}.xlsx ✅")
+    print(f"\nResultados guardados en {archivo} ✅")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
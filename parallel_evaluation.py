@@ -0,0 +1,94 @@
+# Evaluación de la población repartida en bloques entre varios procesos.
+# Los datos del escenario (tareas, drones, estaciones, distancias y parámetros de config) se envían
+# una sola vez a cada proceso al crear el pool; por cada generación sólo viajan los cromosomas.
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import config
+import events
+import simulation as sim
+from fitness_cache import CacheRutas
+from scenario import como_escenario
+
+_escenario_worker = None
+
+def parametros_config():
+    """Copia de los parámetros en mayúsculas de config (constantes físicas, tamaños, etc.)."""
+    return {clave: getattr(config, clave) for clave in dir(config) if clave.isupper()}
+
+def _inicializar_worker(tareas, drones, estaciones, distancias, parametros):
+    """
+    Se ejecuta una vez en cada proceso: guarda el escenario y la configuración del padre, que se
+    activa con config.usar en cada bloque (el módulo config del proceso no se modifica).
+    """
+    global _escenario_worker
+    configuracion = config.Configuracion(parametros)
+    events.reiniciar() # Con fork se heredan los contadores del padre
+    cache_rutas = CacheRutas(configuracion.TAMANO_CACHE_RUTAS) if configuracion.TAMANO_CACHE_RUTAS > 0 else None
+    _escenario_worker = (tareas, drones, estaciones, distancias, cache_rutas, configuracion)
+
+def _evaluar_bloque(permutaciones, cortes, registrar_eventos):
+    tareas, drones, estaciones, distancias, cache_rutas, configuracion = _escenario_worker
+    events.habilitar(registrar_eventos)
+    with config.usar(configuracion):
+        energias, recargas = sim.evaluar_poblacion(permutaciones, cortes, tareas, drones, estaciones, distancias,
+                                                   devolver_recargas=True, cache_rutas=cache_rutas)
+    return energias, recargas, events.extraer() if registrar_eventos else {}
+
+class EvaluadorParalelo:
+    """
+    Reemplazo de sim.evaluar_poblacion que reparte la población en bloques entre procesos.
+    Para poblaciones chicas evalúa en el proceso actual, porque el costo de enviar los
+    cromosomas y recibir resultados supera al de simularlos.
+    Usar como context manager o llamar a cerrar() al terminar la corrida.
+    """
+
+    def __init__(self, tareas, drones, estaciones, distancias, num_procesos=None, min_individuos_por_bloque=None):
+        self.num_procesos = num_procesos or config.NUM_PROCESOS or os.cpu_count() or 1
+        self.min_individuos_por_bloque = min_individuos_por_bloque or config.MIN_INDIVIDUOS_POR_BLOQUE
+        tareas, drones = como_escenario(tareas, drones, estaciones)
+        self._escenario = (tareas, drones, estaciones, distancias)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.num_procesos,
+            initializer=_inicializar_worker,
+            initargs=(tareas, drones, estaciones, distancias, parametros_config()),
+        )
+
+    def tamano_bloque(self, num_individuos):
+        """
+        Un bloque por proceso (el simulador vectorizado rinde más con bloques grandes),
+        pero nunca menos de min_individuos_por_bloque individuos por bloque.
+        """
+        return max(self.min_individuos_por_bloque, math.ceil(num_individuos / self.num_procesos))
+
+    def evaluar(self, permutaciones, cortes, cache_rutas=None):
+        """
+        Devuelve (energias (P,), recargas (P, N)) igual que sim.evaluar_poblacion(..., devolver_recargas=True).
+        cache_rutas es el cache de rutas del proceso actual, que se usa cuando se evalúa acá (los workers tienen el suyo).
+        """
+        num_individuos = permutaciones.shape[0]
+        tamano = self.tamano_bloque(num_individuos)
+        if self.num_procesos <= 1 or num_individuos <= tamano:
+            tareas, drones, estaciones, distancias = self._escenario
+            return sim.evaluar_poblacion(permutaciones, cortes, tareas, drones, estaciones, distancias, devolver_recargas=True,
+                                         cache_rutas=cache_rutas)
+
+        inicios = range(0, num_individuos, tamano)
+        futuros = [
+            self._pool.submit(_evaluar_bloque, permutaciones[i:i + tamano], cortes[i:i + tamano], events.HABILITADO)
+            for i in inicios
+        ]
+        resultados = [futuro.result() for futuro in futuros]
+        for _, _, contadores in resultados:
+            events.sumar(contadores)
+        return np.concatenate([r[0] for r in resultados]), np.concatenate([r[1] for r in resultados])
+
+    def cerrar(self):
+        self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
@@ -21,6 +21,43 @@ def distancia_metros(coord1, coord2):
     return R * c
 
 
+def _haversine_radianes(lat1, lon1, lat2, lon2):
+    """Haversine vectorizado sobre arrays en radianes (admite broadcasting)."""
+    R = 6371000  # Radio de la Tierra en metros
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    a = np.sin(dlat / 2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2)**2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    return R * c
+
+ELEMENTOS_POR_BLOQUE = 1 << 20 # Celdas por bloque de distancias_metros_matriz (cada temporal float64 ocupa 8 MB)
+
+def distancias_metros_matriz(origenes, destinos, dtype=float):
+    """
+    Calcula la matriz de distancias en metros entre dos conjuntos de coordenadas (lat, lon).
+    Devuelve un array de forma (len(origenes), len(destinos)) con la misma fórmula que distancia_metros.
+    Se calcula por bloques de filas (en float64) para que los temporales del broadcasting no crezcan
+    con la matriz; con dtype=np.float32 el resultado ocupa la mitad (error relativo ~1e-7).
+    """
+    origenes = np.radians(np.asarray(origenes, dtype=float).reshape(-1, 2))
+    destinos = np.radians(np.asarray(destinos, dtype=float).reshape(-1, 2))
+    matriz = np.empty((len(origenes), len(destinos)), dtype=dtype)
+    filas = max(1, ELEMENTOS_POR_BLOQUE // max(1, len(destinos)))
+    for inicio in range(0, len(origenes), filas):
+        bloque = origenes[inicio:inicio + filas]
+        matriz[inicio:inicio + filas] = _haversine_radianes(bloque[:, 0][:, None], bloque[:, 1][:, None],
+                                                            destinos[:, 0][None, :], destinos[:, 1][None, :])
+    return matriz
+
+def distancias_metros_pares(coords1, coords2):
+    """Calcula la distancia en metros entre coords1[i] y coords2[i] para cada i."""
+    coords1 = np.radians(np.asarray(coords1, dtype=float).reshape(-1, 2))
+    coords2 = np.radians(np.asarray(coords2, dtype=float).reshape(-1, 2))
+    return _haversine_radianes(coords1[:, 0], coords1[:, 1], coords2[:, 0], coords2[:, 1])
+
+
 def punto_en_poligono(punto, poligono):
     """Verifica si un punto está dentro de un polígono usando Ray Casting."""
     lat, lon = punto
@@ -38,6 +75,21 @@ def punto_en_poligono(punto, poligono):
         p1_lat, p1_lon = p2_lat, p2_lon
     return dentro
 
+def puntos_en_poligono(puntos, poligono):
+    """punto_en_poligono vectorizado: máscara booleana (M,) para un array de puntos (M, 2) [lat, lon]."""
+    puntos = np.asarray(puntos, dtype=float).reshape(-1, 2)
+    lat, lon = puntos[:, 0], puntos[:, 1]
+    dentro = np.zeros(len(puntos), dtype=bool)
+    n = len(poligono)
+    for i in range(n):
+        p1_lat, p1_lon = poligono[i]
+        p2_lat, p2_lon = poligono[(i + 1) % n]
+        cruza = (min(p1_lon, p2_lon) < lon) & (lon <= max(p1_lon, p2_lon)) & (lat <= max(p1_lat, p2_lat))
+        if p1_lat != p2_lat and p1_lon != p2_lon:
+            cruza &= lat <= (lon - p1_lon) * (p2_lat - p1_lat) / (p2_lon - p1_lon) + p1_lat
+        dentro ^= cruza
+    return dentro
+
 def generar_puntos_aleatorios(cantidad, poligono):
     """Genera una lista de puntos aleatorios dentro de un polígono."""
     puntos = []
@@ -1,10 +1,10 @@
 # Funciones para generar los datos iniciales del problema.
 
 import random
+import numpy as np
 from points_generator import generar_puntos_aleatorios, generar_puntos_equiespaciados
-from config import POLIGONO_ROSARIO, NUM_ESTACIONES, PESO_MAX_PAQUETE, TIEMPO_MIN_MIN, TIEMPO_MAX_MIN # Asumiendo que PESO_MAX_PAQUETE está en config.py
-import osmnx as ox
-import shapely.geometry as geom
+from scenario import Escenario
+import config
 
 
 def generar_tareas(num_tareas, poligono):
@@ -16,8 +16,8 @@ def generar_tareas(num_tareas, poligono):
         "id": i,
         "pickup": pickups[i],
         "dropoff": dropoffs[i],
-        "peso": round(random.uniform(0.1, PESO_MAX_PAQUETE), 2), # en kilos
-        "tiempo_max": random.randint(TIEMPO_MIN_MIN * 60, TIEMPO_MAX_MIN * 60),  # en segundos
+        "peso": round(random.uniform(0.1, config.PESO_MAX_PAQUETE), 2), # en kilos
+        "tiempo_max": random.randint(config.TIEMPO_MIN_MIN * 60, config.TIEMPO_MAX_MIN * 60),  # en segundos
         "recarga_previa": None,
     } for i in range(num_tareas)]
 
@@ -26,12 +26,32 @@ def generar_drones(num_drones, poligono):
     posiciones = generar_puntos_aleatorios(num_drones, poligono)
     return [{"id": i, "posicion_inicial": posiciones[i]} for i in range(num_drones)]
 
+def generar_escenario(num_tareas, num_drones, poligono, estaciones):
+    """
+    Genera el escenario completo como arrays (ver scenario.py), con la misma secuencia aleatoria
+    que generar_tareas + generar_drones (una semilla da el mismo escenario por ambos caminos).
+    escenario.tareas y escenario.drones se usan igual que las listas de dicts.
+    """
+    pickups = generar_puntos_aleatorios(num_tareas, poligono)
+    dropoffs = generar_puntos_aleatorios(num_tareas, poligono)
+    pesos = np.empty(num_tareas)
+    tiempos_max = np.empty(num_tareas)
+    for i in range(num_tareas):
+        pesos[i] = round(random.uniform(0.1, config.PESO_MAX_PAQUETE), 2) # en kilos
+        tiempos_max[i] = random.randint(config.TIEMPO_MIN_MIN * 60, config.TIEMPO_MAX_MIN * 60) # en segundos
+    bases = generar_puntos_aleatorios(num_drones, poligono)
+    return Escenario(pickups, dropoffs, pesos, tiempos_max, bases, estaciones)
+
 estaciones_de_carga = []
 def generar_estaciones_carga(num_estaciones, poligono):
     """
     Genera una lista de puntos de estaciones de carga (fuel)
     dentro de un polígono definido por coordenadas [(lat, lon), ...].
+    Consulta OpenStreetMap con osmnx (requiere red); sin red usar station_loader.cargar_estaciones.
     """
+    import osmnx as ox # Import diferido: osmnx/geopandas tardan segundos en cargarse y sólo se usan acá
+    import shapely.geometry as geom
+
     # Convertir a (lon, lat) para shapely
     polygon_coords = [(lon, lat) for lat, lon in poligono]
     polygon = geom.Polygon(polygon_coords)
@@ -0,0 +1,242 @@
+# Re-optimización en línea (horizonte rodante): las tareas llegan y se completan durante el día y, en
+# lugar de resolver cada vez desde cero, se conserva la última población. Antes de cada re-optimización
+# se quitan de los cromosomas las tareas completadas, se insertan las nuevas en la posición de menor
+# desvío de alguna ruta (lo que extiende c_i y corre los cortes c_ii) y se sigue evolucionando con
+# procesar_generacion durante un presupuesto corto de tiempo o de generaciones.
+#
+#   horizonte = HorizonteRodante(drones, estaciones)
+#   horizonte.agregar_tareas(pedidos)            # dicts con pickup, dropoff, peso y tiempo_max (s)
+#   plan = horizonte.optimizar()["plan"]         # {dron: [id de tarea, ...]}
+#   horizonte.avanzar(300, bases=posiciones)     # pasaron 5 minutos y los drones se movieron
+#   horizonte.completar_tareas([3, 7])
+#   plan = horizonte.optimizar()["plan"]
+import logging
+import numpy as np
+import config
+import genetic_algorithm as ga
+import simulation as sim
+from distance_matrix import construir_matriz_distancias
+from fitness_cache import CacheFitness
+from individual import Individuo
+from scenario import Escenario, arrays_bases
+from stopping import CriterioParada
+from utils.construction import a_individuo
+from utils.selection import generador
+
+logger = logging.getLogger(__name__)
+
+CANDIDATOS_INSERCION = 3 # En los individuos aleatorizados cada tarea nueva va a una de las 3 posiciones de menor desvío
+
+def rutas_de(individuo):
+    """Rutas (arrays de ids de tareas) de un individuo, una por corte más uno."""
+    c_i, c_ii = individuo
+    return np.split(np.asarray(c_i, dtype=np.int64), np.asarray(c_ii, dtype=np.int64))
+
+def reindexar_rutas(rutas, nuevo_indice, num_rutas):
+    """
+    Traduce las rutas a la numeración nueva de las tareas (nuevo_indice[id viejo], -1 si ya no está)
+    y las ajusta a num_rutas: las sobrantes se agregan al final de la última y faltantes quedan vacías.
+    """
+    rutas = [nuevo_indice[ruta][nuevo_indice[ruta] >= 0] for ruta in rutas]
+    if len(rutas) > num_rutas:
+        rutas = rutas[:num_rutas - 1] + [np.concatenate(rutas[num_rutas - 1:])]
+    return [list(ruta) for ruta in rutas] + [[] for _ in range(num_rutas - len(rutas))]
+
+def insertar_tareas(rutas, nuevas, tiempos_max, distancias, aleatoria=False, rng=None):
+    """
+    Inserción más barata: agrega cada tarea de `nuevas` (en orden de plazo) en la posición de la ruta
+    que menos vuelo extra agrega, prefiriendo las posiciones donde se estima que se entrega en plazo
+    (vuelo a VELOCIDAD_DRON sin recargas; el simulador decide después). Si aleatoria, elige al azar entre
+    las CANDIDATOS_INSERCION mejores. Modifica y devuelve `rutas` (listas de ids, una por dron).
+    """
+    rng = rng or generador()
+    D = distancias["num_drones"]
+    origen_pickup, pickup_dropoff = distancias["origen_pickup"], distancias["pickup_dropoff"]
+    v = config.VELOCIDAD_DRON
+
+    for t in sorted(nuevas, key=lambda t: tiempos_max[t]):
+        costos, tarde, posiciones = [], [], []
+        for d, ruta in enumerate(rutas):
+            ruta = np.asarray(ruta, dtype=np.int64)
+            origenes = np.concatenate(([d], D + ruta)) # Desde dónde sale el dron antes de cada posición
+            siguiente = np.concatenate((ruta, [-1]))
+            # Fin estimado de cada tarea de la ruta: antes de la posición q el dron terminó las q primeras
+            tramos = (origen_pickup[origenes[:-1], ruta] + pickup_dropoff[ruta]) / v
+            inicio = np.concatenate(([0.0], np.cumsum(tramos)))
+            ida = origen_pickup[origenes, t] + pickup_dropoff[t]
+            vuelta = np.where(siguiente >= 0, origen_pickup[D + t, siguiente] - origen_pickup[origenes, siguiente], 0.0)
+            costos.append(ida + vuelta)
+            tarde.append(inicio + ida / v > tiempos_max[t])
+            posiciones += [(d, q) for q in range(len(origenes))]
+        costos, tarde = np.concatenate(costos), np.concatenate(tarde)
+        orden = np.lexsort((costos, tarde)) # Primero las que llegan en plazo, después por desvío
+        k = orden[rng.integers(min(CANDIDATOS_INSERCION, len(orden)))] if aleatoria else orden[0]
+        d, q = posiciones[k]
+        rutas[d].insert(q, int(t))
+    return rutas
+
+
+class HorizonteRodante:
+    """
+    Estado del despacho en línea: tareas pendientes (con ids externos estables), posición actual de
+    los drones y la población de la última optimización, que se reutiliza como arranque en caliente.
+    El simulador supone que cada dron sale de su posición actual con la batería llena y que los plazos
+    se cuentan desde el instante de la optimización (ver avanzar).
+    """
+
+    def __init__(self, drones, estaciones, tareas=()):
+        self.bases = np.array(arrays_bases(drones), dtype=float)
+        self.estaciones = estaciones
+        self.tareas = {} # id externo -> dict de la tarea (pickup, dropoff, peso, tiempo_max)
+        self.poblacion = [] # Última población, numerada según self._ids_poblacion
+        self.mejor_individuo = None
+        self._ids_poblacion = np.empty(0, dtype=np.int64)
+        self._proximo_id = 0
+        if tareas:
+            self.agregar_tareas(tareas)
+
+    def agregar_tareas(self, tareas):
+        """Agrega tareas pendientes (dicts con pickup, dropoff, peso y tiempo_max). Devuelve sus ids."""
+        ids = []
+        for tarea in tareas:
+            id_tarea = tarea.get("id", self._proximo_id)
+            if id_tarea in self.tareas:
+                raise ValueError(f"Ya hay una tarea pendiente con id {id_tarea}")
+            self.tareas[id_tarea] = {clave: tarea[clave] for clave in ("pickup", "dropoff", "peso", "tiempo_max")}
+            self._proximo_id = max(self._proximo_id, id_tarea) + 1
+            ids.append(id_tarea)
+        return ids
+
+    def completar_tareas(self, ids):
+        """Quita tareas entregadas (o canceladas); se sacan de los cromosomas en la próxima optimización."""
+        for id_tarea in ids:
+            self.tareas.pop(id_tarea, None)
+
+    def avanzar(self, segundos, bases=None):
+        """Descuenta `segundos` de los plazos pendientes y, si se pasan, actualiza las posiciones de los drones."""
+        for tarea in self.tareas.values():
+            tarea["tiempo_max"] -= segundos
+        if bases is not None:
+            bases = np.asarray(bases, dtype=float).reshape(-1, 2)
+            if len(bases) != len(self.bases):
+                raise ValueError(f"Se esperaban {len(self.bases)} posiciones de drones y llegaron {len(bases)}")
+            self.bases = bases
+
+    def escenario(self):
+        """Escenario de las tareas pendientes (en el orden de self.tareas) y los ids externos de cada una."""
+        ids = np.fromiter(self.tareas, dtype=np.int64, count=len(self.tareas))
+        valores = list(self.tareas.values())
+        escenario = Escenario([t["pickup"] for t in valores], [t["dropoff"] for t in valores],
+                              [t["peso"] for t in valores], [t["tiempo_max"] for t in valores],
+                              self.bases, self.estaciones)
+        return escenario, ids
+
+    def _poblacion_caliente(self, ids, tiempos_max, distancias):
+        """
+        Traduce la población anterior (y su mejor individuo) al escenario actual: quita las tareas que ya
+        no están, inserta las nuevas y completa con individuos aleatorios hasta TAMANO_POBLACION.
+        El primero (el mejor anterior) recibe la inserción determinista; el resto, la aleatorizada.
+        """
+        posicion = {id_tarea: i for i, id_tarea in enumerate(ids)}
+        nuevo_indice = np.array([posicion.get(id_tarea, -1) for id_tarea in self._ids_poblacion], dtype=np.int64)
+        nuevas = sorted(set(range(len(ids))) - set(nuevo_indice[nuevo_indice >= 0].tolist()))
+        num_rutas = min(len(self.bases), len(ids))
+        rng = generador()
+
+        anteriores = ([self.mejor_individuo] if self.mejor_individuo is not None else []) + self.poblacion
+        poblacion, vistos = [], set()
+        for i, individuo in enumerate(anteriores):
+            rutas = reindexar_rutas(rutas_de(individuo), nuevo_indice, num_rutas)
+            individuo = a_individuo(insertar_tareas(rutas, nuevas, tiempos_max, distancias, aleatoria=i > 0, rng=rng))
+            if individuo.clave() not in vistos:
+                vistos.add(individuo.clave())
+                poblacion.append(individuo)
+            if len(poblacion) == config.TAMANO_POBLACION:
+                break
+        return poblacion + [ga.crear_individuo() for _ in range(config.TAMANO_POBLACION - len(poblacion))], len(nuevas)
+
+    def _plan_una_tarea(self, escenario, ids, criterio):
+        """
+        Con una sola tarea pendiente no hay nada que evolucionar: se simula la tarea con cada dron y se
+        asigna al que la completa con menos energía. El individuo pone los cortes en 0 para que la única
+        ruta no vacía sea la de ese dron.
+        """
+        distancias = construir_matriz_distancias(escenario.tareas, escenario.drones, self.estaciones)
+        num_drones = len(self.bases)
+        resultado = sim.simular_lista_rutas([[0]] * num_drones, range(num_drones), escenario.pesos, escenario.tiempos_max, distancias)
+        energias = np.where(resultado["penalizada"], np.inf, resultado["energia"])
+        d = int(np.argmin(energias))
+        insertadas = int(ids[0] not in self._ids_poblacion)
+        mejor = None
+        if np.isfinite(energias[d]):
+            mejor = Individuo([0], [0] * d, energias[d] / 1e6, resultado["recargas"][d, :1])
+        self.poblacion, self.mejor_individuo, self._ids_poblacion = [], mejor, ids
+        if mejor is None:
+            logger.warning("La re-optimización no encontró un plan viable para la única tarea pendiente")
+        plan = {dron: [] for dron in range(num_drones)}
+        plan[d] = ids.tolist()
+        return {"plan": plan if mejor is not None else None, "mejor_energia": mejor.energia if mejor is not None else None,
+                "mejor_individuo": mejor, "tareas_insertadas": insertadas, "generaciones": 0, "motivo_parada": "una_tarea",
+                "duracion_s": criterio.transcurrido()}
+
+    def optimizar(self, tiempo_maximo=None, num_generaciones=None):
+        """
+        Re-optimiza las tareas pendientes partiendo de la población anterior, durante tiempo_maximo
+        segundos o num_generaciones generaciones (por defecto TIEMPO_REOPTIMIZACION_SEGUNDOS y
+        GENERACIONES_REOPTIMIZACION). Devuelve un dict con el plan {dron: [ids de tareas]} del mejor
+        individuo (None si no se encontró uno viable), su energía y datos de la re-optimización.
+        """
+        tiempo_maximo = tiempo_maximo if tiempo_maximo is not None else config.TIEMPO_REOPTIMIZACION_SEGUNDOS
+        num_generaciones = num_generaciones or config.GENERACIONES_REOPTIMIZACION
+        criterio = CriterioParada(tiempo_maximo=tiempo_maximo)
+        escenario, ids = self.escenario()
+        if len(ids) == 0:
+            self.poblacion, self.mejor_individuo, self._ids_poblacion = [], None, ids
+            return {"plan": {d: [] for d in range(len(self.bases))}, "mejor_energia": 0.0, "mejor_individuo": None,
+                    "tareas_insertadas": 0, "generaciones": 0, "motivo_parada": "sin_tareas", "duracion_s": criterio.transcurrido()}
+
+        if len(ids) == 1:
+            return self._plan_una_tarea(escenario, ids, criterio)
+
+        tareas, drones = escenario.tareas, escenario.drones
+        with config.usar(NUM_TAREAS=len(ids), NUM_DRONES=len(self.bases)): # crear_individuo y las mutaciones leen config
+            distancias = construir_matriz_distancias(tareas, drones, self.estaciones)
+            cache = CacheFitness(config.TAMANO_CACHE_FITNESS, config.TAMANO_CACHE_RUTAS) if config.TAMANO_CACHE_FITNESS > 0 else None
+            if self.poblacion or self.mejor_individuo is not None:
+                poblacion, insertadas = self._poblacion_caliente(ids, escenario.tiempos_max, distancias)
+            else:
+                poblacion, insertadas = ga.crear_poblacion_inicial(tareas, drones, self.estaciones, distancias), len(ids)
+            ga.evaluar_pendientes(poblacion, tareas, drones, self.estaciones, distancias, cache)
+            mejor = min((individuo for individuo in poblacion if individuo.viable), key=lambda individuo: individuo.energia, default=None)
+
+            criterio.comenzar_generaciones()
+            for _ in range(num_generaciones):
+                if criterio.agotado():
+                    break
+                nueva, inviable = ga.procesar_generacion(poblacion, tareas, drones, self.estaciones, distancias, cache)
+                if inviable:
+                    break # Se conserva la última población para la próxima re-optimización
+                poblacion = nueva
+                candidato = min(poblacion, key=lambda individuo: individuo.energia)
+                if mejor is None or candidato.energia <= mejor.energia:
+                    mejor = candidato
+                if criterio.registrar(mejor.energia) is not None:
+                    break
+
+        self.poblacion, self.mejor_individuo, self._ids_poblacion = poblacion, mejor, ids
+        plan = None
+        if mejor is not None:
+            plan = {d: [] for d in range(len(self.bases))}
+            for d, ruta in enumerate(rutas_de(mejor)):
+                plan[d] = ids[ruta].tolist()
+        else:
+            logger.warning("La re-optimización no encontró un plan viable para %d tareas pendientes", len(ids))
+        return {
+            "plan": plan,
+            "mejor_energia": mejor.energia if mejor is not None else None,
+            "mejor_individuo": mejor,
+            "tareas_insertadas": insertadas,
+            "generaciones": criterio.generaciones,
+            "motivo_parada": criterio.motivo or "generaciones",
+            "duracion_s": criterio.transcurrido(),
+        }
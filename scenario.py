@@ -0,0 +1,130 @@
+# Modelo del problema como "struct of arrays": pickups, dropoffs, pesos, plazos, bases y estaciones
+# se guardan en arrays contiguos de NumPy. Las vistas `tareas` y `drones` se comportan como las listas
+# de dicts de siempre (para visualization.py y el simulador escalar), pero el simulador vectorizado
+# y la matriz de distancias leen los arrays directamente.
+from collections.abc import Sequence
+import numpy as np
+
+class Escenario:
+    """
+    Datos de un escenario:
+        pickups, dropoffs   (N, 2)  coordenadas [lat, lon] de cada tarea
+        pesos               (N,)    peso del paquete en kilos
+        tiempos_max         (N,)    plazo de entrega en segundos
+        bases               (D, 2)  posición inicial de cada dron
+        estaciones          (S, 2)  estaciones de carga
+    """
+
+    def __init__(self, pickups, dropoffs, pesos, tiempos_max, bases, estaciones=()):
+        self.pickups = np.asarray(pickups, dtype=float).reshape(-1, 2)
+        self.dropoffs = np.asarray(dropoffs, dtype=float).reshape(-1, 2)
+        self.pesos = np.asarray(pesos, dtype=float)
+        self.tiempos_max = np.asarray(tiempos_max, dtype=float)
+        self.bases = np.asarray(bases, dtype=float).reshape(-1, 2)
+        self.estaciones = np.asarray(estaciones, dtype=float).reshape(-1, 2)
+
+    @classmethod
+    def desde_listas(cls, tareas, drones, estaciones=()):
+        """Arma un Escenario a partir de las listas de dicts de problem_setup."""
+        return cls(
+            [tarea["pickup"] for tarea in tareas],
+            [tarea["dropoff"] for tarea in tareas],
+            [tarea["peso"] for tarea in tareas],
+            [tarea["tiempo_max"] for tarea in tareas],
+            [dron["posicion_inicial"] for dron in drones],
+            estaciones,
+        )
+
+    @property
+    def num_tareas(self):
+        return len(self.pesos)
+
+    @property
+    def num_drones(self):
+        return len(self.bases)
+
+    @property
+    def num_estaciones(self):
+        return len(self.estaciones)
+
+    @property
+    def tareas(self):
+        """Vista de las tareas como secuencia de dicts."""
+        return VistaTareas(self)
+
+    @property
+    def drones(self):
+        """Vista de los drones como secuencia de dicts."""
+        return VistaDrones(self)
+
+
+class _Vista(Sequence):
+    """Secuencia de sólo lectura que arma el dict de cada elemento al accederlo."""
+
+    def __init__(self, escenario):
+        self.escenario = escenario
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._elemento(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._elemento(i)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class VistaTareas(_Vista):
+    def __len__(self):
+        return self.escenario.num_tareas
+
+    def _elemento(self, i):
+        e = self.escenario
+        return {
+            "id": i,
+            "pickup": e.pickups[i].tolist(),
+            "dropoff": e.dropoffs[i].tolist(),
+            "peso": float(e.pesos[i]),
+            "tiempo_max": float(e.tiempos_max[i]),
+            "recarga_previa": None,
+        }
+
+
+class VistaDrones(_Vista):
+    def __len__(self):
+        return self.escenario.num_drones
+
+    def _elemento(self, i):
+        return {"id": i, "posicion_inicial": self.escenario.bases[i].tolist()}
+
+
+def como_escenario(tareas, drones, estaciones=()):
+    """
+    (tareas, drones) como vistas de un Escenario: las vistas se devuelven tal cual y las listas de
+    dicts se convierten una sola vez. Se llama al entrar a una corrida (o a un worker) para que
+    arrays_tareas no rearme el escenario en cada evaluación.
+    """
+    if isinstance(tareas, VistaTareas) and isinstance(drones, VistaDrones):
+        return tareas, drones
+    escenario = Escenario(*arrays_tareas(tareas), arrays_bases(drones), estaciones)
+    return escenario.tareas, escenario.drones
+
+def arrays_tareas(tareas):
+    """
+    (pickups, dropoffs, pesos, tiempos_max) de una vista de Escenario o de una lista de dicts
+    (que se convierte en cada llamada: en bucles conviene pasar vistas, ver como_escenario).
+    """
+    if isinstance(tareas, VistaTareas):
+        e = tareas.escenario
+        return e.pickups, e.dropoffs, e.pesos, e.tiempos_max
+    e = Escenario.desde_listas(tareas, [])
+    return e.pickups, e.dropoffs, e.pesos, e.tiempos_max
+
+def arrays_bases(drones):
+    """Posiciones iniciales (D, 2) de una vista de Escenario o de una lista de dicts."""
+    if isinstance(drones, VistaDrones):
+        return drones.escenario.bases
+    return np.asarray([dron["posicion_inicial"] for dron in drones], dtype=float).reshape(-1, 2)
@@ -1,16 +1,20 @@
 # Contiene la lógica para simular una solución y calcular su funcion_objetivo.
 
+import logging
 import numpy as np
-from points_generator import encontrar_estacion_mas_cercana, distancia_metros
+from distance_matrix import construir_matriz_distancias, indice_base, indice_dropoff, indice_estacion
 import config
-import copy
+import events
+from scenario import arrays_tareas
+
+logger = logging.getLogger(__name__)
 
 def decodificar_cromosoma(individuo, drones):
     """Traduce un cromosoma a una lista de IDs de tareas para cada dron."""
-    c_i, c_ii = individuo
+    c_i, c_ii = (np.asarray(cromosoma).tolist() for cromosoma in individuo) # Acepta listas o Individuo
     rutas_drones = {dron["id"]: [] for dron in drones}
     num_drones_reales = len(c_ii) + 1
-    puntos_corte_extendidos = [0] + c_ii + [config.NUM_TAREAS]
+    puntos_corte_extendidos = [0] + c_ii + [len(c_i)] # c_i tiene las NUM_TAREAS tareas
     for i in range(num_drones_reales):
         idx_inicio = puntos_corte_extendidos[i]
         idx_fin = puntos_corte_extendidos[i+1]
@@ -19,102 +23,130 @@ def decodificar_cromosoma(individuo, drones):
             rutas_drones[i] = id_tareas_asignadas
     return rutas_drones
 
-def calcular_energia(L1, L2, L3, v, mpj):
+def coeficientes_energia():
+    """
+    Constantes físicas de calcular_energia leídas de config una sola vez. Dentro de config.usar cada
+    lectura de config pasa por la Configuracion activa, así que los bucles que calculan muchas
+    energías las resuelven antes y llaman a calcular_energia con coeficientes=...
+    """
+    rho, masa, g = config.RHO, config.MASA_DRON, config.G
+    return (config.COEFICIENTE_ARRASTRE * rho * config.AREA_FRONTAL_DRON, # Arrastre
+            config.FIGURE_OF_MERIT * np.sqrt(2 * rho * config.AREA_ROTOR), # Sustentación (sin la velocidad)
+            masa, g, np.sqrt((masa * g)**3), 1 / config.EFICIENCIA_GLOBAL)
+
+def calcular_energia(L1, L2, L3, v, mpj, coeficientes=None):
     """
     FUNCION OBJETIVO
     Calcula la energía consumida por un UAV durante una entrega.
     """
-    term1 = config.COEFICIENTE_ARRASTRE * config.RHO * config.AREA_FRONTAL_DRON * (L1 + L2 + L3) * v**2
-    sustentacion_const = v * config.FIGURE_OF_MERIT * np.sqrt(2 * config.RHO * config.AREA_ROTOR)
-    numerador2 = L2 * np.sqrt(((config.MASA_DRON + mpj) * config.G)**3)
+    arrastre, sustentacion, masa, g, peso_vacio, inversa_eficiencia = coeficientes or coeficientes_energia()
+    term1 = arrastre * (L1 + L2 + L3) * v**2
+    sustentacion_const = v * sustentacion
+    numerador2 = L2 * np.sqrt(((masa + mpj) * g)**3)
     term2 = numerador2 / sustentacion_const
-    numerador3 = (L1 + L3) * np.sqrt((config.MASA_DRON * config.G)**3)
+    numerador3 = (L1 + L3) * peso_vacio
     term3 = numerador3 / sustentacion_const
-    energia_total = (1 / config.EFICIENCIA_GLOBAL) * (term1 + term2 + term3)
+    energia_total = inversa_eficiencia * (term1 + term2 + term3)
     return energia_total
 
-def funcion_objetivo(individuo, tareas, drones, estaciones_carga):
+def estacion_mas_cercana(origen, distancias):
+    """Devuelve (índice, distancia) de la estación más cercana a un índice de origen (precalculadas)."""
+    return distancias["estacion_cercana"][origen], distancias["dist_estacion_cercana"][origen]
+
+def funcion_objetivo(individuo, tareas, drones, estaciones_carga, distancias=None):
     """
     Función objetivo refactorizada con lógica de recarga proactiva y
     verificación de tiempos de entrega.
+    Si no se recibe la matriz de distancias del escenario se construye en el momento;
+    conviene construirla una sola vez por corrida y reutilizarla.
+    Devuelve la energía (MJ) y un array (N,) con el índice de la estación donde se recarga
+    antes de cada tarea (-1 si no recarga). Las tareas recibidas no se modifican.
     """
-    # --- CORRECCIÓN CRÍTICA: Evitar la modificación del estado global ---
-    # Se trabaja con una copia profunda para no "contaminar" los datos para el siguiente individuo.\
-    #print("Evaluando individuo:", individuo)
-    tareas_locales = copy.deepcopy(tareas)
-    
-    #Agregar un campo recarga previa a cada tarea de tareas_locales
-    for tarea in tareas_locales:
-        tarea["recarga_previa"] = None
+    if distancias is None:
+        distancias = construir_matriz_distancias(tareas, drones, estaciones_carga)
+
+    # Las recargas se registran en un array compacto en lugar de copiar las tareas
+    recargas = np.full(len(tareas), -1, dtype=np.int64)
 
     rutas = decodificar_cromosoma(individuo, drones)
     energia_total_flota = 0
     
     penalizacion = False
+    # Parámetros leídos una vez por llamada (ver coeficientes_energia)
+    velocidad, bateria_maxima, coeficientes = config.VELOCIDAD_DRON, config.BATERIA_MAXIMA, coeficientes_energia()
+    registrar_eventos = events.HABILITADO
 
     for id_dron, id_tareas_asignadas in rutas.items():
-        posicion_actual = drones[id_dron]["posicion_inicial"]
-        bateria_actual = config.BATERIA_MAXIMA
+        origen_actual = indice_base(id_dron, distancias)
+        bateria_actual = bateria_maxima
         tiempo_dron = 0
 
         for id_tarea in id_tareas_asignadas:
-            tarea = tareas_locales[id_tarea]
+            tarea = tareas[id_tarea]
 
             # --- 1. REFACTORIZACIÓN LÓGICA: Planificación del viaje ---
-            posicion_inicio_viaje = posicion_actual
+            origen_inicio_viaje = origen_actual
             
             # Se calcula la energía requerida desde la posición actual para decidir si recargar
-            L1_temporal = distancia_metros(posicion_actual, tarea["pickup"])
-            L2 = distancia_metros(tarea["pickup"], tarea["dropoff"])
-            energia_requerida_inicial = calcular_energia(L1_temporal, L2, 0, config.VELOCIDAD_DRON, tarea["peso"])
+            L1_temporal = distancias["origen_pickup"][origen_actual, id_tarea]
+            L2 = distancias["pickup_dropoff"][id_tarea]
+            energia_requerida_inicial = calcular_energia(L1_temporal, L2, 0, velocidad, tarea["peso"], coeficientes)
 
             # --- 2. DECISIÓN DE RECARGA ---
             if bateria_actual < energia_requerida_inicial:
-                print(f"Tarea: {tarea['id']} Batería insuficiente, buscando estación... Necesito: {energia_requerida_inicial:.2f}, Tengo: {bateria_actual:.2f}")
-                estacion_cercana = encontrar_estacion_mas_cercana(posicion_actual, estaciones_carga)
-                dist_a_estacion = distancia_metros(posicion_actual, estacion_cercana)
-                energia_a_estacion = calcular_energia(dist_a_estacion, 0, 0, config.VELOCIDAD_DRON, 0)
+                logger.debug("Tarea: %s Batería insuficiente, buscando estación... Necesito: %.2f, Tengo: %.2f", tarea['id'], energia_requerida_inicial, bateria_actual)
+                idx_estacion, dist_a_estacion = estacion_mas_cercana(origen_actual, distancias)
+                energia_a_estacion = calcular_energia(dist_a_estacion, 0, 0, velocidad, 0, coeficientes)
                 
                 if bateria_actual < energia_a_estacion:
-                    print(f"PENALIZACIÓN (Dron {id_dron}): No hay batería para llegar a la estación. Falta: {energia_a_estacion - bateria_actual:.2f} J")
+                    logger.debug("PENALIZACIÓN (Dron %s): No hay batería para llegar a la estación. Falta: %.2f J", id_dron, energia_a_estacion - bateria_actual)
+                    if registrar_eventos:
+                        events.registrar("penalizacion_sin_bateria_estacion")
                     penalizacion = True
                     continue
 
                 # Simular viaje a la estación y recarga
                 energia_total_flota += energia_a_estacion
-                tiempo_dron += (dist_a_estacion / config.VELOCIDAD_DRON)
-                bateria_actual = config.BATERIA_MAXIMA
+                tiempo_dron += (dist_a_estacion / velocidad)
+                bateria_actual = bateria_maxima
                 
                 # La nueva posición de inicio del viaje es la estación
-                posicion_inicio_viaje = estacion_cercana
-                tarea["recarga_previa"] = estacion_cercana # Se modifica la copia local
+                origen_inicio_viaje = indice_estacion(idx_estacion, distancias)
+                recargas[id_tarea] = idx_estacion
+                if registrar_eventos:
+                    events.registrar("recargas")
 
             # --- 3. EJECUCIÓN DE LA TAREA ---
             # Se calculan L1 y la energía del viaje definitivo desde el punto de partida correcto (actual o estación)
-            L1 = distancia_metros(posicion_inicio_viaje, tarea["pickup"])
-            energia_viaje_tarea = calcular_energia(L1, L2, 0, config.VELOCIDAD_DRON, tarea["peso"])
+            L1 = distancias["origen_pickup"][origen_inicio_viaje, id_tarea]
+            energia_viaje_tarea = calcular_energia(L1, L2, 0, velocidad, tarea["peso"], coeficientes)
 
             if bateria_actual < energia_viaje_tarea:
-                print(f"PENALIZACIÓN (Dron {id_dron}): Tarea imposible incluso con batería llena. Requiere: {energia_viaje_tarea:.2f} J")
+                logger.debug("PENALIZACIÓN (Dron %s): Tarea imposible incluso con batería llena. Requiere: %.2f J", id_dron, energia_viaje_tarea)
+                if registrar_eventos:
+                    events.registrar("penalizacion_tarea_imposible")
                 penalizacion = True
                 continue
 
             # Si es posible, se ejecuta la tarea
             energia_total_flota += energia_viaje_tarea
             bateria_actual -= energia_viaje_tarea
-            tiempo_dron += (L1 + L2) / config.VELOCIDAD_DRON
-            posicion_actual = tarea["dropoff"]
+            tiempo_dron += (L1 + L2) / velocidad
+            origen_actual = indice_dropoff(id_tarea, distancias)
 
             # --- 4. VERIFICACIÓN DEL TIEMPO LÍMITE (DEADLINE) ---
             if tiempo_dron > tarea["tiempo_max"]:
-                print(f"PENALIZACIÓN (Dron {id_dron}): Plazo de entrega excedido. Tiempo: {tiempo_dron:.2f}s, Límite: {tarea['tiempo_max']}s, en la tarea {tarea['id']}")
+                logger.debug("PENALIZACIÓN (Dron %s): Plazo de entrega excedido. Tiempo: %.2fs, Límite: %ss, en la tarea %s", id_dron, tiempo_dron, tarea['tiempo_max'], tarea['id'])
+                if registrar_eventos:
+                    events.registrar("penalizacion_plazo")
                 penalizacion = True
             
             # --- 5. VERIFICACIÓN DE SEGURIDAD ---
-            estacion_segura = encontrar_estacion_mas_cercana(posicion_actual, estaciones_carga)
-            dist_segura = distancia_metros(posicion_actual, estacion_segura)
-            energia_segura = calcular_energia(dist_segura, 0, 0, config.VELOCIDAD_DRON, 0)
+            _, dist_segura = estacion_mas_cercana(origen_actual, distancias)
+            energia_segura = calcular_energia(dist_segura, 0, 0, velocidad, 0, coeficientes)
             if bateria_actual < energia_segura:
+                if registrar_eventos:
+                    events.registrar("penalizacion_seguridad")
                 penalizacion = True
                 continue
             
@@ -122,60 +154,296 @@ def funcion_objetivo(individuo, tareas, drones, estaciones_carga):
     # --- CÁLCULO FINAL DE LA FUNCION OBJETIVO ---
     if penalizacion:
         energia_total_flota = 0
-        #print("Se aplicó penalización por incumplimientos.")
-    print(f"La energia devuelta es: {energia_total_flota}")
-    return (energia_total_flota / 1e6), tareas_locales
+            #print("Se aplicó penalización por incumplimientos.")
+    if registrar_eventos:
+        events.registrar("evaluaciones")
+        if penalizacion:
+            events.registrar("individuos_inviables")
+    logger.debug("La energia devuelta es: %s", energia_total_flota)
+    return (energia_total_flota / 1e6), recargas
 
-def calcular_tiempo_medio_entrega(individuo, tareas, drones, estaciones_carga):
-   
-    tareas_locales = copy.deepcopy(tareas)
+def materializar_tareas_con_recargas(tareas, recargas, estaciones_carga):
+    """
+    Devuelve copias de las tareas con el campo "recarga_previa" completado a partir del array
+    de recargas (índice de estación o -1). Se usa sólo para la solución final que se visualiza.
+    """
+    return [
+        {**tarea, "recarga_previa": estaciones_carga[recargas[i]] if recargas[i] >= 0 else None}
+        for i, tarea in enumerate(tareas)
+    ]
+
+def calcular_tiempo_medio_entrega(individuo, tareas, drones, estaciones_carga, distancias=None):
+    if distancias is None:
+        distancias = construir_matriz_distancias(tareas, drones, estaciones_carga)
         
     rutas = decodificar_cromosoma(individuo, drones)
     
     tiempos_de_entrega = []
 
     for id_dron, id_tareas_asignadas in rutas.items():
-        posicion_actual = drones[id_dron]["posicion_inicial"]
+        origen_actual = indice_base(id_dron, distancias)
         bateria_actual = config.BATERIA_MAXIMA
 
         for id_tarea in id_tareas_asignadas:
             tiempo_tarea = 0
-            tarea = tareas_locales[id_tarea]
+            tarea = tareas[id_tarea]
 
             # --- 1. REFACTORIZACIÓN LÓGICA: Planificación del viaje ---
-            posicion_inicio_viaje = posicion_actual
+            origen_inicio_viaje = origen_actual
             
             # Se calcula la energía requerida desde la posición actual para decidir si recargar
-            L1_temporal = distancia_metros(posicion_actual, tarea["pickup"])
-            L2 = distancia_metros(tarea["pickup"], tarea["dropoff"])
+            L1_temporal = distancias["origen_pickup"][origen_actual, id_tarea]
+            L2 = distancias["pickup_dropoff"][id_tarea]
             energia_requerida_inicial = calcular_energia(L1_temporal, L2, 0, config.VELOCIDAD_DRON, tarea["peso"])
 
             # --- 2. DECISIÓN DE RECARGA ---
             if bateria_actual < energia_requerida_inicial:
                 #print(f"Tarea: {tarea['id']} Batería insuficiente, buscando estación... Necesito: {energia_requerida_inicial:.2f}, Tengo: {bateria_actual:.2f}")
-                estacion_cercana = encontrar_estacion_mas_cercana(posicion_actual, estaciones_carga)
-                dist_a_estacion = distancia_metros(posicion_actual, estacion_cercana)
-                energia_a_estacion = calcular_energia(dist_a_estacion, 0, 0, config.VELOCIDAD_DRON, 0)
+                idx_estacion, dist_a_estacion = estacion_mas_cercana(origen_actual, distancias)
 
                 # Simular viaje a la estación y recarga
-                energia_total_flota += energia_a_estacion
                 tiempo_tarea += (dist_a_estacion / config.VELOCIDAD_DRON)
                 bateria_actual = config.BATERIA_MAXIMA
                 
                 # La nueva posición de inicio del viaje es la estación
-                posicion_inicio_viaje = estacion_cercana
-                tarea["recarga_previa"] = estacion_cercana # Se modifica la copia local
+                origen_inicio_viaje = indice_estacion(idx_estacion, distancias)
 
             # --- 3. EJECUCIÓN DE LA TAREA ---
             # Se calculan L1 y la energía del viaje definitivo desde el punto de partida correcto (actual o estación)
-            L1 = distancia_metros(posicion_inicio_viaje, tarea["pickup"])
+            L1 = distancias["origen_pickup"][origen_inicio_viaje, id_tarea]
             energia_viaje_tarea = calcular_energia(L1, L2, 0, config.VELOCIDAD_DRON, tarea["peso"])
 
             # Se ejecuta la tarea
             bateria_actual -= energia_viaje_tarea
             tiempo_tarea += (L1 + L2) / config.VELOCIDAD_DRON
-            posicion_actual = tarea["dropoff"]
+            origen_actual = indice_dropoff(id_tarea, distancias)
 
             tiempos_de_entrega.append(tiempo_tarea / 60)  # en minutos
 
-    return np.mean(tiempos_de_entrega)  # promedio de todas las entregas de todos los drones
\ No newline at end of file
+    return np.mean(tiempos_de_entrega)  # promedio de todas las entregas de todos los drones
+
+# --- EVALUACIÓN VECTORIZADA DE UNA POBLACIÓN COMPLETA ---
+
+def poblacion_a_matrices(poblacion):
+    """Convierte una lista de individuos [c_i, c_ii] en una matriz de permutaciones (P, N) y una de cortes (P, K)."""
+    permutaciones = np.array([c_i for c_i, _ in poblacion], dtype=np.int64)
+    cortes = np.array([c_ii for _, c_ii in poblacion], dtype=np.int64)
+    if cortes.ndim == 1:  # Sin cortes (un solo dron)
+        cortes = cortes.reshape(len(poblacion), 0)
+    return permutaciones, cortes
+
+def decodificar_poblacion(permutaciones, cortes, num_drones):
+    """
+    Versión vectorizada de decodificar_cromosoma para toda la población.
+    Devuelve:
+        rutas        (R, Lmax) ids de tareas de cada ruta, rellenado con -1
+        fila_ind     (R,)      individuo al que pertenece cada ruta
+        fila_dron    (R,)      dron que ejecuta cada ruta
+    """
+    num_individuos, num_tareas = permutaciones.shape
+    ceros = np.zeros((num_individuos, 1), dtype=np.int64)
+    extremos = np.hstack([ceros, cortes, ceros + num_tareas])
+    num_rutas = min(extremos.shape[1] - 1, num_drones) # Igual que decodificar_cromosoma: sobran cortes --> se ignoran
+    inicios = extremos[:, :num_rutas]
+    largos = np.clip(extremos[:, 1:num_rutas + 1] - inicios, 0, None)
+
+    largo_max = int(largos.max()) if largos.size else 0
+    pasos = np.arange(largo_max)
+    posiciones = inicios[:, :, None] + pasos[None, None, :]
+    validos = pasos[None, None, :] < largos[:, :, None]
+    filas = np.arange(num_individuos)[:, None, None]
+    rutas = np.where(validos, permutaciones[filas, np.clip(posiciones, 0, max(num_tareas - 1, 0))], -1)
+
+    fila_ind = np.repeat(np.arange(num_individuos), num_rutas)
+    fila_dron = np.tile(np.arange(num_rutas), num_individuos)
+    return rutas.reshape(num_individuos * num_rutas, largo_max), fila_ind, fila_dron
+
+def simular_rutas(rutas, fila_dron, pesos, tiempos_max, distancias):
+    """
+    Simula en paralelo (con operaciones de arrays) todas las rutas recibidas, paso a paso.
+    Replica la lógica de funcion_objetivo: recarga proactiva, tareas imposibles,
+    plazos de entrega y verificación de seguridad.
+    Devuelve un dict con, por ruta: energia (J), bateria, tiempo, penalizada,
+    excede_plazo, primera_falla (paso de la primera penalización, o -1) y recargas (R, Lmax)
+    con el índice de estación usada antes de cada paso (o -1).
+    """
+    num_rutas, largo_max = rutas.shape
+    origen_pickup = distancias["origen_pickup"]
+    estacion_cercana = distancias["estacion_cercana"]
+    dist_estacion_cercana = distancias["dist_estacion_cercana"]
+    pickup_dropoff = distancias["pickup_dropoff"]
+    offset_dropoff = distancias["num_drones"]
+    offset_estacion = distancias["num_drones"] + distancias["num_tareas"]
+    v, bateria_maxima, coeficientes = config.VELOCIDAD_DRON, float(config.BATERIA_MAXIMA), coeficientes_energia()
+    registrar_eventos = events.HABILITADO
+
+    origen = fila_dron.astype(np.int64).copy() # La base del dron i es el origen i
+    bateria = np.full(num_rutas, bateria_maxima)
+    energia = np.zeros(num_rutas)
+    tiempo = np.zeros(num_rutas)
+    penalizada = np.zeros(num_rutas, dtype=bool)
+    excede_plazo = np.zeros(num_rutas, dtype=bool)
+    primera_falla = np.full(num_rutas, -1, dtype=np.int64)
+    recargas = np.full((num_rutas, largo_max), -1, dtype=np.int64)
+
+    for paso in range(largo_max):
+        tareas_paso = rutas[:, paso]
+        activas = np.flatnonzero(tareas_paso >= 0)
+        if activas.size == 0:
+            break
+        t = tareas_paso[activas]
+        o = origen[activas]
+        bat = bateria[activas]
+        L2 = pickup_dropoff[t]
+        peso = pesos[t]
+
+        # --- 1. Planificación del viaje y decisión de recarga ---
+        energia_requerida = calcular_energia(origen_pickup[o, t], L2, 0, v, peso, coeficientes)
+        necesita_recarga = bat < energia_requerida
+        idx_estacion = estacion_cercana[o]
+        dist_estacion = dist_estacion_cercana[o]
+        energia_a_estacion = calcular_energia(dist_estacion, 0, 0, v, 0, coeficientes)
+
+        sin_bateria_estacion = necesita_recarga & (bat < energia_a_estacion)
+        recarga = necesita_recarga & ~sin_bateria_estacion
+        energia[activas] += np.where(recarga, energia_a_estacion, 0)
+        tiempo[activas] += np.where(recarga, dist_estacion / v, 0)
+        bat = np.where(recarga, bateria_maxima, bat)
+        inicio_viaje = np.where(recarga, offset_estacion + idx_estacion, o)
+        recargas[activas, paso] = np.where(recarga, idx_estacion, -1)
+
+        # --- 2. Ejecución de la tarea ---
+        L1 = origen_pickup[inicio_viaje, t]
+        energia_viaje = calcular_energia(L1, L2, 0, v, peso, coeficientes)
+        imposible = ~sin_bateria_estacion & (bat < energia_viaje)
+        ejecuta = ~sin_bateria_estacion & ~imposible
+
+        energia[activas] += np.where(ejecuta, energia_viaje, 0)
+        bat = np.where(ejecuta, bat - energia_viaje, bat)
+        tiempo[activas] += np.where(ejecuta, (L1 + L2) / v, 0)
+        origen[activas] = np.where(ejecuta, offset_dropoff + t, o)
+        bateria[activas] = bat
+
+        # --- 3. Plazo de entrega y verificación de seguridad ---
+        fuera_de_plazo = ejecuta & (tiempo[activas] > tiempos_max[t])
+        dist_segura = dist_estacion_cercana[origen[activas]]
+        inseguro = ejecuta & (bat < calcular_energia(dist_segura, 0, 0, v, 0, coeficientes))
+
+        falla = sin_bateria_estacion | imposible | fuera_de_plazo | inseguro
+        excede_plazo[activas] |= fuera_de_plazo
+        primera_falla[activas] = np.where(falla & ~penalizada[activas], paso, primera_falla[activas])
+        penalizada[activas] |= falla
+
+        if registrar_eventos:
+            events.registrar("recargas", np.count_nonzero(recarga))
+            events.registrar("penalizacion_sin_bateria_estacion", np.count_nonzero(sin_bateria_estacion))
+            events.registrar("penalizacion_tarea_imposible", np.count_nonzero(imposible))
+            events.registrar("penalizacion_plazo", np.count_nonzero(fuera_de_plazo))
+            events.registrar("penalizacion_seguridad", np.count_nonzero(inseguro))
+
+    return {
+        "energia": energia,
+        "bateria": bateria,
+        "tiempo": tiempo,
+        "penalizada": penalizada,
+        "excede_plazo": excede_plazo,
+        "primera_falla": primera_falla,
+        "recargas": recargas,
+    }
+
+def simular_lista_rutas(rutas, drones_rutas, pesos, tiempos_max, distancias):
+    """simular_rutas sobre una lista de rutas de distinto largo (arrays o listas de ids de tareas)."""
+    largo = max(1, max(len(ruta) for ruta in rutas))
+    matriz = np.full((len(rutas), largo), -1, dtype=np.int64)
+    for fila, ruta in enumerate(rutas):
+        matriz[fila, :len(ruta)] = ruta
+    return simular_rutas(matriz, np.asarray(drones_rutas, dtype=np.int64), pesos, tiempos_max, distancias)
+
+def simular_rutas_con_cache(rutas, fila_dron, pesos, tiempos_max, distancias, cache_rutas):
+    """
+    Igual que simular_rutas, pero sólo simula las rutas que no están en cache_rutas (CacheRutas).
+    Tras una mutación o un cruce la mayoría de las rutas de un hijo son idénticas a las de sus
+    padres, así que en general sólo se re-simulan las una o dos rutas que cambiaron.
+    """
+    num_rutas, largo_max = rutas.shape
+    claves = cache_rutas.claves(rutas, fila_dron)
+    resultado = {
+        "energia": np.zeros(num_rutas),
+        "bateria": np.zeros(num_rutas),
+        "tiempo": np.zeros(num_rutas),
+        "penalizada": np.zeros(num_rutas, dtype=bool),
+        "excede_plazo": np.zeros(num_rutas, dtype=bool),
+        "recargas": np.full((num_rutas, largo_max), -1, dtype=np.int64),
+    }
+
+    # Rutas repetidas dentro de la misma población se simulan una sola vez
+    faltantes = {}
+    for r, clave in enumerate(claves):
+        if clave in faltantes:
+            faltantes[clave].append(r)
+            continue
+        guardado = cache_rutas.obtener(clave)
+        if guardado is None:
+            faltantes[clave] = [r]
+            continue
+        energia, bateria, tiempo, penalizada, excede_plazo, recargas = guardado
+        resultado["energia"][r] = energia
+        resultado["bateria"][r] = bateria
+        resultado["tiempo"][r] = tiempo
+        resultado["penalizada"][r] = penalizada
+        resultado["excede_plazo"][r] = excede_plazo
+        resultado["recargas"][r, :recargas.size] = recargas
+
+    if events.HABILITADO:
+        events.registrar("rutas_cacheadas", num_rutas - sum(len(filas) for filas in faltantes.values()))
+    if not faltantes:
+        return resultado
+
+    primeras = np.array([filas[0] for filas in faltantes.values()])
+    largos = (rutas[primeras] >= 0).sum(axis=1)
+    nuevas = simular_rutas(rutas[primeras, :int(largos.max())], fila_dron[primeras], pesos, tiempos_max, distancias)
+    for k, (clave, filas) in enumerate(faltantes.items()):
+        valor = tuple(nuevas[campo][k] for campo in ("energia", "bateria", "tiempo", "penalizada", "excede_plazo"))
+        recargas = nuevas["recargas"][k, :largos[k]].copy()
+        cache_rutas.guardar(clave, (*valor, recargas))
+        for r in filas:
+            for campo, dato in zip(("energia", "bateria", "tiempo", "penalizada", "excede_plazo"), valor):
+                resultado[campo][r] = dato
+            resultado["recargas"][r, :recargas.size] = recargas
+    return resultado
+
+def evaluar_poblacion(permutaciones, cortes, tareas, drones, estaciones_carga, distancias=None, devolver_recargas=False,
+                      cache_rutas=None):
+    """
+    Evalúa toda la población de una vez (equivalente a llamar funcion_objetivo para cada individuo).
+    Recibe la matriz de permutaciones (P, N) y la de cortes (P, K).
+    Si se pasa cache_rutas (CacheRutas) sólo se simulan las rutas de drones que no se vieron antes.
+    Devuelve el vector de energías en MJ (0 para individuos penalizados) y, opcionalmente,
+    una matriz (P, N) con la estación de recarga previa a cada tarea (-1 si no recarga).
+    """
+    if distancias is None:
+        distancias = construir_matriz_distancias(tareas, drones, estaciones_carga)
+    _, _, pesos, tiempos_max = arrays_tareas(tareas) # Sin recorrer dicts si tareas es la vista de un Escenario
+
+    num_individuos = permutaciones.shape[0]
+    rutas, fila_ind, fila_dron = decodificar_poblacion(permutaciones, cortes, len(drones))
+    if cache_rutas is not None:
+        resultado = simular_rutas_con_cache(rutas, fila_dron, pesos, tiempos_max, distancias, cache_rutas)
+    else:
+        resultado = simular_rutas(rutas, fila_dron, pesos, tiempos_max, distancias)
+
+    energias = np.bincount(fila_ind, weights=resultado["energia"], minlength=num_individuos)
+    penalizados = np.bincount(fila_ind, weights=resultado["penalizada"], minlength=num_individuos) > 0
+    energias = np.where(penalizados, 0.0, energias) / 1e6
+    if events.HABILITADO:
+        events.registrar("evaluaciones", num_individuos)
+        events.registrar("individuos_inviables", np.count_nonzero(penalizados))
+
+    if not devolver_recargas:
+        return energias
+
+    recargas = np.full((num_individuos, len(tareas)), -1, dtype=np.int64)
+    validos = rutas >= 0
+    filas = np.broadcast_to(fila_ind[:, None], rutas.shape)
+    recargas[filas[validos], rutas[validos]] = resultado["recargas"][validos]
+    return energias, recargas
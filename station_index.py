@@ -0,0 +1,89 @@
+# Índice espacial (KD-tree) sobre las estaciones de carga para encontrar la más cercana
+# a un punto sin recorrer todas las estaciones.
+import numpy as np
+from points_generator import distancias_metros_matriz
+
+R_TIERRA = 6371000  # Radio de la Tierra en metros (el mismo que usa distancia_metros)
+
+class IndiceEstaciones:
+    """
+    KD-tree sobre las estaciones proyectadas a un plano local (equirectangular, en metros).
+    La búsqueda en el plano sólo preselecciona candidatas; la distancia final se calcula
+    con haversine, por lo que el resultado coincide con un np.argmin sobre todas las estaciones.
+    """
+
+    TAMANO_HOJA = 8
+    TOLERANCIA = 0.01  # Margen relativo entre la distancia proyectada y la haversine (sobra a escala ciudad)
+
+    def __init__(self, estaciones):
+        self.estaciones = np.asarray(estaciones, dtype=float).reshape(-1, 2)
+        if len(self.estaciones) == 0:
+            raise ValueError("Se necesita al menos una estación de carga para construir el índice.")
+        self._lat0 = np.radians(self.estaciones[:, 0].mean())
+        self._xy = self._proyectar(self.estaciones)
+        self._raiz = self._construir(np.arange(len(self.estaciones)), 0)
+
+    def _proyectar(self, coords):
+        """Proyecta coordenadas (lat, lon) a metros en un plano tangente a la latitud media."""
+        coords = np.radians(np.asarray(coords, dtype=float).reshape(-1, 2))
+        return np.column_stack([R_TIERRA * np.cos(self._lat0) * coords[:, 1], R_TIERRA * coords[:, 0]])
+
+    def _construir(self, indices, profundidad):
+        """Nodo hoja: ("hoja", indices). Nodo interno: (eje, corte, izquierdo, derecho)."""
+        if len(indices) <= self.TAMANO_HOJA:
+            return ("hoja", indices)
+        eje = profundidad % 2
+        valores = self._xy[indices, eje]
+        orden = np.argsort(valores, kind="stable")
+        mitad = len(indices) // 2
+        corte = valores[orden[mitad]]
+        return (eje, corte,
+                self._construir(indices[orden[:mitad]], profundidad + 1),
+                self._construir(indices[orden[mitad:]], profundidad + 1))
+
+    def _vecino_proyectado(self, nodo, punto, mejor):
+        """Distancia proyectada al vecino más cercano (poda de ramas más lejanas que el mejor actual)."""
+        if nodo[0] == "hoja":
+            d = np.hypot(*(self._xy[nodo[1]] - punto).T).min()
+            return min(mejor, d)
+        eje, corte, izquierdo, derecho = nodo
+        diferencia = punto[eje] - corte
+        cerca, lejos = (izquierdo, derecho) if diferencia < 0 else (derecho, izquierdo)
+        mejor = self._vecino_proyectado(cerca, punto, mejor)
+        if abs(diferencia) <= mejor:
+            mejor = self._vecino_proyectado(lejos, punto, mejor)
+        return mejor
+
+    def _en_radio(self, nodo, punto, radio, encontrados):
+        """Agrega a `encontrados` los índices de estaciones a distancia proyectada <= radio."""
+        if nodo[0] == "hoja":
+            d = np.hypot(*(self._xy[nodo[1]] - punto).T)
+            encontrados.extend(nodo[1][d <= radio].tolist())
+            return
+        eje, corte, izquierdo, derecho = nodo
+        diferencia = punto[eje] - corte
+        if diferencia - radio < 0:
+            self._en_radio(izquierdo, punto, radio, encontrados)
+        if diferencia + radio >= 0:
+            self._en_radio(derecho, punto, radio, encontrados)
+
+    def mas_cercana(self, punto):
+        """Devuelve (índice, distancia en metros) de la estación más cercana a un punto (lat, lon)."""
+        idx, dist = self.mas_cercanas([punto])
+        return int(idx[0]), dist[0]
+
+    def mas_cercanas(self, puntos):
+        """Versión por lotes de mas_cercana: devuelve arrays de índices y distancias en metros."""
+        puntos = np.asarray(puntos, dtype=float).reshape(-1, 2)
+        proyectados = self._proyectar(puntos)
+        indices = np.zeros(len(puntos), dtype=np.int64)
+        distancias = np.zeros(len(puntos))
+        for i, punto in enumerate(proyectados):
+            radio = self._vecino_proyectado(self._raiz, punto, np.inf) * (1 + self.TOLERANCIA) + 1.0
+            candidatas = []
+            self._en_radio(self._raiz, punto, radio, candidatas)
+            candidatas = np.sort(candidatas) # Ante empates gana el menor índice, igual que np.argmin
+            d = distancias_metros_matriz(puntos[i], self.estaciones[candidatas])[0]
+            mejor = int(np.argmin(d))
+            indices[i], distancias[i] = candidatas[mejor], d[mejor]
+        return indices, distancias
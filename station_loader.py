@@ -0,0 +1,135 @@
+# Carga de las estaciones de carga sin red ni osmnx: se leen directamente las respuestas de Overpass
+# que osmnx ya dejó en cache/ (amenity=fuel), se filtran por polígono, se eliminan duplicados y el
+# resultado se guarda como .npy identificado por el hash del polígono y el de las respuestas (nombre,
+# fecha de modificación y tamaño), así las corridas siguientes sólo leen un array y una respuesta
+# actualizada genera un .npy nuevo. osmnx se usa únicamente si se pide (usar_osmnx / ESTACIONES_OSMNX) y no hay datos.
+import glob
+import hashlib
+import json
+import logging
+import os
+import threading
+import numpy as np
+import config
+from points_generator import puntos_en_poligono
+
+logger = logging.getLogger(__name__)
+
+DIRECTORIO_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+
+def clave_poligono(poligono):
+    """Hash corto y estable de las coordenadas del polígono (redondeadas a 1e-7 grados)."""
+    coords = np.round(np.asarray(poligono, dtype=float), 7)
+    return hashlib.sha1(coords.tobytes()).hexdigest()[:16]
+
+def _respuestas_overpass(directorio):
+    return sorted(glob.glob(os.path.join(directorio, "*.json")))
+
+def clave_fuentes(directorio=DIRECTORIO_CACHE):
+    """Hash corto de las respuestas de Overpass del directorio (nombre, mtime y tamaño de cada una)."""
+    firma = hashlib.sha1()
+    for ruta in _respuestas_overpass(directorio):
+        estado = os.stat(ruta)
+        firma.update(f"{os.path.basename(ruta)}:{estado.st_mtime_ns}:{estado.st_size};".encode())
+    return firma.hexdigest()[:16]
+
+def _centroide(coords):
+    """Centroide (lat, lon) de un anillo cerrado (fórmula del área, como shapely) o promedio si es una línea."""
+    coords = np.asarray(coords, dtype=float)
+    if len(coords) >= 4 and np.array_equal(coords[0], coords[-1]):
+        lat, lon = coords[:, 0], coords[:, 1]
+        cruz = lon[:-1] * lat[1:] - lon[1:] * lat[:-1]
+        area = cruz.sum() / 2
+        if abs(area) > 1e-18:
+            return [((lat[:-1] + lat[1:]) * cruz).sum() / (6 * area), ((lon[:-1] + lon[1:]) * cruz).sum() / (6 * area)]
+    return coords.mean(axis=0).tolist()
+
+def estaciones_desde_overpass(datos):
+    """
+    Coordenadas [lat, lon] de los elementos amenity=fuel de una respuesta de Overpass:
+    los nodos tal cual y las vías (playas de estacionamiento, techos) por su centroide.
+    """
+    elementos = datos.get("elements", [])
+    nodos = {e["id"]: (e["lat"], e["lon"]) for e in elementos if e.get("type") == "node" and "lat" in e}
+    coords = []
+    for elemento in elementos:
+        if elemento.get("tags", {}).get("amenity") != "fuel":
+            continue
+        if elemento["type"] == "node":
+            coords.append(nodos[elemento["id"]])
+        elif elemento["type"] == "way":
+            vertices = [nodos[n] for n in elemento.get("nodes", []) if n in nodos]
+            if vertices:
+                coords.append(_centroide(vertices))
+    return np.asarray(coords, dtype=float).reshape(-1, 2)
+
+def _filtrar(coords, poligono):
+    """Puntos dentro del polígono, sin duplicados y en el orden en que aparecieron."""
+    coords = coords[puntos_en_poligono(coords, poligono)]
+    _, primeros = np.unique(np.round(coords, 7), axis=0, return_index=True)
+    return coords[np.sort(primeros)]
+
+def leer_cache_overpass(poligono, directorio=DIRECTORIO_CACHE):
+    """Estaciones dentro del polígono según todas las respuestas de Overpass guardadas en el directorio."""
+    coords = []
+    for ruta in _respuestas_overpass(directorio):
+        try:
+            with open(ruta, encoding="utf-8") as archivo:
+                datos = json.load(archivo)
+        except (OSError, ValueError):
+            logger.warning("No se pudo leer %s como respuesta de Overpass", ruta)
+            continue
+        if isinstance(datos, dict) and "elements" in datos:
+            coords.append(estaciones_desde_overpass(datos))
+    if not coords:
+        return np.empty((0, 2))
+    return _filtrar(np.vstack(coords), poligono)
+
+def _descargar_con_osmnx(poligono, directorio):
+    """Consulta Overpass con osmnx (requiere red) dejando la respuesta en el directorio de cache."""
+    import osmnx as ox
+    import shapely.geometry as geom
+    ox.settings.use_cache = True
+    ox.settings.cache_folder = directorio
+    ox.features_from_polygon(geom.Polygon([(lon, lat) for lat, lon in poligono]), {"amenity": "fuel"})
+
+def cargar_estaciones(poligono=None, directorio=DIRECTORIO_CACHE, usar_osmnx=None):
+    """
+    Array (S, 2) [lat, lon] con las estaciones de carga dentro del polígono.
+    Orden de búsqueda: estaciones_<hash del polígono>_<hash de las respuestas>.npy ya procesado ->
+    respuestas de Overpass en el directorio -> osmnx (sólo si usar_osmnx, por defecto
+    config.ESTACIONES_OSMNX). El resultado se guarda como .npy y reemplaza a los de respuestas
+    anteriores; si ya no hay respuestas en el directorio se usa el último .npy del polígono.
+    """
+    poligono = config.POLIGONO_ROSARIO if poligono is None else poligono
+    usar_osmnx = config.ESTACIONES_OSMNX if usar_osmnx is None else usar_osmnx
+    prefijo = os.path.join(directorio, f"estaciones_{clave_poligono(poligono)}_")
+    ruta_npy = f"{prefijo}{clave_fuentes(directorio)}.npy"
+    if os.path.exists(ruta_npy):
+        return np.load(ruta_npy)
+    anteriores = glob.glob(f"{prefijo}*.npy")
+    if anteriores and not _respuestas_overpass(directorio):
+        return np.load(max(anteriores, key=os.path.getmtime))
+
+    estaciones = leer_cache_overpass(poligono, directorio)
+    if len(estaciones) == 0 and usar_osmnx:
+        logger.info("No hay estaciones en %s: se consultan con osmnx", directorio)
+        _descargar_con_osmnx(poligono, directorio)
+        estaciones = leer_cache_overpass(poligono, directorio)
+        ruta_npy = f"{prefijo}{clave_fuentes(directorio)}.npy"
+    if len(estaciones) == 0:
+        raise ValueError(f"No se encontraron estaciones de carga para el polígono en {directorio}. "
+                         "Defina config.ESTACIONES_DE_CARGA o habilite config.ESTACIONES_OSMNX.")
+
+    os.makedirs(directorio, exist_ok=True)
+    temporal = f"{ruta_npy}.{os.getpid()}.{threading.get_ident()}.tmp" # No coincide con el patrón de los .npy
+    with open(temporal, "wb") as archivo:
+        np.save(archivo, estaciones)
+    os.replace(temporal, ruta_npy) # Atómico: otra corrida concurrente nunca lee un archivo a medio escribir
+    for anterior in anteriores:
+        if anterior != ruta_npy:
+            try:
+                os.remove(anterior) # Procesado con respuestas que ya cambiaron
+            except OSError:
+                pass
+    return estaciones
@@ -0,0 +1,65 @@
+# Criterios de parada del algoritmo genético además de NUM_GENERACIONES:
+# - convergencia: la mejor energía no mejora más de EPSILON durante NCONV generaciones seguidas.
+# - presupuesto de tiempo: no se empieza una generación si TIEMPO_MAXIMO_SEGUNDOS ya venció (agotado(),
+#   también antes de la primera y en cada generación de las islas) o si terminaría después (estimado con
+#   la duración media). Una generación en curso no se interrumpe: el presupuesto es blando y una corrida
+#   se puede pasar a lo sumo en una generación (modo "anytime": se devuelve la mejor solución hallada).
+import time
+import config
+
+class CriterioParada:
+    """
+    Lleva la cuenta de generaciones sin mejora y del tiempo consumido.
+    El presupuesto de tiempo corre desde que se crea (incluye armar el escenario); se llama a
+    comenzar_generaciones() justo antes del bucle, a agotado() antes de cada generación y a
+    registrar() después de cada generación (o época de islas) con la mejor energía global.
+    """
+
+    def __init__(self, epsilon=None, nconv=None, tiempo_maximo=None):
+        self.epsilon = epsilon if epsilon is not None else config.EPSILON
+        self.nconv = nconv if nconv is not None else config.NCONV
+        self.tiempo_maximo = tiempo_maximo if tiempo_maximo is not None else config.TIEMPO_MAXIMO_SEGUNDOS
+        self.inicio = time.monotonic()
+        self._inicio_generaciones = self.inicio
+        self.generaciones = 0
+        self._mejor = None
+        self.generaciones_sin_mejora = 0
+        self.motivo = None
+
+    def transcurrido(self):
+        return time.monotonic() - self.inicio
+
+    def limite(self):
+        """Instante (time.monotonic(), el mismo reloj en todos los procesos) en que vence el presupuesto, o None."""
+        return None if self.tiempo_maximo is None else self.inicio + self.tiempo_maximo
+
+    def agotado(self):
+        """True (con motivo "tiempo") si el presupuesto ya venció; se consulta antes de empezar cada generación."""
+        if self.tiempo_maximo is not None and self.transcurrido() >= self.tiempo_maximo:
+            self.motivo = "tiempo"
+            return True
+        return False
+
+    def comenzar_generaciones(self):
+        """Marca el inicio del bucle de generaciones (para estimar cuánto tarda cada una)."""
+        self._inicio_generaciones = time.monotonic()
+
+    def registrar(self, mejor_energia, generaciones=1):
+        """
+        Registra el resultado de `generaciones` generaciones. Devuelve el motivo para detenerse
+        ("convergencia" o "tiempo") o None si se puede seguir.
+        """
+        self.generaciones += generaciones
+        duracion_generacion = (time.monotonic() - self._inicio_generaciones) / self.generaciones
+
+        if mejor_energia is not None and (self._mejor is None or self._mejor - mejor_energia > self.epsilon):
+            self._mejor = mejor_energia
+            self.generaciones_sin_mejora = 0
+        else:
+            self.generaciones_sin_mejora += generaciones
+
+        if self.nconv and self.generaciones_sin_mejora >= self.nconv:
+            self.motivo = "convergencia"
+        elif self.tiempo_maximo is not None and self.transcurrido() + generaciones * duracion_generacion > self.tiempo_maximo:
+            self.motivo = "tiempo" # El próximo paso (estimado con la duración media) se pasaría del presupuesto
+        return self.motivo
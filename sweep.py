@@ -0,0 +1,112 @@
+# Ejecuta un barrido de corridas (combinaciones de parámetros) en procesos separados.
+# Cada corrida tiene su propia copia de config (los overrides no se pisan entre corridas),
+# su propia semilla y un tiempo máximo; el avance se informa a medida que terminan.
+import logging
+import multiprocessing as mp
+import os
+import random
+import signal
+import time
+from multiprocessing.connection import wait
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+def _ejecutar_corrida(conexion, funcion, params, semilla, generar_salidas, sufijo_salidas):
+    """Cuerpo del proceso hijo: fija la semilla, corre la optimización y envía los KPIs por la conexión."""
+    _grupo_propio(0)
+    if funcion is None:
+        import main # Import diferido: main importa este módulo
+        funcion = main.run_optimization
+    random.seed(semilla)
+    np.random.seed(semilla % 2**32)
+    try:
+        kpis = funcion(params=params, verbose=False, generar_salidas=generar_salidas, sufijo_salidas=sufijo_salidas)
+        status = "inviable" if kpis.get("parametros_inviables", True) else "ok"
+        conexion.send({**kpis, "status": status})
+    except Exception as e:
+        logger.exception("⚠️ Error en la corrida con parámetros %s", params)
+        conexion.send({"params": params, "status": "error", "error": repr(e)})
+    finally:
+        conexion.close()
+
+def _grupo_propio(pid):
+    """
+    Pone al proceso pid (0 = el actual) en un grupo de procesos propio. Los workers que la corrida
+    lance (evaluación paralela, islas, grupos) heredan el grupo y se terminan con ella al vencer el timeout.
+    Lo llaman el hijo y el padre, así el grupo existe sin importar quién llegue primero.
+    """
+    if hasattr(os, "setpgid"):
+        try:
+            os.setpgid(pid, pid)
+        except OSError: # El hijo ya terminó (o ya es líder de su grupo)
+            pass
+
+def _terminar(proceso):
+    """Termina la corrida junto con todo su grupo de procesos (sólo el proceso donde no hay grupos)."""
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(proceso.pid, signal.SIGTERM)
+            return
+        except OSError:
+            pass
+    proceso.terminate()
+
+def _resultado_vacio(params, status):
+    return {"params": params, "status": status, "mejor_energia": None, "tiempo_medio_entrega": None}
+
+def ejecutar_barrido(corridas, max_procesos=None, timeout=None, semilla=None, generar_salidas=False, funcion=None):
+    """
+    Corre cada dict de parámetros de `corridas` en un proceso propio, con hasta max_procesos a la vez.
+    - timeout: segundos máximos por corrida; las que se pasan se terminan (con los procesos que
+      hayan lanzado) y quedan con status "timeout".
+    - semilla: semilla base del barrido; cada corrida recibe una derivada (queda en el resultado).
+    - generar_salidas: si es True cada corrida guarda sus gráficos, mapa y tiempos con el sufijo
+      "_corrida<n>" (n desde 1, en el orden de `corridas`), así las corridas concurrentes no pisan archivos.
+    - funcion: función a correr con (params, verbose, generar_salidas, sufijo_salidas); por defecto main.run_optimization.
+    Devuelve la lista de resultados en el mismo orden que `corridas`.
+    """
+    max_procesos = max_procesos or mp.cpu_count()
+    generador = random.Random(semilla)
+    semillas = [generador.randrange(2**32) for _ in corridas]
+    resultados = [None] * len(corridas)
+    pendientes = list(range(len(corridas)))
+    en_curso = {} # conexión -> (índice, proceso, instante de inicio)
+    terminadas = 0
+
+    while pendientes or en_curso:
+        while pendientes and len(en_curso) < max_procesos:
+            i = pendientes.pop(0)
+            receptor, emisor = mp.Pipe(duplex=False)
+            proceso = mp.Process(target=_ejecutar_corrida, args=(emisor, funcion, corridas[i], semillas[i], generar_salidas, f"_corrida{i + 1}"))
+            proceso.start()
+            _grupo_propio(proceso.pid)
+            emisor.close()
+            en_curso[receptor] = (i, proceso, time.monotonic())
+            logger.info("▶ Corrida %d/%d iniciada con parámetros: %s", i + 1, len(corridas), corridas[i])
+
+        listas = wait(list(en_curso), timeout=1.0)
+        ahora = time.monotonic()
+        for receptor in list(en_curso):
+            i, proceso, inicio = en_curso[receptor]
+            if receptor in listas:
+                try:
+                    resultado = receptor.recv()
+                except EOFError: # El proceso murió sin enviar resultado
+                    resultado = _resultado_vacio(corridas[i], "error")
+            elif timeout is not None and ahora - inicio > timeout:
+                _terminar(proceso)
+                resultado = _resultado_vacio(corridas[i], "timeout")
+            else:
+                continue
+
+            proceso.join()
+            receptor.close()
+            del en_curso[receptor]
+            resultados[i] = {**_resultado_vacio(corridas[i], resultado["status"]), **resultado,
+                             "semilla": semillas[i], "duracion_s": ahora - inicio}
+            terminadas += 1
+            logger.info("[%d/%d] Corrida %d terminada: %s (%.1f s)", terminadas, len(corridas), i + 1,
+                        resultado["status"], ahora - inicio)
+
+    return resultados
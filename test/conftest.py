@@ -0,0 +1,44 @@
+# Fixtures compartidas: el escenario chico de 5 tareas, 2 drones y 2 estaciones, poblaciones aleatorias
+# sobre él y escenarios aleatorios más grandes. Cada test recibe listas nuevas, así puede modificarlas.
+import random
+import pytest
+
+PICKUPS = [[-32.95725661118796, -60.664089752558695], [-32.957177017243424, -60.66344776867995], [-32.96272183853973, -60.66912792002945], [-32.95402077807787, -60.636839227537216], [-32.93771002752342, -60.67211530315638]]
+DROPOFFS = [[-32.96257969995565, -60.67041521218382], [-32.939790781520344, -60.67356570157502], [-32.92648716696396, -60.67168846440852], [-32.959862113511015, -60.63135871248699], [-32.944088634078604, -60.67536088272771]]
+
+@pytest.fixture
+def tareas():
+    return [{"id": i, "pickup": PICKUPS[i], "dropoff": DROPOFFS[i], "peso": 1 + i * 0.3, "tiempo_max": 3600 + 600 * i, "recarga_previa": None} for i in range(5)]
+
+@pytest.fixture
+def drones():
+    return [{"id": 0, "posicion_inicial": [-32.9543, -60.675]}, {"id": 1, "posicion_inicial": [-32.9456, -60.6440]}]
+
+@pytest.fixture
+def estaciones():
+    return [[-32.936780, -60.6455], [-32.955500, -60.649813]]
+
+@pytest.fixture
+def crear_poblacion(tareas):
+    """crear_poblacion(cantidad, seed=0): individuos [c_i, c_ii] aleatorios sobre `tareas` con dos rutas."""
+    def crear(cantidad, seed=0):
+        rng = random.Random(seed)
+        poblacion = []
+        for _ in range(cantidad):
+            c_i = list(range(len(tareas)))
+            rng.shuffle(c_i)
+            poblacion.append([c_i, [rng.randint(1, len(tareas) - 1)]])
+        return poblacion
+    return crear
+
+@pytest.fixture
+def crear_escenario():
+    """crear_escenario(num_tareas, num_drones, seed=0): (tareas, drones) aleatorios dentro de Rosario."""
+    def crear(num_tareas, num_drones, seed=0):
+        rng = random.Random(seed)
+        punto = lambda: [rng.uniform(-32.965, -32.930), rng.uniform(-60.68, -60.63)]
+        tareas_grandes = [{"id": i, "pickup": punto(), "dropoff": punto(), "peso": rng.uniform(0.5, 2.7),
+                           "tiempo_max": rng.uniform(3600, 5400), "recarga_previa": None} for i in range(num_tareas)]
+        drones_grandes = [{"id": d, "posicion_inicial": punto()} for d in range(num_drones)]
+        return tareas_grandes, drones_grandes
+    return crear
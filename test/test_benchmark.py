@@ -0,0 +1,33 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import copy
+import benchmark
+
+def test_ejecutar_mide_todas_las_metricas():
+    resultado = benchmark.ejecutar([12], tiempo_minimo=0.0, repeticiones=1)
+    metricas = resultado["resultados"]["12"]
+    assert {"funcion_objetivo", "evaluar_poblacion", "cruce_pmx", "swap_mutation", "cuts_mutation", "procesar_generacion"} <= set(metricas)
+    assert all(metrica["valor"] > 0 for metrica in metricas.values())
+
+def test_comparar_marca_regresiones_segun_el_sentido_de_la_metrica():
+    baseline = {"resultados": {"60": {
+        "funcion_objetivo": {"valor": 1000.0, "unidad": "eval/s", "mayor_es_mejor": True},
+        "procesar_generacion": {"valor": 1.0, "unidad": "s", "mayor_es_mejor": False},
+    }}}
+    actual = copy.deepcopy(baseline)
+    actual["resultados"]["60"]["funcion_objetivo"]["valor"] = 1500.0 # Mejora
+    actual["resultados"]["60"]["procesar_generacion"]["valor"] = 1.5 # Empeora 50%
+    regresiones = benchmark.comparar(actual, baseline, tolerancia=0.2)
+    assert [r["metrica"] for r in regresiones] == ["procesar_generacion"]
+    assert benchmark.comparar(actual, baseline, tolerancia=0.6) == []
+
+def test_linea_base_se_guarda_y_se_compara(tmp_path):
+    ruta = str(tmp_path / "baseline.json")
+    argumentos = ["--tamanos", "12", "--tiempo-minimo", "0", "--repeticiones", "1", "--baseline", ruta]
+    assert benchmark.main(argumentos + ["--actualizar"]) == 0
+    assert "12" in benchmark.cargar(ruta)["resultados"]
+    assert benchmark.main(argumentos + ["--tolerancia", "1000"]) == 0
@@ -0,0 +1,86 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import threading
+import types
+import pytest
+import config
+import problem_setup as ps
+
+def test_configuracion_es_inmutable():
+    configuracion = config.actual()
+    with pytest.raises(AttributeError):
+        configuracion.NUM_TAREAS = 3
+    nueva = configuracion.reemplazar(NUM_TAREAS=3)
+    assert nueva.NUM_TAREAS == 3 and configuracion.NUM_TAREAS == config.NUM_TAREAS
+    with pytest.raises(ValueError):
+        configuracion.reemplazar(TIEMPO_MIN=3) # Parámetro inexistente
+
+def test_n_best_y_k_torneo_siguen_al_tamano_de_poblacion():
+    with config.usar(TAMANO_POBLACION=400):
+        assert (config.N_BEST, config.K_TORNEO) == (200, 300)
+    with config.usar(TAMANO_POBLACION=400, N_BEST=7): # Explícito gana
+        assert (config.N_BEST, config.K_TORNEO) == (7, 300)
+
+def test_usar_activa_la_configuracion_solo_dentro_del_bloque():
+    original = config.NUM_TAREAS
+    with config.usar(NUM_TAREAS=original + 7) as configuracion:
+        assert config.NUM_TAREAS == configuracion.NUM_TAREAS == original + 7
+        with pytest.raises(AttributeError):
+            config.NUM_TAREAS = 1 # Dentro de una corrida no se modifica el módulo
+        with config.usar(NUM_DRONES=2): # Anidada: parte de la corrida activa
+            assert (config.NUM_TAREAS, config.NUM_DRONES) == (original + 7, 2)
+    assert config.NUM_TAREAS == original
+    assert type(sys.modules["config"]) is types.ModuleType # Sin corridas activas no hay costo por lectura
+
+def test_corridas_en_hilos_no_se_pisan():
+    barrera = threading.Barrier(2)
+    resultados = {}
+
+    def correr(num_tareas, plazo_min):
+        with config.usar(NUM_TAREAS=num_tareas, TIEMPO_MIN_MIN=plazo_min, TIEMPO_MAX_MIN=plazo_min):
+            barrera.wait() # Las dos corridas activas a la vez
+            tareas = ps.generar_tareas(config.NUM_TAREAS, config.POLIGONO_ROSARIO)
+            barrera.wait()
+            resultados[num_tareas] = (config.NUM_TAREAS, len(tareas), {t["tiempo_max"] for t in tareas})
+
+    hilos = [threading.Thread(target=correr, args=args) for args in [(5, 100), (9, 200)]]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert resultados[5] == (5, 5, {6000})
+    assert resultados[9] == (9, 9, {12000})
+
+def test_eventos_y_tiempos_de_corridas_en_hilos_no_se_mezclan():
+    import events
+    import main
+    import timing
+    errores, kpis = [], {}
+
+    def correr(num_generaciones):
+        try:
+            kpis[num_generaciones] = main.run_optimization(
+                {"NUM_TAREAS": 8, "NUM_DRONES": 3, "TIEMPO_MIN_MIN": 600, "TIEMPO_MAX_MIN": 700, "TAMANO_POBLACION": 10,
+                 "NUM_GENERACIONES": num_generaciones, "NCONV": None, "TIEMPO_MAXIMO_SEGUNDOS": None,
+                 "REGISTRAR_EVENTOS": True, "REGISTRAR_TIEMPOS": True, "NUM_ISLAS": 1, "NUM_GRUPOS": 1, "NUM_PROCESOS": 1},
+                verbose=False, generar_salidas=False)
+        except Exception as error:
+            errores.append(error)
+
+    hilos = [threading.Thread(target=correr, args=(num_generaciones,)) for num_generaciones in (3, 4, 5, 6)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert not errores
+    assert sorted(kpis) == [3, 4, 5, 6]
+    for resultado in kpis.values():
+        generaciones = list(range(1, resultado["generaciones"] + 1))
+        assert len(generaciones) > 1
+        assert [fila["generacion"] for fila in resultado["tiempos"]] == generaciones
+        assert [fila["generacion"] for fila in resultado["eventos"]] == generaciones
+    assert timing.HABILITADO and not events.HABILITADO # El registro global del proceso no se tocó
@@ -0,0 +1,50 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import random
+import numpy as np
+import config
+import genetic_algorithm as ga
+import simulation as sim
+import utils.construction as construction
+from distance_matrix import construir_matriz_distancias
+
+def test_heuristicas_devuelven_cromosomas_validos(tareas, drones, estaciones):
+    tiempos_max = np.array([tarea["tiempo_max"] for tarea in tareas], dtype=float)
+    distancias = construir_matriz_distancias(tareas, drones, estaciones)
+    for heuristica in construction.HEURISTICAS.values():
+        for aleatoria in (False, True):
+            rutas = heuristica(tiempos_max, len(drones), distancias, aleatoria)
+            assert len(rutas) == len(drones)
+            assert sorted(t for ruta in rutas for t in ruta) == list(range(len(tareas)))
+            individuo = construction.a_individuo(rutas)
+            assert len(individuo.c_ii) == len(drones) - 1
+            assert 1 <= individuo.c_ii.min() and individuo.c_ii.max() <= len(tareas) - 1
+
+def test_a_individuo_no_deja_rutas_vacias():
+    individuo = construction.a_individuo([[], [0, 1, 2], [3]])
+    assert individuo.c_i.tolist() == [2, 0, 1, 3]
+    assert individuo.c_ii.tolist() == [1, 3]
+
+def test_semillas_son_distintas_y_mejores_que_las_aleatorias(estaciones, crear_escenario):
+    tareas_grandes, drones_grandes = crear_escenario(40, 6)
+    with config.usar(NUM_TAREAS=len(tareas_grandes), NUM_DRONES=len(drones_grandes)):
+        random.seed(0)
+        distancias = construir_matriz_distancias(tareas_grandes, drones_grandes, estaciones)
+        semillas = construction.sembrar(10, tareas_grandes, drones_grandes, distancias)
+        aleatorios = [ga.crear_individuo() for _ in range(10)]
+        assert len({semilla.clave() for semilla in semillas}) == len(semillas) == 10
+        energias = lambda poblacion: [sim.funcion_objetivo(i, tareas_grandes, drones_grandes, estaciones, distancias)[0] for i in poblacion]
+        viables_semillas = [e for e in energias(semillas) if e > 0]
+        viables_aleatorios = [e for e in energias(aleatorios) if e > 0]
+        assert len(viables_semillas) >= len(viables_aleatorios)
+        assert min(viables_semillas) < min(viables_aleatorios, default=float("inf"))
+
+def test_poblacion_inicial_con_fraccion_de_semillas(tareas, drones, estaciones):
+    with config.usar(NUM_TAREAS=len(tareas), NUM_DRONES=len(drones), FRACCION_SEMILLAS_HEURISTICAS=0.2):
+        poblacion = ga.crear_poblacion_inicial(tareas, drones, estaciones)
+        assert len(poblacion) == config.TAMANO_POBLACION
+        assert all(sorted(individuo.c_i.tolist()) == list(range(len(tareas))) for individuo in poblacion)
@@ -0,0 +1,41 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import random
+import pytest
+import utils.crossover as crossover
+
+@pytest.mark.parametrize("nombre", sorted(crossover.OPERADORES))
+def test_operadores_devuelven_permutaciones(nombre):
+    operador = crossover.obtener_operador(nombre)
+    rng = random.Random(0)
+    for n in (2, 3, 10, 100):
+        padre1, padre2 = list(range(n)), list(range(n))
+        rng.shuffle(padre1)
+        rng.shuffle(padre2)
+        for hijo in operador(padre1, padre2):
+            assert sorted(hijo) == list(range(n))
+
+def test_pmx_conserva_el_segmento_y_el_mapeo():
+    random.seed(1)
+    padre1, padre2 = [0, 1, 2, 3, 4, 5, 6, 7], [3, 7, 5, 1, 6, 0, 2, 4]
+    random.seed(1)
+    hijo1, _ = crossover.pmx(padre1, padre2)
+    random.seed(1)
+    inicio = random.randint(0, 6)
+    fin = random.randint(inicio + 1, 7)
+    assert hijo1[inicio:fin + 1] == padre1[inicio:fin + 1]
+    fuera = [i for i in range(8) if not inicio <= i <= fin and padre2[i] not in padre1[inicio:fin + 1]]
+    assert all(hijo1[i] == padre2[i] for i in fuera)
+
+def test_cx_hereda_posiciones_de_los_padres():
+    padre1, padre2 = [0, 1, 2, 3, 4, 5, 6, 7], [7, 6, 5, 4, 3, 2, 1, 0]
+    for hijo in crossover.cx(padre1, padre2):
+        assert all(hijo[i] in (padre1[i], padre2[i]) for i in range(8))
+
+def test_operador_desconocido():
+    with pytest.raises(ValueError):
+        crossover.obtener_operador("no_existe")
@@ -0,0 +1,97 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import config
+import decomposition
+import distance_matrix
+import genetic_algorithm as ga
+from distance_matrix import construir_matriz_distancias
+from individual import Individuo
+
+def test_kmeans_separa_grupos_evidentes():
+    rng = np.random.default_rng(0)
+    puntos = np.vstack([rng.normal(centro, 10, size=(20, 2)) for centro in ([0, 0], [1000, 0], [0, 1000])])
+    etiquetas, centros = decomposition.kmeans(puntos, 3, rng=rng)
+    for g in range(3):
+        assert len(set(etiquetas[20 * g:20 * (g + 1)])) == 1
+    assert len(set(etiquetas)) == 3 and centros.shape == (3, 2)
+
+def test_repartir_drones_proporcional_y_al_mas_cercano():
+    distancias = np.array([[1.0, 9.0], [2.0, 8.0], [9.0, 1.0], [3.0, 7.0], [4.0, 6.0], [8.0, 2.0]])
+    grupo_dron = decomposition.repartir_drones([40, 10], distancias)
+    assert grupo_dron.tolist() == [0, 0, 1, 0, 0, 1]
+    assert decomposition.repartir_drones([48, 2], distancias).tolist() == [0, 0, 1, 0, 0, 1] # Al menos dos drones por grupo
+    assert decomposition.repartir_drones([4, 2], distancias[:4]).tolist() == [0, 0, 1, 1] # Nunca más drones que tareas
+
+def test_fusionar_grupos_chicos_con_el_mas_cercano():
+    puntos = np.array([[0.0, 0.0], [1.0, 0.0], [10.0, 0.0], [11.0, 0.0], [3.0, 0.0], [30.0, 0.0]])
+    etiquetas, centros = decomposition.fusionar_grupos_chicos(puntos, np.array([0, 0, 2, 2, 3, 5]))
+    assert etiquetas.tolist() == [0, 0, 1, 1, 0, 1] and centros.shape == (2, 2)
+
+def test_unir_traduce_rutas_a_la_flota_completa():
+    tareas_grupo = [np.array([4, 0, 2]), np.array([1, 3])]
+    drones_grupo = [np.array([0, 2]), np.array([1])]
+    soluciones = [Individuo([2, 0, 1], [1]), Individuo([1, 0], [])]
+    unido = decomposition.unir(soluciones, tareas_grupo, drones_grupo, 3)
+    assert unido.c_i.tolist() == [2, 3, 1, 4, 0] and unido.c_ii.tolist() == [1, 3]
+
+def test_resolver_por_grupos_une_las_soluciones_de_cada_grupo(estaciones, crear_escenario):
+    tareas, drones = crear_escenario(40, 8, seed=2)
+    for tarea in tareas:
+        tarea["tiempo_max"] += 3600
+    with config.usar(TAMANO_POBLACION=10, NUM_GENERACIONES=3, NCONV=None):
+        resultado = decomposition.resolver_por_grupos(tareas, drones, estaciones, num_grupos=3, num_procesos=1, semilla=5)
+    individuo = resultado["mejor_individuo"]
+    assert sorted(individuo.c_i.tolist()) == list(range(40))
+    assert len(individuo.c_ii) == len(drones) - 1
+    assert set(resultado["grupo_tarea"].tolist()) == {0, 1, 2} and (resultado["grupo_dron"] >= 0).all()
+    if not resultado["reparado"]: # Sin reparar, la energía de la flota es la suma de la de los grupos
+        assert np.isclose(resultado["mejor_energia"], sum(resultado["energias_grupos"]))
+
+def test_resolver_por_grupos_sin_la_matriz_completa(estaciones, crear_escenario, monkeypatch):
+    # Sólo los grupos arman matrices densas; la unión consulta las distancias bajo demanda
+    tareas, drones = crear_escenario(40, 8, seed=2)
+    for tarea in tareas:
+        tarea["tiempo_max"] += 3600
+    formas = []
+    densa = distance_matrix.distancias_metros_matriz
+    monkeypatch.setattr(distance_matrix, "distancias_metros_matriz",
+                        lambda origenes, destinos, **kwargs: formas.append((len(origenes), len(destinos))) or densa(origenes, destinos, **kwargs))
+    with config.usar(TAMANO_POBLACION=10, NUM_GENERACIONES=3, NCONV=None):
+        resultado = decomposition.resolver_por_grupos(tareas, drones, estaciones, num_grupos=3, num_procesos=1, semilla=5)
+    assert formas and all(num_pickups < 40 for _, num_pickups in formas)
+    assert isinstance(resultado["distancias"]["origen_pickup"], distance_matrix.OrigenPickupBajoDemanda)
+
+    # La energía de la unión es la misma que con la matriz completa
+    unido = Individuo(resultado["mejor_individuo"].c_i, resultado["mejor_individuo"].c_ii)
+    with config.usar(NUM_TAREAS=40, NUM_DRONES=8):
+        ga.evaluar_pendientes([unido], tareas, drones, estaciones, construir_matriz_distancias(tareas, drones, estaciones))
+    assert np.isclose(unido.energia, resultado["mejor_individuo"].energia, rtol=1e-6)
+
+def test_grupos_de_al_menos_dos_tareas_y_dos_drones(estaciones, crear_escenario):
+    # Tantos grupos como drones (o cerca) dejaban grupos de un dron o de una tarea y el cruce fallaba
+    for num_tareas, num_drones, num_grupos in [(60, 10, 10), (120, 30, 8), (60, 20, 4)]:
+        tareas, drones = crear_escenario(num_tareas, num_drones, seed=num_drones)
+        for tarea in tareas:
+            tarea["tiempo_max"] += 3600
+        with config.usar(TAMANO_POBLACION=10, NUM_GENERACIONES=2, NCONV=None):
+            resultado = decomposition.resolver_por_grupos(tareas, drones, estaciones, num_grupos=num_grupos, num_procesos=1, semilla=3)
+        grupos = int(resultado["grupo_tarea"].max()) + 1
+        assert 1 < grupos <= min(num_grupos, num_drones // 2)
+        assert np.bincount(resultado["grupo_tarea"]).min() >= 2 and np.bincount(resultado["grupo_dron"]).min() >= 2
+        assert sorted(resultado["mejor_individuo"].c_i.tolist()) == list(range(num_tareas))
+
+def test_resolver_por_grupos_respeta_el_presupuesto_de_tiempo(estaciones, crear_escenario):
+    tareas, drones = crear_escenario(30, 6, seed=8)
+    for tarea in tareas:
+        tarea["tiempo_max"] += 3600
+    with config.usar(TAMANO_POBLACION=10, NUM_GENERACIONES=50, NCONV=None):
+        resultado = decomposition.resolver_por_grupos(tareas, drones, estaciones, num_grupos=3, num_procesos=1, semilla=1,
+                                                      tiempo_maximo=0)
+    assert resultado["generaciones_grupos"] == [0] * len(resultado["energias_grupos"]) # Sin presupuesto: la población inicial
+    assert set(resultado["motivos_grupos"]) == {"tiempo"}
+    assert sorted(resultado["mejor_individuo"].c_i.tolist()) == list(range(30))
@@ -0,0 +1,61 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import points_generator
+from points_generator import distancia_metros, distancias_metros_matriz
+from distance_matrix import construir_matriz_distancias, indice_base, indice_dropoff, indice_estacion
+
+tareas = [
+    {"id": 0, "pickup": [-32.9572, -60.6640], "dropoff": [-32.9625, -60.6704], "peso": 1, "tiempo_max": 3600},
+    {"id": 1, "pickup": [-32.9571, -60.6634], "dropoff": [-32.9397, -60.6735], "peso": 2, "tiempo_max": 3600},
+    {"id": 2, "pickup": [-32.9540, -60.6368], "dropoff": [-32.9440, -60.6753], "peso": 1, "tiempo_max": 3600},
+]
+drones = [{"id": 0, "posicion_inicial": [-32.9543, -60.675]}, {"id": 1, "posicion_inicial": [-32.9456, -60.6440]}]
+estaciones = [[-32.936780, -60.6455], [-32.955500, -60.649813]]
+
+def test_matriz_coincide_con_distancia_metros():
+    distancias = construir_matriz_distancias(tareas, drones, estaciones)
+
+    for tarea in tareas:
+        i = tarea["id"]
+        assert np.isclose(distancias["pickup_dropoff"][i], distancia_metros(tarea["pickup"], tarea["dropoff"]))
+        for dron in drones:
+            origen = indice_base(dron["id"], distancias)
+            assert np.isclose(distancias["origen_pickup"][origen, i], distancia_metros(dron["posicion_inicial"], tarea["pickup"]))
+        for otra in tareas:
+            origen = indice_dropoff(otra["id"], distancias)
+            assert np.isclose(distancias["origen_pickup"][origen, i], distancia_metros(otra["dropoff"], tarea["pickup"]))
+
+    for tarea in tareas:
+        origen = indice_dropoff(tarea["id"], distancias)
+        esperadas = [distancia_metros(tarea["dropoff"], estacion) for estacion in estaciones]
+        assert distancias["estacion_cercana"][origen] == np.argmin(esperadas)
+        assert np.isclose(distancias["dist_estacion_cercana"][origen], min(esperadas))
+    for j in range(len(estaciones)):
+        origen = indice_estacion(j, distancias)
+        assert distancias["estacion_cercana"][origen] == j
+        assert np.isclose(distancias["dist_estacion_cercana"][origen], 0)
+
+def test_matriz_por_bloques_y_en_float32(monkeypatch):
+    rng = np.random.default_rng(0)
+    origenes = rng.uniform([-32.98, -60.69], [-32.92, -60.61], size=(7, 2))
+    destinos = rng.uniform([-32.98, -60.69], [-32.92, -60.61], size=(5, 2))
+    completa = distancias_metros_matriz(origenes, destinos)
+    monkeypatch.setattr(points_generator, "ELEMENTOS_POR_BLOQUE", 10) # Bloques de 2 filas
+    assert np.array_equal(distancias_metros_matriz(origenes, destinos), completa)
+    reducida = distancias_metros_matriz(origenes, destinos, dtype=np.float32)
+    assert reducida.dtype == np.float32 and np.allclose(reducida, completa, rtol=1e-6)
+    assert np.isclose(completa[3, 2], distancia_metros(origenes[3], destinos[2]))
+
+def test_origen_pickup_bajo_demanda_coincide_con_la_matriz():
+    densa = construir_matriz_distancias(tareas, drones, estaciones)["origen_pickup"]
+    bajo_demanda = construir_matriz_distancias(tareas, drones, estaciones, bajo_demanda=True)["origen_pickup"]
+    assert bajo_demanda.shape == densa.shape
+    # Las formas de indexación que usan el simulador, la reparación y las heurísticas
+    for clave in [(4, 2), (np.array([0, 3, 6]), np.array([2, 0, 1])), (slice(None, 2), [1, 2]),
+                  (slice(2, 5), slice(None)), (np.array([[1], [5]]), np.array([[0, 1, 2]]))]:
+        assert np.allclose(bajo_demanda[clave], densa[clave])
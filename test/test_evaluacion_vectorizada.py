@@ -0,0 +1,29 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import config
+import simulation as sim
+from distance_matrix import construir_matriz_distancias
+
+def test_evaluar_poblacion_coincide_con_funcion_objetivo(tareas, drones, estaciones, crear_poblacion):
+    distancias = construir_matriz_distancias(tareas, drones, estaciones)
+    poblacion = crear_poblacion(40)
+    for bateria in [config.BATERIA_MAXIMA, 1e6, 800000, 600000]: # Baterías chicas fuerzan recargas y penalizaciones
+        with config.usar(BATERIA_MAXIMA=bateria):
+            permutaciones, cortes = sim.poblacion_a_matrices(poblacion)
+            energias, recargas = sim.evaluar_poblacion(permutaciones, cortes, tareas, drones, estaciones, distancias, devolver_recargas=True)
+            for i, individuo in enumerate(poblacion):
+                energia, recargas_individuo = sim.funcion_objetivo(individuo, tareas, drones, estaciones, distancias)
+                assert np.isclose(energias[i], energia)
+                if energia > 0:
+                    assert np.array_equal(recargas[i], recargas_individuo)
+
+def test_materializar_tareas_con_recargas_no_modifica_las_originales(tareas, estaciones):
+    recargas = np.array([-1, 1, -1, 0, -1])
+    tareas_con_recargas = sim.materializar_tareas_con_recargas(tareas, recargas, estaciones)
+    assert [t["recarga_previa"] for t in tareas_con_recargas] == [None, estaciones[1], None, estaciones[0], None]
+    assert all(t["recarga_previa"] is None for t in tareas)
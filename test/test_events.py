@@ -0,0 +1,38 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import config
+import events
+import simulation as sim
+from distance_matrix import construir_matriz_distancias
+
+def test_contadores_iguales_en_simulador_escalar_y_vectorizado(tareas, drones, estaciones, crear_poblacion):
+    distancias = construir_matriz_distancias(tareas, drones, estaciones)
+    poblacion = crear_poblacion(30)
+    events.habilitar()
+    try:
+        with config.usar(BATERIA_MAXIMA=800000):
+            events.reiniciar()
+            for individuo in poblacion:
+                sim.funcion_objetivo(individuo, tareas, drones, estaciones, distancias)
+            escalar = events.cerrar_generacion(1)
+
+            permutaciones, cortes = sim.poblacion_a_matrices(poblacion)
+            sim.evaluar_poblacion(permutaciones, cortes, tareas, drones, estaciones, distancias)
+            vectorizado = events.cerrar_generacion(2)
+    finally:
+        events.habilitar(False)
+
+    assert escalar["evaluaciones"] == vectorizado["evaluaciones"] == len(poblacion)
+    assert escalar["recargas"] > 0
+    assert {k: v for k, v in escalar.items() if v} == {k: v for k, v in vectorizado.items() if v}
+    assert [h["generacion"] for h in events.historial()] == [1, 2]
+
+def test_deshabilitado_no_registra(tareas, drones, estaciones, crear_poblacion):
+    events.reiniciar()
+    permutaciones, cortes = sim.poblacion_a_matrices(crear_poblacion(5))
+    sim.evaluar_poblacion(permutaciones, cortes, tareas, drones, estaciones)
+    assert events.cerrar_generacion(1) == {}
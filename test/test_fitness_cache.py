@@ -0,0 +1,53 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import genetic_algorithm as ga
+from fitness_cache import CacheFitness
+from distance_matrix import construir_matriz_distancias
+
+def test_cache_descarta_el_menos_usado():
+    cache = CacheFitness(2)
+    cache.guardar(b"a", 1.0, None)
+    cache.guardar(b"b", 2.0, None)
+    assert cache.obtener(b"a") == (1.0, None) # "a" pasa a ser el más reciente
+    cache.guardar(b"c", 3.0, None)
+    assert cache.obtener(b"b") is None
+    assert len(cache) == 2
+    resumen = cache.cerrar_generacion(1)
+    assert (resumen["aciertos"], resumen["fallos"]) == (1, 1)
+
+def test_evaluacion_con_cache_coincide_sin_cache(tareas, drones, estaciones, crear_poblacion):
+    distancias = construir_matriz_distancias(tareas, drones, estaciones)
+    poblacion = crear_poblacion(20) + crear_poblacion(20) # Todos los cromosomas repetidos
+    cache = CacheFitness(100)
+
+    energias, recargas = ga.evaluar_individuos(poblacion, tareas, drones, estaciones, distancias)
+    energias_cache, recargas_cache = ga.evaluar_individuos(poblacion, tareas, drones, estaciones, distancias, cache)
+    assert np.allclose(energias, energias_cache)
+    assert np.array_equal(recargas, recargas_cache)
+
+    ga.evaluar_individuos(poblacion, tareas, drones, estaciones, distancias, cache)
+    resumen = cache.cerrar_generacion(1)
+    assert resumen["fallos"] == len(cache) # Cada cromosoma distinto se simuló una sola vez
+    assert resumen["aciertos"] == len(poblacion)
+
+def test_cache_de_rutas_coincide_sin_cache(tareas, drones, estaciones, crear_poblacion):
+    distancias = construir_matriz_distancias(tareas, drones, estaciones)
+    poblacion = crear_poblacion(20)
+    # Hijos que sólo cambian una ruta: se intercambian dos tareas dentro de la primera ruta
+    hijos = [[list(c_i), list(c_ii)] for c_i, c_ii in poblacion]
+    for c_i, c_ii in hijos:
+        if c_ii[0] >= 2:
+            c_i[0], c_i[1] = c_i[1], c_i[0]
+    cache = CacheFitness(100, capacidad_rutas=1000)
+
+    ga.evaluar_individuos(poblacion, tareas, drones, estaciones, distancias, cache)
+    energias, recargas = ga.evaluar_individuos(hijos, tareas, drones, estaciones, distancias)
+    energias_cache, recargas_cache = ga.evaluar_individuos(hijos, tareas, drones, estaciones, distancias, cache)
+    assert np.allclose(energias, energias_cache)
+    assert np.array_equal(recargas, recargas_cache)
+    assert cache.rutas.cerrar_generacion(1)["aciertos"] > 0 # Las rutas sin cambios no se re-simularon
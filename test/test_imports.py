@@ -0,0 +1,21 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import subprocess
+
+PESADOS = ["pandas", "matplotlib", "folium", "osmnx", "shapely", "geopandas"]
+
+def test_nucleo_no_importa_dependencias_pesadas():
+    # En un proceso nuevo: en este pueden estar cargadas por otros tests
+    codigo = (
+        "import sys\n"
+        "import config, simulation, genetic_algorithm, islands, parallel_evaluation, problem_setup, station_loader, rolling_horizon, decomposition, main\n"
+        "import utils.crossover, utils.mutation, utils.selection, utils.local_search, utils.construction, utils.repair\n"
+        f"print([m for m in {PESADOS!r} if m in sys.modules])\n"
+    )
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    salida = subprocess.run([sys.executable, "-c", codigo], cwd=raiz, capture_output=True, text=True, check=True)
+    assert salida.stdout.strip() == "[]"
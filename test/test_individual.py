@@ -0,0 +1,30 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import random
+import numpy as np
+import config
+import genetic_algorithm as ga
+import simulation as sim
+from individual import Individuo
+from distance_matrix import construir_matriz_distancias
+
+def test_mutacion_no_modifica_al_original():
+    with config.usar(PROBABILIDAD_MUTACION=1.0):
+        padre = Individuo(list(range(10)), [3, 6], energia=1.0)
+        hijo = ga.mutacion(padre)
+    assert padre.c_i.tolist() == list(range(10)) and padre.c_ii.tolist() == [3, 6]
+    assert hijo is not padre and not hijo.evaluado
+
+def test_procesar_generacion_devuelve_individuos_evaluados(tareas, drones, estaciones):
+    with config.usar(NUM_TAREAS=len(tareas), NUM_DRONES=len(drones), TAMANO_POBLACION=20):
+        random.seed(0)
+        distancias = construir_matriz_distancias(tareas, drones, estaciones)
+        poblacion, _ = ga.procesar_generacion(ga.crear_poblacion_inicial(), tareas, drones, estaciones, distancias)
+        for individuo in poblacion:
+            energia, recargas = sim.funcion_objetivo(individuo, tareas, drones, estaciones, distancias)
+            assert individuo.viable and np.isclose(individuo.energia, energia)
+            assert np.array_equal(individuo.recargas, recargas)
@@ -0,0 +1,54 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import config
+import islands
+from individual import Individuo
+
+def test_destinos_migracion():
+    assert islands.destinos_migracion(3, "anillo") == {0: [1], 1: [2], 2: [0]}
+    assert islands.destinos_migracion(3, "todos") == {0: [1, 2], 1: [0, 2], 2: [0, 1]}
+
+def test_migrar_reemplaza_a_los_peores():
+    poblaciones = [[Individuo([0, 1], []), Individuo([1, 0], [])], [Individuo([0, 1], [1]), Individuo([1, 0], [1])]]
+    energias = [[1.0, 3.0], [0.0, 2.0]] # 0 = inviable
+    islands.migrar(poblaciones, energias, "anillo", 1)
+    assert poblaciones[1][0] == Individuo([0, 1], []) and energias[1][0] == 1.0 # Reemplaza al inviable de la isla 1
+    assert poblaciones[0][1] == Individuo([1, 0], [1]) and energias[0][1] == 2.0 # Reemplaza al peor de la isla 0
+    assert poblaciones[0][1] is not poblaciones[1][1] # Los migrantes son copias
+
+def test_ejecutar_islas(tareas, drones, estaciones):
+    with config.usar(NUM_TAREAS=len(tareas), NUM_DRONES=len(drones), TAMANO_POBLACION=10):
+        resultado = islands.ejecutar_islas(tareas, drones, estaciones, num_islas=2, num_generaciones=4,
+                                           intervalo=2, num_migrantes=1, topologia="anillo", semilla=1)
+    assert resultado["mejor_energia"] > 0
+    assert len(resultado["historial_mejor_energia"]) == 2
+    assert resultado["historial_mejor_energia"][1] <= resultado["historial_mejor_energia"][0]
+
+def test_el_presupuesto_corta_las_generaciones_de_cada_isla(tareas, drones, estaciones):
+    from stopping import CriterioParada
+    with config.usar(NUM_TAREAS=len(tareas), NUM_DRONES=len(drones), TAMANO_POBLACION=10):
+        criterio = CriterioParada(nconv=None, tiempo_maximo=1.0)
+        resultado = islands.ejecutar_islas(tareas, drones, estaciones, num_islas=2, num_generaciones=100000,
+                                           intervalo=100000, num_migrantes=1, semilla=1, criterio=criterio)
+    assert criterio.motivo == "tiempo" and 0 < criterio.generaciones < 100000 # Corta dentro de la única época
+    assert criterio.transcurrido() < 10 and resultado["mejor_energia"] > 0
+
+def test_todas_las_variantes_devuelven_los_mismos_kpis():
+    import main
+    base = {"NUM_TAREAS": 12, "NUM_DRONES": 4, "TIEMPO_MIN_MIN": 600, "TIEMPO_MAX_MIN": 700, "TAMANO_POBLACION": 10,
+            "NUM_GENERACIONES": 2, "NCONV": None, "TIEMPO_MAXIMO_SEGUNDOS": None, "NUM_PROCESOS": 1}
+    variantes = [
+        {"NUM_ISLAS": 1, "NUM_GRUPOS": 1},
+        {"NUM_ISLAS": 2, "NUM_GRUPOS": 1},
+        {"NUM_ISLAS": 2, "NUM_GRUPOS": 1, "TIEMPO_MIN_MIN": 1, "TIEMPO_MAX_MIN": 1}, # Islas sin solución viable
+        {"NUM_ISLAS": 1, "NUM_GRUPOS": 2},
+    ]
+    claves = [set(main.run_optimization({**base, **variante}, verbose=False, generar_salidas=False)) for variante in variantes]
+    comunes = {"params", "mejor_energia", "tiempo_medio_entrega", "parametros_inviables", "eventos", "tiempos",
+               "cache_fitness", "cache_rutas", "generaciones", "motivo_parada", "duracion_s"}
+    assert claves[0] == claves[1] == claves[2] == comunes
+    assert claves[3] == comunes | {"energias_grupos"}
@@ -0,0 +1,35 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import config
+import simulation as sim
+import utils.local_search as local_search
+from individual import Individuo
+from distance_matrix import construir_matriz_distancias
+
+def test_busqueda_local_nunca_empeora_ni_rompe_el_cromosoma(tareas, drones, estaciones, crear_poblacion):
+    with config.usar(NUM_TAREAS=len(tareas)):
+        distancias = construir_matriz_distancias(tareas, drones, estaciones)
+        mejorados = 0
+        for c_i, c_ii in crear_poblacion(30):
+            individuo = Individuo(c_i, c_ii)
+            energia, _ = sim.funcion_objetivo(individuo, tareas, drones, estaciones, distancias)
+            if energia <= 0:
+                continue
+            nuevo = local_search.mejorar_individuo(individuo, tareas, drones, distancias)
+            energia_nueva, _ = sim.funcion_objetivo(nuevo, tareas, drones, estaciones, distancias)
+            assert 0 < energia_nueva <= energia + 1e-12
+            assert sorted(nuevo.c_i.tolist()) == list(range(len(tareas)))
+            assert np.all(np.diff(nuevo.c_ii) >= 0) and 1 <= nuevo.c_ii.min() and nuevo.c_ii.max() <= len(tareas) - 1
+            mejorados += nuevo is not individuo
+    assert mejorados > 0
+
+def test_movimientos_intra_son_permutaciones_distintas():
+    indices = local_search._indices_intra(6).tolist()
+    assert all(sorted(fila) == list(range(6)) for fila in indices)
+    assert len({tuple(fila) for fila in indices}) == len(indices)
+    assert list(range(6)) not in indices # Ningún movimiento deja la ruta igual
@@ -0,0 +1,40 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import simulation as sim
+from distance_matrix import construir_matriz_distancias
+from fitness_cache import CacheRutas
+from parallel_evaluation import EvaluadorParalelo
+
+def test_evaluacion_paralela_coincide_con_serie(tareas, drones, estaciones, crear_poblacion):
+    distancias = construir_matriz_distancias(tareas, drones, estaciones)
+    permutaciones, cortes = sim.poblacion_a_matrices(crear_poblacion(30))
+    energias, recargas = sim.evaluar_poblacion(permutaciones, cortes, tareas, drones, estaciones, distancias, devolver_recargas=True)
+
+    with EvaluadorParalelo(tareas, drones, estaciones, distancias, num_procesos=2, min_individuos_por_bloque=4) as paralelo:
+        assert paralelo.tamano_bloque(30) == 15
+        energias_par, recargas_par = paralelo.evaluar(permutaciones, cortes)
+
+    assert np.allclose(energias, energias_par)
+    assert np.array_equal(recargas, recargas_par)
+
+def test_poblacion_chica_se_evalua_en_serie(tareas, drones, estaciones, crear_poblacion):
+    distancias = construir_matriz_distancias(tareas, drones, estaciones)
+    with EvaluadorParalelo(tareas, drones, estaciones, distancias, num_procesos=4, min_individuos_por_bloque=256) as paralelo:
+        assert paralelo.tamano_bloque(100) == 256
+        permutaciones, cortes = sim.poblacion_a_matrices(crear_poblacion(10))
+        energias, _ = paralelo.evaluar(permutaciones, cortes)
+    assert len(energias) == 10
+
+def test_evaluacion_en_serie_usa_el_cache_de_rutas(tareas, drones, estaciones, crear_poblacion):
+    distancias = construir_matriz_distancias(tareas, drones, estaciones)
+    cache_rutas = CacheRutas(1000)
+    permutaciones, cortes = sim.poblacion_a_matrices(crear_poblacion(10))
+    esperadas, _ = sim.evaluar_poblacion(permutaciones, cortes, tareas, drones, estaciones, distancias, devolver_recargas=True)
+    with EvaluadorParalelo(tareas, drones, estaciones, distancias, num_procesos=4, min_individuos_por_bloque=256) as paralelo:
+        energias, _ = paralelo.evaluar(permutaciones, cortes, cache_rutas)
+    assert len(cache_rutas) > 0 and np.allclose(energias, esperadas)
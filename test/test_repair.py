@@ -0,0 +1,47 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import random
+import numpy as np
+import config
+import genetic_algorithm as ga
+import simulation as sim
+import utils.repair as repair
+from individual import Individuo
+from distance_matrix import construir_matriz_distancias
+
+def test_primera_falla_es_el_paso_de_la_primera_penalizacion(tareas, drones, estaciones):
+    distancias = construir_matriz_distancias(tareas, drones, estaciones)
+    pesos = np.array([tarea["peso"] for tarea in tareas])
+    plazos = np.array([1e9, 1e9, 1.0, 1e9, 1.0]) # Las tareas 2 y 4 no se pueden entregar a tiempo
+    resultado = sim.simular_lista_rutas([[0, 1, 2, 4], [3], [4, 0]], [0, 1, 0], pesos, plazos, distancias)
+    assert resultado["primera_falla"].tolist() == [2, -1, 0]
+    assert resultado["penalizada"].tolist() == [True, False, True]
+
+def test_reparar_vuelve_viables_individuos_inviables(estaciones, crear_escenario):
+    tareas_grandes, drones_grandes = crear_escenario(40, 6, seed=1)
+    for tarea in tareas_grandes:
+        tarea["tiempo_max"] = 3000 # Plazos cortos: los individuos aleatorios son todos inviables
+    with config.usar(NUM_TAREAS=len(tareas_grandes), NUM_DRONES=len(drones_grandes)):
+        random.seed(0)
+        distancias = construir_matriz_distancias(tareas_grandes, drones_grandes, estaciones)
+        reparados = 0
+        for _ in range(10):
+            individuo = ga.crear_individuo()
+            if sim.funcion_objetivo(individuo, tareas_grandes, drones_grandes, estaciones, distancias)[0] > 0:
+                continue
+            nuevo = repair.reparar_individuo(individuo, tareas_grandes, drones_grandes, distancias)
+            assert sorted(nuevo.c_i.tolist()) == list(range(len(tareas_grandes)))
+            assert np.all(np.diff(nuevo.c_ii) >= 0) and 1 <= nuevo.c_ii.min() and nuevo.c_ii.max() <= len(tareas_grandes) - 1
+            reparados += sim.funcion_objetivo(nuevo, tareas_grandes, drones_grandes, estaciones, distancias)[0] > 0
+    assert reparados > 0
+
+def test_reparar_no_toca_individuos_viables(tareas, drones, estaciones):
+    distancias = construir_matriz_distancias(tareas, drones, estaciones)
+    with config.usar(NUM_TAREAS=len(tareas)):
+        individuo = Individuo([0, 1, 2, 3, 4], [2])
+        assert sim.funcion_objetivo(individuo, tareas, drones, estaciones, distancias)[0] > 0
+        assert repair.reparar_individuo(individuo, tareas, drones, distancias) is individuo
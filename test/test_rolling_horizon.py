@@ -0,0 +1,92 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import random
+import numpy as np
+import config
+import genetic_algorithm as ga
+import rolling_horizon as rh
+from distance_matrix import construir_matriz_distancias
+
+def _ids_del_plan(plan):
+    return sorted(id_tarea for ruta in plan.values() for id_tarea in ruta)
+
+def test_reindexar_quita_tareas_y_ajusta_la_cantidad_de_rutas():
+    rutas = [np.array([3, 0]), np.array([4]), np.array([1, 2])]
+    nuevo_indice = np.array([0, -1, 1, 2, -1]) # Se completaron las tareas 1 y 4
+    assert rh.reindexar_rutas(rutas, nuevo_indice, 3) == [[2, 0], [], [1]]
+    assert rh.reindexar_rutas(rutas, nuevo_indice, 2) == [[2, 0], [1]] # Sobran rutas: se unen a la última
+    assert rh.reindexar_rutas(rutas[:1], nuevo_indice, 2) == [[2, 0], []]
+
+def test_insertar_tareas_en_la_posicion_de_menor_desvio(tareas, drones, estaciones):
+    distancias = construir_matriz_distancias(tareas, drones, estaciones)
+    tiempos_max = np.array([tarea["tiempo_max"] for tarea in tareas], dtype=float)
+    rutas = rh.insertar_tareas([[0, 2], [3]], [1, 4], tiempos_max, distancias)
+    assert sorted(sum(rutas, [])) == list(range(len(tareas)))
+    # Ninguna otra posición de la tarea 4 agrega menos vuelo que la elegida
+    D = distancias["num_drones"]
+    def largo(rutas):
+        total = 0.0
+        for d, ruta in enumerate(rutas):
+            origen = d
+            for t in ruta:
+                total += distancias["origen_pickup"][origen, t] + distancias["pickup_dropoff"][t]
+                origen = D + t
+        return total
+    sin_4 = [[t for t in ruta if t != 4] for ruta in rutas]
+    alternativas = [[ruta[:q] + [4] + ruta[q:] if d == r else ruta for d, ruta in enumerate(sin_4)]
+                    for r in range(len(sin_4)) for q in range(len(sin_4[r]) + 1)]
+    assert largo(rutas) <= min(largo(alternativa) for alternativa in alternativas) + 1e-6
+
+def test_reoptimizacion_con_arranque_en_caliente(estaciones, crear_escenario):
+    random.seed(4)
+    tareas_dia, drones_dia = crear_escenario(30, 5, seed=4)
+    for tarea in tareas_dia:
+        tarea["tiempo_max"] += 3600 # Plazos holgados: el test verifica la mecánica, no la dificultad
+    with config.usar(TAMANO_POBLACION=10, NCONV=None):
+        horizonte = rh.HorizonteRodante(drones_dia, estaciones, tareas_dia[:20])
+        primera = horizonte.optimizar(tiempo_maximo=60, num_generaciones=3)
+        assert primera["plan"] is not None and _ids_del_plan(primera["plan"]) == list(range(20))
+
+        horizonte.completar_tareas([0, 5, 7])
+        horizonte.avanzar(120)
+        nuevas = horizonte.agregar_tareas([{k: v for k, v in tarea.items() if k != "id"} for tarea in tareas_dia[20:]])
+        assert nuevas == list(range(20, 30))
+        segunda = horizonte.optimizar(tiempo_maximo=60, num_generaciones=2)
+    assert segunda["tareas_insertadas"] == 10
+    assert _ids_del_plan(segunda["plan"]) == sorted(set(range(30)) - {0, 5, 7})
+    assert len(horizonte.poblacion) > 0 and horizonte.tareas[1]["tiempo_max"] == tareas_dia[1]["tiempo_max"] - 120
+
+def test_sin_tareas_pendientes(tareas, drones, estaciones):
+    horizonte = rh.HorizonteRodante(drones, estaciones, tareas)
+    horizonte.completar_tareas(range(len(tareas)))
+    resultado = horizonte.optimizar()
+    assert resultado["plan"] == {0: [], 1: []} and resultado["motivo_parada"] == "sin_tareas"
+
+def test_una_tarea_pendiente_o_un_solo_dron(estaciones, crear_escenario):
+    random.seed(6)
+    tareas_dia, drones_dia = crear_escenario(6, 3, seed=6)
+    for tarea in tareas_dia:
+        tarea["tiempo_max"] += 3600
+    with config.usar(TAMANO_POBLACION=10, NCONV=None):
+        horizonte = rh.HorizonteRodante(drones_dia, estaciones, tareas_dia[:1])
+        resultado = horizonte.optimizar(num_generaciones=2)
+        assert _ids_del_plan(resultado["plan"]) == [0] and resultado["motivo_parada"] == "una_tarea"
+        individuo = resultado["mejor_individuo"].copiar()
+        individuo.energia = None
+        escenario, _ = horizonte.escenario()
+        with config.usar(NUM_TAREAS=1, NUM_DRONES=3):
+            distancias = construir_matriz_distancias(escenario.tareas, escenario.drones, estaciones)
+            ga.evaluar_pendientes([individuo], escenario.tareas, escenario.drones, estaciones, distancias)
+        assert np.isclose(individuo.energia, resultado["mejor_energia"]) # El cromosoma reproduce el plan elegido
+
+        horizonte.agregar_tareas([{k: v for k, v in tarea.items() if k != "id"} for tarea in tareas_dia[1:]])
+        resultado = horizonte.optimizar(num_generaciones=3) # Arranque en caliente desde el plan de una tarea
+        assert _ids_del_plan(resultado["plan"]) == list(range(6))
+
+        solo = rh.HorizonteRodante(drones_dia[:1], estaciones, tareas_dia) # Un solo dron: c_ii vacío
+        resultado = solo.optimizar(num_generaciones=5)
+        assert resultado["generaciones"] > 0 and _ids_del_plan(resultado["plan"]) == list(range(6))
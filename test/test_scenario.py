@@ -0,0 +1,33 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import simulation as sim
+from scenario import Escenario, VistaTareas, como_escenario
+from distance_matrix import construir_matriz_distancias
+
+def test_vistas_reproducen_los_dicts(tareas, drones, estaciones):
+    escenario = Escenario.desde_listas(tareas, drones, estaciones)
+    assert len(escenario.tareas) == len(tareas) and len(escenario.drones) == len(drones)
+    for vista, original in zip(escenario.tareas, tareas):
+        assert vista == {**original, "peso": float(original["peso"]), "tiempo_max": float(original["tiempo_max"])}
+    assert escenario.drones[-1] == drones[-1]
+
+def test_evaluacion_con_escenario_coincide_con_listas(tareas, drones, estaciones, crear_poblacion):
+    escenario = Escenario.desde_listas(tareas, drones, estaciones)
+    distancias = construir_matriz_distancias(tareas, drones, estaciones)
+    distancias_escenario = construir_matriz_distancias(escenario.tareas, escenario.drones, estaciones)
+    assert np.array_equal(distancias["origen_pickup"], distancias_escenario["origen_pickup"])
+
+    permutaciones, cortes = sim.poblacion_a_matrices(crear_poblacion(20))
+    energias = sim.evaluar_poblacion(permutaciones, cortes, tareas, drones, estaciones, distancias)
+    energias_escenario = sim.evaluar_poblacion(permutaciones, cortes, escenario.tareas, escenario.drones, estaciones, distancias_escenario)
+    assert np.array_equal(energias, energias_escenario)
+
+def test_como_escenario_convierte_una_sola_vez(tareas, drones, estaciones):
+    vista_tareas, vista_drones = como_escenario(tareas, drones, estaciones)
+    assert isinstance(vista_tareas, VistaTareas) and list(vista_tareas) == list(Escenario.desde_listas(tareas, drones).tareas)
+    assert como_escenario(vista_tareas, vista_drones) == (vista_tareas, vista_drones) # Las vistas no se copian
@@ -0,0 +1,32 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import config
+import genetic_algorithm as ga
+import utils.selection as selection
+from individual import Individuo
+
+def test_sus_respeta_las_proporciones():
+    fitnesses = [0.5, 0.25, 0.125, 0.125]
+    conteo = np.bincount(selection.sus(fitnesses, 8, np.random.default_rng(0)), minlength=4)
+    assert conteo.tolist() == [4, 2, 1, 1]
+
+def test_torneos_eligen_al_mejor_de_cada_fila():
+    fitnesses = np.arange(10, dtype=float)
+    ganadores = selection.torneos(fitnesses, 200, 10, np.random.default_rng(0))
+    assert ganadores.shape == (200,) and ganadores.max() == 9
+    assert np.all(selection.torneos([1.0, 0.0], 50, 2, np.random.default_rng(1)) >= 0)
+
+def test_descendientes_sin_repetidos_y_con_elite():
+    with config.usar(TAMANO_POBLACION=10):
+        rng = np.random.default_rng(0)
+        poblacion = [Individuo(rng.permutation(6), [2, 4]) for _ in range(30)]
+        fitnesses = ga.obtener_fitnesses_local(rng.random(30) + 1)
+        descendientes = ga.crear_poblacion_descendiente_con_fitness(poblacion, fitnesses)
+    assert len(descendientes) == 10
+    assert len({individuo.clave() for individuo in descendientes}) == 10
+    assert descendientes[0] is poblacion[int(np.argmax(fitnesses))]
@@ -0,0 +1,28 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import random
+import numpy as np
+import config
+from points_generator import generar_puntos_aleatorios, distancias_metros_matriz
+from station_index import IndiceEstaciones
+
+def test_indice_coincide_con_busqueda_lineal():
+    random.seed(7)
+    estaciones = generar_puntos_aleatorios(300, config.POLIGONO_ROSARIO)
+    puntos = generar_puntos_aleatorios(500, config.POLIGONO_ROSARIO) + estaciones[:20]
+    indice = IndiceEstaciones(estaciones)
+
+    idx, dist = indice.mas_cercanas(puntos)
+    matriz = distancias_metros_matriz(puntos, estaciones)
+    assert np.array_equal(idx, np.argmin(matriz, axis=1))
+    assert np.allclose(dist, matriz.min(axis=1))
+
+def test_indice_con_pocas_estaciones():
+    estaciones = [[-32.936780, -60.6455], [-32.955500, -60.649813]]
+    indice = IndiceEstaciones(estaciones)
+    assert indice.mas_cercana([-32.9370, -60.6460])[0] == 0
+    assert indice.mas_cercana([-32.9550, -60.6500])[0] == 1
@@ -0,0 +1,63 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import glob
+import json
+import random
+import shutil
+import numpy as np
+import pytest
+import config
+import station_loader as sl
+from points_generator import punto_en_poligono, puntos_en_poligono
+
+def test_puntos_en_poligono_coincide_con_punto_en_poligono():
+    rng = random.Random(0)
+    puntos = [[rng.uniform(-32.98, -32.92), rng.uniform(-60.69, -60.61)] for _ in range(2000)]
+    mascara = puntos_en_poligono(puntos, config.POLIGONO_ROSARIO)
+    assert mascara.tolist() == [punto_en_poligono(p, config.POLIGONO_ROSARIO) for p in puntos]
+
+def test_estaciones_desde_overpass_nodos_vias_y_duplicados(tmp_path):
+    datos = {"elements": [
+        {"type": "node", "id": 1, "lat": -32.95, "lon": -60.66, "tags": {"amenity": "fuel"}},
+        {"type": "node", "id": 2, "lat": -32.95, "lon": -60.66, "tags": {"amenity": "fuel"}}, # Duplicado
+        {"type": "node", "id": 3, "lat": -32.90, "lon": -60.66, "tags": {"amenity": "fuel"}}, # Fuera del polígono
+        {"type": "node", "id": 4, "lat": -32.940, "lon": -60.650}, {"type": "node", "id": 5, "lat": -32.940, "lon": -60.648},
+        {"type": "node", "id": 6, "lat": -32.942, "lon": -60.648}, {"type": "node", "id": 7, "lat": -32.942, "lon": -60.650},
+        {"type": "way", "id": 8, "nodes": [4, 5, 6, 7, 4], "tags": {"amenity": "fuel"}},
+        {"type": "node", "id": 9, "lat": -32.95, "lon": -60.64, "tags": {"amenity": "cafe"}},
+    ]}
+    (tmp_path / "respuesta.json").write_text(json.dumps(datos))
+    estaciones = sl.cargar_estaciones(config.POLIGONO_ROSARIO, str(tmp_path), usar_osmnx=False)
+    assert np.allclose(estaciones, [[-32.95, -60.66], [-32.941, -60.649]])
+    assert os.path.exists(tmp_path / f"estaciones_{sl.clave_poligono(config.POLIGONO_ROSARIO)}_{sl.clave_fuentes(str(tmp_path))}.npy")
+
+def test_cache_del_repo_y_npy(tmp_path):
+    for ruta in glob.glob(os.path.join(sl.DIRECTORIO_CACHE, "*.json")):
+        shutil.copy(ruta, tmp_path)
+    estaciones = sl.cargar_estaciones(config.POLIGONO_ROSARIO, str(tmp_path), usar_osmnx=False)
+    assert len(estaciones) > 0
+    assert puntos_en_poligono(estaciones, config.POLIGONO_ROSARIO).all()
+    assert len(np.unique(estaciones, axis=0)) == len(estaciones)
+
+    for ruta in glob.glob(str(tmp_path / "*.json")):
+        os.remove(ruta)
+    assert np.array_equal(sl.cargar_estaciones(config.POLIGONO_ROSARIO, str(tmp_path), usar_osmnx=False), estaciones)
+
+def test_respuesta_actualizada_invalida_el_npy(tmp_path):
+    def respuesta(lon):
+        return json.dumps({"elements": [{"type": "node", "id": 1, "lat": -32.95, "lon": lon, "tags": {"amenity": "fuel"}}]})
+    ruta = tmp_path / "respuesta.json"
+    ruta.write_text(respuesta(-60.66))
+    assert np.allclose(sl.cargar_estaciones(config.POLIGONO_ROSARIO, str(tmp_path), usar_osmnx=False), [[-32.95, -60.66]])
+    ruta.write_text(respuesta(-60.65)) # Overpass refrescado
+    os.utime(ruta, ns=(os.stat(ruta).st_atime_ns, os.stat(ruta).st_mtime_ns + 10**9))
+    assert np.allclose(sl.cargar_estaciones(config.POLIGONO_ROSARIO, str(tmp_path), usar_osmnx=False), [[-32.95, -60.65]])
+    assert len(glob.glob(str(tmp_path / "estaciones_*.npy"))) == 1 # El .npy anterior se borró
+
+def test_sin_datos_ni_osmnx_falla(tmp_path):
+    with pytest.raises(ValueError):
+        sl.cargar_estaciones(config.POLIGONO_ROSARIO, str(tmp_path), usar_osmnx=False)
@@ -0,0 +1,30 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import time
+from stopping import CriterioParada
+
+def test_convergencia_tras_nconv_generaciones_sin_mejora():
+    criterio = CriterioParada(epsilon=0.1, nconv=3, tiempo_maximo=None)
+    motivos = [criterio.registrar(e) for e in [10.0, 9.0, 8.95, 8.92, 8.91]]
+    assert motivos == [None, None, None, None, "convergencia"] # 8.95, 8.92 y 8.91 mejoran menos que epsilon
+
+def test_presupuesto_de_tiempo():
+    criterio = CriterioParada(epsilon=0.1, nconv=None, tiempo_maximo=0.05)
+    criterio.comenzar_generaciones()
+    motivo = None
+    while motivo is None:
+        time.sleep(0.01)
+        motivo = criterio.registrar(10.0 - criterio.generaciones)
+    assert motivo == "tiempo"
+    assert criterio.transcurrido() < 0.1 # No arranca una generación que se pasaría del presupuesto
+
+def test_agotado_antes_de_la_primera_generacion():
+    criterio = CriterioParada(epsilon=0.1, nconv=None, tiempo_maximo=0.02)
+    assert not criterio.agotado() and criterio.motivo is None
+    time.sleep(0.03) # Por ejemplo, armar el escenario consumió el presupuesto
+    assert criterio.agotado() and criterio.motivo == "tiempo"
+    assert criterio.limite() == criterio.inicio + 0.02
@@ -0,0 +1,67 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import random
+import time
+import pytest
+import config
+import sweep
+
+def _corrida_de_prueba(params, verbose, generar_salidas, sufijo_salidas=""):
+    """Simula run_optimization: aplica los overrides sobre config y devuelve KPIs."""
+    for clave, valor in params.items():
+        setattr(config, clave, valor)
+    time.sleep(params.get("ESPERA", 0))
+    return {"params": params, "mejor_energia": config.NUM_TAREAS + random.random(),
+            "tiempo_medio_entrega": 1.0, "parametros_inviables": params.get("INVIABLE", False)}
+
+def test_barrido_aislado_con_timeout():
+    num_tareas_original = config.NUM_TAREAS
+    corridas = [{"NUM_TAREAS": 5}, {"NUM_TAREAS": 7, "INVIABLE": True}, {"NUM_TAREAS": 9, "ESPERA": 30}]
+    resultados = sweep.ejecutar_barrido(corridas, max_procesos=3, timeout=2, semilla=3, funcion=_corrida_de_prueba)
+
+    assert [r["status"] for r in resultados] == ["ok", "inviable", "timeout"]
+    assert int(resultados[0]["mejor_energia"]) == 5
+    assert config.NUM_TAREAS == num_tareas_original # Los overrides quedan en cada proceso
+
+    repetidos = sweep.ejecutar_barrido(corridas[:1], max_procesos=1, semilla=3, funcion=_corrida_de_prueba)
+    assert repetidos[0]["mejor_energia"] == resultados[0]["mejor_energia"] # Misma semilla --> mismo resultado
+
+def _corrida_con_salidas(params, verbose, generar_salidas, sufijo_salidas=""):
+    return {"params": params, "parametros_inviables": False, "generar_salidas": generar_salidas, "sufijo_salidas": sufijo_salidas}
+
+def test_cada_corrida_guarda_sus_salidas_con_su_sufijo():
+    resultados = sweep.ejecutar_barrido([{}, {}, {}], max_procesos=3, semilla=1, generar_salidas=True, funcion=_corrida_con_salidas)
+    assert [r["sufijo_salidas"] for r in resultados] == ["_corrida1", "_corrida2", "_corrida3"]
+    assert all(r["generar_salidas"] for r in resultados)
+
+def _dormir_en_worker(directorio):
+    open(os.path.join(directorio, str(os.getpid())), "w").close()
+    time.sleep(60)
+
+def _corrida_con_pool(params, verbose, generar_salidas, sufijo_salidas=""):
+    """Como una corrida con EVALUACION_PARALELA: los workers siguen trabajando cuando vence el timeout."""
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        list(pool.map(_dormir_en_worker, [params["DIRECTORIO"]] * 2))
+
+def _vivo(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as archivo:
+            return archivo.read().split(")")[-1].split()[0] != "Z" # Un zombi ya terminó
+    except FileNotFoundError:
+        return False
+
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="Necesita /proc y grupos de procesos")
+def test_el_timeout_termina_los_workers_de_la_corrida(tmp_path):
+    resultados = sweep.ejecutar_barrido([{"DIRECTORIO": str(tmp_path)}], max_procesos=1, timeout=2, funcion=_corrida_con_pool)
+    assert resultados[0]["status"] == "timeout"
+    workers = [int(nombre) for nombre in os.listdir(tmp_path)]
+    assert len(workers) == 2
+    limite = time.monotonic() + 5
+    while any(_vivo(pid) for pid in workers) and time.monotonic() < limite:
+        time.sleep(0.1)
+    assert not any(_vivo(pid) for pid in workers)
@@ -0,0 +1,51 @@
+import sys
+import os
+
+# Agregar el directorio padre al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import csv
+import json
+import time
+import timing
+
+def test_fases_anidadas_se_descuentan_de_la_que_las_contiene():
+    timing.reiniciar()
+    with timing.fase("afuera"):
+        time.sleep(0.01)
+        with timing.fase("adentro"):
+            time.sleep(0.03)
+    timing.contar("evaluaciones", 7)
+    resumen = timing.cerrar_generacion(1)
+    assert resumen["adentro_s"] >= 0.03
+    assert 0.01 <= resumen["afuera_s"] < 0.03 # Sin el tiempo de "adentro"
+    assert abs(resumen["total_s"] - resumen["afuera_s"] - resumen["adentro_s"]) < 1e-12
+    assert resumen["evaluaciones"] == 7
+    assert timing.historial() == [resumen]
+
+def test_deshabilitado_no_registra():
+    timing.reiniciar()
+    timing.habilitar(False)
+    try:
+        with timing.fase("x"):
+            pass
+        timing.contar("evaluaciones")
+        assert timing.cerrar_generacion(1) == {"generacion": 1, "total_s": 0}
+    finally:
+        timing.habilitar(True)
+
+def test_exportar_csv_y_json(tmp_path):
+    filas = [{"generacion": 1, "total_s": 0.5, "cruce_s": 0.5}, {"generacion": 2, "total_s": 0.2, "reparacion_s": 0.2, "evaluaciones": 3}]
+    timing.exportar_csv(str(tmp_path / "t.csv"), filas)
+    timing.exportar_json(str(tmp_path / "t.json"), filas)
+    with open(tmp_path / "t.csv", newline="") as archivo:
+        leidas = list(csv.DictReader(archivo))
+    assert list(leidas[0]) == ["generacion", "total_s", "cruce_s", "reparacion_s", "evaluaciones"]
+    assert leidas[0]["reparacion_s"] == "0" and leidas[1]["evaluaciones"] == "3"
+    assert json.loads((tmp_path / "t.json").read_text()) == filas
+
+def test_perfilar_guarda_estadisticas(tmp_path):
+    ruta = tmp_path / "perfil" / "gen.prof"
+    with timing.perfilar(str(ruta)):
+        sum(i * i for i in range(1000))
+    assert ruta.exists()
@@ -0,0 +1,138 @@
+# Tiempos por fase de cada generación (población opuesta, selección, cruce, mutación, evaluación,
+# reparación, supervivientes, búsqueda local, estadísticas) y cantidad de evaluaciones.
+# Mismo esquema que events.py: acumuladores que se cierran y guardan una vez por generación.
+# Cada medición es un par de time.perf_counter(), así que se puede dejar habilitado siempre.
+# Las fases anidadas se descuentan de la que las contiene: la suma de las fases es el tiempo medido.
+# Como en events.py, cada corrida (ver corrida()) tiene sus propios acumuladores, pila de fases e
+# historial en una ContextVar; fuera de una corrida se usa un registro global del proceso.
+import contextvars
+import cProfile
+import csv
+import io
+import json
+import logging
+import os
+import pstats
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+def _nuevo_registro(habilitado):
+    # pila: [fase, inicio] de las fases abiertas (la última es la que está corriendo)
+    return {"habilitado": bool(habilitado), "segundos": Counter(), "conteos": Counter(), "pila": [], "historial": []}
+
+_global = _nuevo_registro(True)
+_registro_corrida = contextvars.ContextVar("tiempos_corrida", default=None)
+
+def _registro():
+    registro = _registro_corrida.get()
+    return _global if registro is None else registro
+
+def __getattr__(nombre):
+    # timing.HABILITADO se resuelve en el registro de la corrida activa
+    if nombre == "HABILITADO":
+        return _registro()["habilitado"]
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+@contextmanager
+def corrida(habilitado=True):
+    """Acumuladores e historial propios (vacíos) para el bloque; se usa junto con config.usar en cada corrida."""
+    token = _registro_corrida.set(_nuevo_registro(habilitado))
+    try:
+        yield
+    finally:
+        _registro_corrida.reset(token)
+
+def habilitar(activo=True):
+    """Activa o desactiva la medición de tiempos (de la corrida activa)."""
+    _registro()["habilitado"] = bool(activo)
+
+@contextmanager
+def fase(nombre):
+    """Suma al acumulador `nombre` el tiempo del bloque (sin contar las fases anidadas)."""
+    registro = _registro()
+    if not registro["habilitado"]:
+        yield
+        return
+    segundos, pila = registro["segundos"], registro["pila"]
+    ahora = time.perf_counter()
+    if pila:
+        segundos[pila[-1][0]] += ahora - pila[-1][1] # Se pausa la fase que contiene a esta
+    pila.append([nombre, ahora])
+    try:
+        yield
+    finally:
+        ahora = time.perf_counter()
+        nombre_fase, inicio = pila.pop()
+        segundos[nombre_fase] += ahora - inicio
+        if pila:
+            pila[-1][1] = ahora # Se reanuda la fase que la contenía
+
+def contar(nombre, cantidad=1):
+    """Suma `cantidad` a un conteo de la generación actual (por ejemplo, individuos evaluados)."""
+    registro = _registro()
+    if registro["habilitado"]:
+        registro["conteos"][nombre] += int(cantidad)
+
+def cerrar_generacion(generacion):
+    """Guarda los tiempos (s) y conteos acumulados como los de `generacion`, los reinicia y los devuelve."""
+    registro = _registro()
+    segundos_fase = registro["segundos"]
+    resumen = {"generacion": generacion, "total_s": sum(segundos_fase.values())}
+    resumen.update({f"{nombre}_s": segundos for nombre, segundos in segundos_fase.items()})
+    resumen.update(registro["conteos"])
+    registro["historial"].append(resumen)
+    segundos_fase.clear()
+    registro["conteos"].clear()
+    return resumen
+
+def historial():
+    """Lista de resúmenes por generación ({"generacion": g, "total_s": ..., "<fase>_s": ..., conteo: ...})."""
+    return list(_registro()["historial"])
+
+def reiniciar():
+    """Borra acumuladores e historial (al comenzar una corrida nueva)."""
+    registro = _registro()
+    for clave in ("segundos", "conteos", "pila", "historial"):
+        registro[clave].clear()
+
+def exportar_csv(ruta, filas=None):
+    """Escribe el historial (o `filas`) como CSV, una fila por generación; las fases faltantes quedan en 0."""
+    filas = historial() if filas is None else filas
+    columnas = ["generacion", "total_s"]
+    for fila in filas:
+        columnas += [columna for columna in fila if columna not in columnas]
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=columnas, restval=0)
+        escritor.writeheader()
+        escritor.writerows(filas)
+
+def exportar_json(ruta, filas=None):
+    """Escribe el historial (o `filas`) como JSON."""
+    filas = historial() if filas is None else filas
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(filas, archivo, indent=2)
+
+@contextmanager
+def perfilar(ruta=None, lineas=20):
+    """
+    Perfila el bloque con cProfile (se usa para una sola generación, ver PERFILAR_GENERACION).
+    Guarda las estadísticas en `ruta` (abrir con pstats o snakeviz) y registra las funciones de
+    mayor tiempo acumulado.
+    """
+    perfil = cProfile.Profile()
+    perfil.enable()
+    try:
+        yield perfil
+    finally:
+        perfil.disable()
+        if ruta:
+            os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+            perfil.dump_stats(ruta)
+        salida = io.StringIO()
+        pstats.Stats(perfil, stream=salida).sort_stats("cumulative").print_stats(lineas)
+        logger.info("Perfil de la generación%s:\n%s", f" (guardado en {ruta})" if ruta else "", salida.getvalue())
@@ -0,0 +1,198 @@
+# Heurísticas constructivas para sembrar la población inicial con soluciones razonables
+# (en lugar de permutaciones y cortes puramente aleatorios, que casi siempre son inviables):
+# - por_plazo: tareas en orden de plazo, cada una al dron que la terminaría antes.
+# - vecino_mas_cercano: el dron menos ocupado encadena el pickup más cercano a donde quedó.
+# - ahorros: estilo Clarke-Wright, une cadenas de tareas donde encadenar ahorra más vuelo en vacío
+#   que salir desde una base, mientras no se pasen los plazos.
+# Los tiempos son estimados (vuelo a VELOCIDAD_DRON sin desvíos a recargar): el simulador decide
+# después la energía y la viabilidad reales.
+import numpy as np
+import config
+from individual import Individuo
+from scenario import arrays_tareas
+from utils.selection import generador
+
+CANDIDATOS_ALEATORIOS = 3 # En las semillas aleatorizadas se elige al azar entre los 3 mejores candidatos de cada paso
+RUIDO_AHORROS = 0.2 # Perturbación relativa de los ahorros en las semillas aleatorizadas
+VECINOS_AHORROS = 20 # Uniones que se evalúan por tarea (sus pickups más cercanos), para no ordenar N² pares
+
+def _elegir(costos, aleatoria, rng):
+    """Índice de menor costo o, si aleatoria, uno al azar entre los CANDIDATOS_ALEATORIOS de menor costo."""
+    if not aleatoria or len(costos) == 1:
+        return int(np.argmin(costos))
+    mejores = np.argsort(costos, kind="stable")[:CANDIDATOS_ALEATORIOS]
+    return int(mejores[rng.integers(len(mejores))])
+
+def por_plazo(tiempos_max, num_rutas, distancias, aleatoria=False, rng=None):
+    """
+    Asignación golosa por plazo: recorre las tareas de plazo más corto a más largo y agrega cada
+    una al final de la ruta del dron que la terminaría antes. Devuelve una lista de num_rutas rutas.
+    """
+    rng = rng or generador()
+    D = distancias["num_drones"]
+    origen_pickup, pickup_dropoff = distancias["origen_pickup"], distancias["pickup_dropoff"]
+    v = config.VELOCIDAD_DRON
+
+    posicion = np.arange(num_rutas) # Base de cada dron
+    tiempo = np.zeros(num_rutas)
+    rutas = [[] for _ in range(num_rutas)]
+    for t in np.argsort(tiempos_max, kind="stable"):
+        fin = tiempo + (origen_pickup[posicion, t] + pickup_dropoff[t]) / v
+        d = _elegir(fin, aleatoria, rng)
+        rutas[d].append(int(t))
+        tiempo[d], posicion[d] = fin[d], D + t
+    return rutas
+
+def vecino_mas_cercano(tiempos_max, num_rutas, distancias, aleatoria=False, rng=None):
+    """
+    Vecino más cercano desde la base de cada dron: en cada paso el dron menos ocupado agrega el pickup
+    pendiente más cercano a donde quedó, prefiriendo los que todavía llega a entregar en plazo.
+    """
+    rng = rng or generador()
+    D = distancias["num_drones"]
+    origen_pickup, pickup_dropoff = distancias["origen_pickup"], distancias["pickup_dropoff"]
+    v = config.VELOCIDAD_DRON
+
+    posicion = np.arange(num_rutas)
+    tiempo = np.zeros(num_rutas)
+    pendiente = np.ones(len(tiempos_max), dtype=bool)
+    rutas = [[] for _ in range(num_rutas)]
+    for _ in range(len(tiempos_max)):
+        d = int(np.argmin(tiempo))
+        tareas = np.flatnonzero(pendiente)
+        vuelo = origen_pickup[posicion[d], tareas]
+        en_plazo = tiempo[d] + (vuelo + pickup_dropoff[tareas]) / v <= tiempos_max[tareas]
+        if en_plazo.any():
+            tareas, vuelo = tareas[en_plazo], vuelo[en_plazo]
+        t = int(tareas[_elegir(vuelo, aleatoria, rng)])
+        rutas[d].append(t)
+        pendiente[t] = False
+        tiempo[d] += (origen_pickup[posicion[d], t] + pickup_dropoff[t]) / v
+        posicion[d] = D + t
+    return rutas
+
+def ahorros(tiempos_max, num_rutas, distancias, aleatoria=False, rng=None):
+    """
+    Heurística de ahorros: cada tarea empieza como una cadena propia que sale de la base más cercana.
+    Unir la cadena que termina en i con la que empieza en j ahorra base->pickup_j - dropoff_i->pickup_j;
+    se aplican las uniones de mayor ahorro que no dejan tareas fuera de plazo hasta quedar con num_rutas
+    cadenas. Las que sobran se reparten con LPT (la más larga a la ruta menos cargada) y cada ruta se
+    asigna a la base libre más cercana a su primer pickup.
+    """
+    rng = rng or generador()
+    N = len(tiempos_max)
+    D = distancias["num_drones"]
+    origen_pickup, pickup_dropoff = distancias["origen_pickup"], distancias["pickup_dropoff"]
+    v = config.VELOCIDAD_DRON
+
+    salida = origen_pickup[:num_rutas].min(axis=0) # Vuelo desde la base más cercana a cada pickup
+    enlace = origen_pickup[D:D + N] # enlace[i, j]: dropoff de i -> pickup de j
+    vecinos = min(VECINOS_AHORROS, N - 1)
+    if vecinos > 0:
+        enlace_sin_diagonal = enlace + np.diag(np.full(N, np.inf))
+        j = np.argpartition(enlace_sin_diagonal, vecinos - 1, axis=1)[:, :vecinos]
+        i = np.repeat(np.arange(N), vecinos)
+        j = j.ravel()
+        ahorro = salida[j] - enlace[i, j]
+        if aleatoria:
+            ahorro = ahorro * (1 + RUIDO_AHORROS * rng.uniform(-1, 1, size=len(ahorro)))
+        orden = np.argsort(-ahorro, kind="stable")
+        pares = [(int(i[k]), int(j[k])) for k in orden if ahorro[k] > 0]
+    else:
+        pares = []
+
+    # Cadenas enlazadas: cabeza de cada tarea y, por cabeza, duración estimada y holgura de plazo de la cadena
+    siguiente = np.full(N, -1)
+    anterior = np.full(N, -1)
+    cabeza = np.arange(N)
+    duracion = (salida + pickup_dropoff) / v
+    holgura = tiempos_max - duracion
+    cadenas = N
+    for i, j in pares:
+        if cadenas <= num_rutas:
+            break
+        a = cabeza[i]
+        if siguiente[i] >= 0 or anterior[j] >= 0 or a == j:
+            continue
+        desplazamiento = duracion[a] + (enlace[i, j] - salida[j]) / v # Cuánto se atrasan las tareas de j
+        if desplazamiento > holgura[j]:
+            continue
+        siguiente[i], anterior[j] = j, i
+        t = j
+        while t >= 0:
+            cabeza[t] = a
+            t = siguiente[t]
+        holgura[a] = min(holgura[a], holgura[j] - desplazamiento)
+        duracion[a] = duracion[j] + desplazamiento
+        cadenas -= 1
+
+    def recorrer(c):
+        tareas = []
+        while c >= 0:
+            tareas.append(int(c))
+            c = siguiente[c]
+        return tareas
+
+    cabezas = sorted(np.flatnonzero(anterior < 0), key=lambda c: -duracion[c])
+    rutas = [[] for _ in range(num_rutas)]
+    carga = np.zeros(num_rutas)
+    for c in cabezas:
+        r = int(np.argmin(carga))
+        rutas[r] += recorrer(c)
+        carga[r] += duracion[c]
+
+    # Cada ruta a la base libre más cercana a su primer pickup (de las distancias más cortas a las más largas)
+    asignadas = [None] * num_rutas
+    libres = set(range(num_rutas))
+    ocupadas = set()
+    for k in np.argsort(origen_pickup[:num_rutas, [ruta[0] if ruta else 0 for ruta in rutas]].ravel(), kind="stable"):
+        base, r = divmod(int(k), num_rutas)
+        if base in libres and r not in ocupadas:
+            asignadas[base] = rutas[r]
+            libres.discard(base)
+            ocupadas.add(r)
+    return asignadas
+
+HEURISTICAS = {
+    "plazo": por_plazo,
+    "vecino": vecino_mas_cercano,
+    "ahorros": ahorros,
+}
+
+def a_individuo(rutas):
+    """
+    Codifica una lista de rutas (una por dron, en orden) como Individuo. Como cada punto de corte
+    debe quedar en [1, N-1] y ser distinto, las rutas vacías reciben la última tarea de la más larga.
+    """
+    rutas = [list(ruta) for ruta in rutas]
+    for ruta in rutas:
+        if not ruta:
+            mas_larga = max(rutas, key=len)
+            ruta.append(mas_larga.pop())
+    return Individuo(np.concatenate(rutas), np.cumsum([len(ruta) for ruta in rutas[:-1]]))
+
+def sembrar(cantidad, tareas, drones, distancias):
+    """
+    `cantidad` individuos construidos rotando entre las heurísticas. La primera vuelta es determinista;
+    las siguientes eligen al azar entre los mejores candidatos de cada paso (GRASP), para no llenar
+    la población de copias. Se descartan los cromosomas repetidos.
+    """
+    num_tareas = len(tareas)
+    num_rutas = min(len(drones), num_tareas) # Mismos cortes que crear_individuo: todas las rutas no vacías
+    if cantidad <= 0 or num_tareas == 0:
+        return []
+    _, _, _, tiempos_max = arrays_tareas(tareas)
+    rng = generador()
+    heuristicas = list(HEURISTICAS.values())
+
+    semillas, vistos = [], set()
+    for intento in range(3 * cantidad):
+        if len(semillas) == cantidad:
+            break
+        heuristica = heuristicas[intento % len(heuristicas)]
+        aleatoria = intento >= len(heuristicas)
+        individuo = a_individuo(heuristica(tiempos_max, num_rutas, distancias, aleatoria, rng))
+        if individuo.clave() not in vistos:
+            vistos.add(individuo.clave())
+            semillas.append(individuo)
+    return semillas
@@ -1,32 +1,136 @@
 import random
 
 def pmx(parent1, parent2):
-    """Partial Mapped Crossover que devuelve dos hijos."""
+    """
+    Partial Mapped Crossover que devuelve dos hijos.
+    Usa mapas valor -> posición en lugar de buscar en listas, así que es O(n).
+    """
+    parent1, parent2 = list(parent1), list(parent2)
     size = len(parent1)
     cxpoint1 = random.randint(0, size - 2)
     cxpoint2 = random.randint(cxpoint1 + 1, size - 1)
 
     def make_child(p1, p2):
-        child = [None] * size
-        child[cxpoint1:cxpoint2+1] = p1[cxpoint1:cxpoint2+1]
+        posicion_en_p2 = [0] * size
+        for i, val in enumerate(p2):
+            posicion_en_p2[val] = i
+        en_segmento = [False] * size
+        for val in p1[cxpoint1:cxpoint2+1]:
+            en_segmento[val] = True
 
+        child = p2[:] # Las posiciones que no toca el mapeo heredan de p2
+        child[cxpoint1:cxpoint2+1] = p1[cxpoint1:cxpoint2+1]
         for i in range(cxpoint1, cxpoint2+1):
-            if p2[i] not in child:
-                val = p2[i]
-                pos = i
-                while True:
-                    val_in_p1 = p1[pos]
-                    pos = p2.index(val_in_p1)
-                    if child[pos] is None:
-                        break
-                child[pos] = val
-
-        for i in range(size):
-            if child[i] is None:
-                child[i] = p2[i]
+            val = p2[i]
+            if en_segmento[val]:
+                continue
+            # Seguir el mapeo p1 -> p2 hasta salir del segmento (las cadenas son disjuntas: O(n) en total)
+            pos = i
+            while cxpoint1 <= pos <= cxpoint2:
+                pos = posicion_en_p2[p1[pos]]
+            child[pos] = val
         return child
 
     child1 = make_child(parent1, parent2)
     child2 = make_child(parent2, parent1)
 
     return child1, child2
+
+def ox(parent1, parent2):
+    """
+    Order Crossover: cada hijo conserva un segmento de un padre y completa el resto
+    con las tareas del otro padre en el orden en que aparecen a partir del segmento.
+    """
+    parent1, parent2 = list(parent1), list(parent2)
+    size = len(parent1)
+    cxpoint1 = random.randint(0, size - 2)
+    cxpoint2 = random.randint(cxpoint1 + 1, size - 1)
+
+    def make_child(p1, p2):
+        en_segmento = [False] * size
+        for val in p1[cxpoint1:cxpoint2+1]:
+            en_segmento[val] = True
+        child = [None] * size
+        child[cxpoint1:cxpoint2+1] = p1[cxpoint1:cxpoint2+1]
+        pos = (cxpoint2 + 1) % size
+        for k in range(size):
+            val = p2[(cxpoint2 + 1 + k) % size]
+            if not en_segmento[val]:
+                child[pos] = val
+                pos = (pos + 1) % size
+        return child
+
+    return make_child(parent1, parent2), make_child(parent2, parent1)
+
+def cx(parent1, parent2):
+    """
+    Cycle Crossover: separa las posiciones en ciclos (p1 -> p2) y los hijos toman
+    los ciclos alternadamente de cada padre, así cada tarea queda en una posición que tenía en algún padre.
+    """
+    parent1, parent2 = list(parent1), list(parent2)
+    size = len(parent1)
+    posicion_en_p1 = [0] * size
+    for i, val in enumerate(parent1):
+        posicion_en_p1[val] = i
+
+    child1, child2 = parent1[:], parent2[:]
+    visitado = [False] * size
+    ciclo = 0
+    for inicio in range(size):
+        if visitado[inicio]:
+            continue
+        pos = inicio
+        while not visitado[pos]:
+            visitado[pos] = True
+            if ciclo % 2 == 1: # Los ciclos impares se intercambian entre padres
+                child1[pos], child2[pos] = parent2[pos], parent1[pos]
+            pos = posicion_en_p1[parent2[pos]]
+        ciclo += 1
+    return child1, child2
+
+def erx(parent1, parent2):
+    """
+    Edge Recombination Crossover: arma cada hijo usando, siempre que se pueda, tareas que eran
+    vecinas (antes o después) en alguno de los padres, prefiriendo la vecina con menos vecinos restantes.
+    """
+    parent1, parent2 = list(parent1), list(parent2)
+    size = len(parent1)
+    vecinos_base = [set() for _ in range(size)]
+    for padre in (parent1, parent2):
+        for i in range(size - 1):
+            vecinos_base[padre[i]].add(padre[i + 1])
+            vecinos_base[padre[i + 1]].add(padre[i])
+
+    def make_child(primero, orden_respaldo):
+        vecinos = [set(v) for v in vecinos_base]
+        usado = [False] * size
+        child = []
+        siguiente_respaldo = 0
+        actual = primero
+        while True:
+            child.append(actual)
+            usado[actual] = True
+            if len(child) == size:
+                return child
+            for vecino in vecinos[actual]:
+                vecinos[vecino].discard(actual)
+            candidatos = vecinos[actual]
+            if len(candidatos) == 1:
+                actual = next(iter(candidatos))
+            elif candidatos:
+                menor = min(len(vecinos[c]) for c in candidatos)
+                actual = random.choice(sorted(c for c in candidatos if len(vecinos[c]) == menor))
+            else: # Sin vecinas libres: la primera tarea no usada según el orden del padre
+                while usado[orden_respaldo[siguiente_respaldo]]:
+                    siguiente_respaldo += 1
+                actual = orden_respaldo[siguiente_respaldo]
+
+    return make_child(parent1[0], parent1), make_child(parent2[0], parent2)
+
+OPERADORES = {"pmx": pmx, "ox": ox, "cx": cx, "erx": erx}
+
+def obtener_operador(nombre):
+    """Devuelve el operador de cruce de permutaciones con ese nombre (ver config.OPERADOR_CRUCE)."""
+    if nombre not in OPERADORES:
+        raise ValueError(f"Operador de cruce desconocido: {nombre}. Opciones: {sorted(OPERADORES)}")
+    return OPERADORES[nombre]
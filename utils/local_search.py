@@ -0,0 +1,203 @@
+# Búsqueda local (etapa memética) sobre las rutas decodificadas de un individuo:
+# 2-opt y or-opt dentro de cada ruta y relocate de una tarea entre drones.
+# Los movimientos se filtran con el delta de energía de los tramos en vacío: calcular_energia es
+# lineal en L1, así que ese delta es proporcional a los metros en vacío ganados o perdidos.
+# Sólo los más prometedores se verifican simulando únicamente las rutas afectadas
+# (recargas, plazos y seguridad incluidos).
+from functools import lru_cache
+import numpy as np
+import config
+import events
+import simulation as sim
+from individual import Individuo
+from scenario import arrays_tareas
+
+MAX_VERIFICACIONES = 32 # Candidatos (los de mejor delta) que se simulan por ruta o por relocate
+LARGO_MAXIMO_INTRA = 60 # Rutas más largas no prueban 2-opt/or-opt completos (la cantidad de candidatos crece como L²)
+TOLERANCIA = 1e-6 # J
+
+@lru_cache(maxsize=None)
+def _indices_2opt(largo):
+    """Matriz (C, largo) de índices: cada fila invierte un segmento [i, j] de la ruta."""
+    i, j = np.triu_indices(largo, 1)
+    posiciones = np.arange(largo)[None, :]
+    dentro = (posiciones >= i[:, None]) & (posiciones <= j[:, None])
+    return np.where(dentro, i[:, None] + j[:, None] - posiciones, posiciones)
+
+@lru_cache(maxsize=None)
+def _indices_or_opt(largo, bloque):
+    """Matriz (C, largo) de índices: cada fila mueve el bloque [s, s+bloque) a la posición k del resto."""
+    s, k = np.meshgrid(np.arange(largo - bloque + 1), np.arange(largo - bloque + 1), indexing="ij")
+    distintos = s != k
+    s, k = s[distintos][:, None], k[distintos][:, None]
+    posiciones = np.arange(largo)[None, :]
+    en_resto = np.where(posiciones < k, posiciones, posiciones - bloque)
+    resto = np.where(en_resto < s, en_resto, en_resto + bloque)
+    return np.where((posiciones >= k) & (posiciones < k + bloque), s + posiciones - k, resto)
+
+@lru_cache(maxsize=None)
+def _indices_intra(largo):
+    """Todos los 2-opt y or-opt (bloques de 1 a 3) de una ruta de ese largo, sin movimientos repetidos."""
+    indices = [_indices_2opt(largo)] + [_indices_or_opt(largo, b) for b in range(1, min(3, largo - 1) + 1)]
+    return np.unique(np.vstack(indices), axis=0)
+
+def _costo_traslados(candidatas, dron, distancias):
+    """Metros recorridos en vacío (origen -> pickup) por cada ruta candidata (C, L) del mismo dron."""
+    origenes = np.empty_like(candidatas)
+    origenes[:, 0] = dron
+    origenes[:, 1:] = distancias["num_drones"] + candidatas[:, :-1]
+    return distancias["origen_pickup"][origenes, candidatas].sum(axis=1)
+
+def _simular(rutas, drones_rutas, pesos, tiempos_max, distancias):
+    """Energía (J) y penalización exactas de una lista de rutas (simulador vectorizado)."""
+    resultado = sim.simular_lista_rutas(rutas, drones_rutas, pesos, tiempos_max, distancias)
+    return resultado["energia"], resultado["penalizada"]
+
+def _candidatas_intra(ruta, dron, distancias):
+    """2-opt y or-opt de la ruta que acortan los tramos en vacío, de mejor a peor delta (hasta MAX_VERIFICACIONES)."""
+    largo = len(ruta)
+    if largo < 2 or largo > LARGO_MAXIMO_INTRA:
+        return np.empty((0, largo), dtype=ruta.dtype)
+    candidatas = ruta[_indices_intra(largo)]
+    delta = _costo_traslados(candidatas, dron, distancias) - _costo_traslados(ruta[None, :], dron, distancias)[0]
+    prometedoras = np.flatnonzero(delta < 0)
+    prometedoras = prometedoras[np.argsort(delta[prometedoras], kind="stable")[:MAX_VERIFICACIONES]]
+    return candidatas[prometedoras]
+
+def _mejorar_rutas_intra(rutas, energias, pesos, tiempos_max, distancias):
+    """
+    Reemplaza cada ruta por su mejor 2-opt / or-opt si mejora la energía exacta. Los candidatos de
+    todas las rutas se verifican en una sola simulación. Devuelve la cantidad de rutas mejoradas.
+    """
+    candidatas = [_candidatas_intra(ruta, d, distancias) for d, ruta in enumerate(rutas)]
+    filas = [fila for c in candidatas for fila in c]
+    if not filas:
+        return 0
+    duenos = np.repeat(np.arange(len(rutas)), [len(c) for c in candidatas])
+    energias_nuevas, penalizadas = _simular(filas, duenos, pesos, tiempos_max, distancias)
+    energias_nuevas = np.where(penalizadas, np.inf, energias_nuevas)
+
+    mejoradas = 0
+    inicio = 0
+    for d, c in enumerate(candidatas):
+        if len(c):
+            mejor = inicio + int(np.argmin(energias_nuevas[inicio:inicio + len(c)]))
+            if energias_nuevas[mejor] < energias[d] - TOLERANCIA:
+                rutas[d], energias[d] = filas[mejor].copy(), energias_nuevas[mejor]
+                mejoradas += 1
+        inicio += len(c)
+    return mejoradas
+
+def _mejor_relocate(rutas, energias, pesos, tiempos_max, distancias):
+    """
+    Mejor movimiento de una tarea a otra ruta: devuelve (a, nueva_a, energia_a, b, nueva_b, energia_b)
+    o None. La primera y la última ruta nunca quedan vacías (los cortes deben quedar en [1, N-1]).
+    """
+    D = distancias["num_drones"]
+    origen_pickup = distancias["origen_pickup"]
+
+    # Huecos donde se puede insertar una tarea: (ruta, posición, origen previo, tarea siguiente o -1)
+    hueco_ruta, hueco_pos, hueco_prev, hueco_sig = [], [], [], []
+    for b, ruta in enumerate(rutas):
+        for q in range(len(ruta) + 1):
+            hueco_ruta.append(b)
+            hueco_pos.append(q)
+            hueco_prev.append(b if q == 0 else D + ruta[q - 1])
+            hueco_sig.append(ruta[q] if q < len(ruta) else -1)
+    hueco_ruta, hueco_pos = np.array(hueco_ruta), np.array(hueco_pos)
+    hueco_prev, hueco_sig = np.array(hueco_prev), np.array(hueco_sig)
+    tiene_sig = hueco_sig >= 0
+    sig_seguro = np.where(tiene_sig, hueco_sig, 0)
+
+    # Tareas que se pueden mover: (ruta, posición, tarea, origen previo, tarea siguiente o -1)
+    tarea_ruta, tarea_pos, tarea, tarea_prev, tarea_sig = [], [], [], [], []
+    for a, ruta in enumerate(rutas):
+        if len(ruta) == 1 and a in (0, len(rutas) - 1):
+            continue
+        for p, t in enumerate(ruta):
+            tarea_ruta.append(a)
+            tarea_pos.append(p)
+            tarea.append(t)
+            tarea_prev.append(a if p == 0 else D + ruta[p - 1])
+            tarea_sig.append(ruta[p + 1] if p + 1 < len(ruta) else -1)
+    if not tarea:
+        return None
+    tarea_ruta, tarea = np.array(tarea_ruta), np.array(tarea)
+    tarea_prev, tarea_sig = np.array(tarea_prev), np.array(tarea_sig)
+    t_sig = tarea_sig >= 0
+    t_sig_seguro = np.where(t_sig, tarea_sig, 0)
+
+    # Delta (metros en vacío) de sacar cada tarea de su ruta y ponerla en cada hueco: matriz (tareas, huecos)
+    quitar = -origen_pickup[tarea_prev, tarea] + np.where(
+        t_sig, origen_pickup[tarea_prev, t_sig_seguro] - origen_pickup[D + tarea, t_sig_seguro], 0)
+    poner = origen_pickup[hueco_prev[None, :], tarea[:, None]] + np.where(
+        tiene_sig[None, :],
+        origen_pickup[D + tarea[:, None], sig_seguro[None, :]] - origen_pickup[hueco_prev, sig_seguro][None, :], 0)
+    delta = np.where(tarea_ruta[:, None] == hueco_ruta[None, :], np.inf, quitar[:, None] + poner)
+    mejor_hueco = np.argmin(delta, axis=1)
+    mejor_delta = delta[np.arange(len(tarea)), mejor_hueco]
+    candidatos = [
+        (mejor_delta[i], int(tarea_ruta[i]), tarea_pos[i], int(hueco_ruta[mejor_hueco[i]]), int(hueco_pos[mejor_hueco[i]]))
+        for i in np.flatnonzero(mejor_delta < 0)
+    ]
+    if not candidatos:
+        return None
+
+    candidatos.sort(key=lambda c: c[0])
+    candidatos = candidatos[:MAX_VERIFICACIONES]
+    nuevas, duenos = [], []
+    for _, a, p, b, q in candidatos:
+        tarea = rutas[a][p]
+        nuevas += [np.delete(rutas[a], p), np.insert(rutas[b], q, tarea)]
+        duenos += [a, b]
+    energias_nuevas, penalizadas = _simular(nuevas, duenos, pesos, tiempos_max, distancias)
+    totales = energias_nuevas[0::2] + energias_nuevas[1::2]
+    actuales = np.array([energias[a] + energias[b] for _, a, _, b, _ in candidatos])
+    totales = np.where(penalizadas[0::2] | penalizadas[1::2], np.inf, totales)
+    mejor = int(np.argmin(totales - actuales))
+    if totales[mejor] < actuales[mejor] - TOLERANCIA:
+        _, a, _, b, _ = candidatos[mejor]
+        return a, nuevas[2 * mejor], energias_nuevas[2 * mejor], b, nuevas[2 * mejor + 1], energias_nuevas[2 * mejor + 1]
+    return None
+
+def mejorar_individuo(individuo, tareas, drones, distancias, max_pasadas=None):
+    """
+    Aplica 2-opt, or-opt (bloques de 1 a 3 tareas) y relocate entre drones hasta que ninguna
+    pasada mejora o se alcanzan max_pasadas. Sólo mejora individuos viables y nunca empeora ni
+    vuelve inviable a ninguno. Devuelve un Individuo nuevo sin evaluar, o el mismo si no hubo mejoras.
+    """
+    max_pasadas = max_pasadas or config.BUSQUEDA_LOCAL_PASADAS
+    c_i, c_ii = individuo
+    num_rutas = len(c_ii) + 1
+    if num_rutas > len(drones): # decodificar_cromosoma descarta las rutas sobrantes
+        return individuo
+    rutas_decodificadas = sim.decodificar_cromosoma(individuo, drones)
+    rutas = [np.asarray(rutas_decodificadas[d], dtype=np.int64) for d in range(num_rutas)]
+    _, _, pesos, tiempos_max = arrays_tareas(tareas)
+
+    habilitado = events.HABILITADO
+    events.habilitar(False) # Las simulaciones de prueba no cuentan como eventos de la corrida
+    try:
+        energias, penalizadas = _simular(rutas, range(num_rutas), pesos, tiempos_max, distancias)
+        if penalizadas.any():
+            return individuo
+        movimientos = 0
+        for _ in range(max_pasadas):
+            mejoradas = _mejorar_rutas_intra(rutas, energias, pesos, tiempos_max, distancias)
+            movimientos += mejoradas
+            mejoro = mejoradas > 0
+            relocate = _mejor_relocate(rutas, energias, pesos, tiempos_max, distancias)
+            if relocate is not None:
+                a, rutas[a], energias[a], b, rutas[b], energias[b] = relocate
+                mejoro = True
+                movimientos += 1
+            if not mejoro:
+                break
+    finally:
+        events.habilitar(habilitado)
+
+    if movimientos == 0:
+        return individuo
+    if events.HABILITADO:
+        events.registrar("busqueda_local_movimientos", movimientos)
+    return Individuo(np.concatenate(rutas), np.cumsum([len(ruta) for ruta in rutas[:-1]]))
@@ -9,12 +9,12 @@ def swap_mutation(task_order):
 def reverse_segment(task_order):
     """Invierte un segmento del cromosoma."""
     a, b = sorted(random.sample(range(len(task_order)), 2)) ## Selecciona dos posiciones aleatorias y define un segmento entre ellas.
-    task_order[a:b] = reversed(task_order[a:b]) ## Invierte el orden de las tareas en ese segmento.
+    task_order[a:b] = task_order[a:b][::-1] ## Invierte el orden de las tareas en ese segmento.
     return task_order
 
 def cuts_mutation(cuts, num_tasks):
     """Modifica levemente los cortes entre tareas de drones."""
-    new_cuts = cuts[:] ##Copia la lista de cortes para no modificar la original.
+    new_cuts = list(cuts) ##Copia los cortes para no modificar los originales (cuts[:] de un array sería una vista).
     idx = random.randint(0, len(cuts)-1) ##Selecciona un índice aleatorio en la lista de cortes.
     delta = random.choice([-1, 1]) ##Decide si aumentar o disminuir el corte.
     new_cuts[idx] = max(1, min(num_tasks - 1, new_cuts[idx] + delta)) ##Ajusta el corte, asegurándose de que esté dentro de los límites válidos.
@@ -0,0 +1,101 @@
+# Operador de reparación de individuos inviables. En lugar de descartar la población y generar otra
+# a ciegas, se toma la tarea donde el simulador detectó la primera falla de cada ruta penalizada
+# (plazo excedido, sin batería para llegar a una estación, tarea imposible o llegada insegura) y se la
+# mueve: antes dentro de su misma ruta o a otra ruta (lo que equivale también a correr los cortes c_ii).
+# Cada movimiento se verifica con el simulador exacto y sólo se acepta si reduce las tareas comprometidas.
+import numpy as np
+import config
+import events
+import simulation as sim
+from individual import Individuo
+from scenario import arrays_tareas
+
+def _comprometidas(rutas, penalizadas, fallas):
+    """Tareas desde la primera falla hasta el final de cada ruta (0 para las rutas sin penalizar)."""
+    largos = np.array([len(ruta) for ruta in rutas])
+    return np.where(penalizadas, largos - fallas, 0)
+
+def _reubicar(rutas, a, estado, pesos, tiempos_max, distancias):
+    """
+    Mejor forma de mover la tarea donde falla la ruta a: adelantarla dentro de la ruta o insertarla en
+    cualquier posición de otra ruta. Devuelve una lista de (ruta, nueva_ruta) con las rutas que cambian,
+    o None si ningún movimiento reduce las tareas comprometidas. La primera y la última ruta nunca
+    quedan vacías (los cortes deben quedar en [1, N-1]).
+    """
+    energias, penalizadas, fallas = estado
+    comprometidas = _comprometidas(rutas, penalizadas, fallas)
+    p = fallas[a]
+    tarea = rutas[a][p]
+    sin_tarea = np.delete(rutas[a], p)
+
+    nuevas = [sin_tarea] + [np.insert(sin_tarea, q, tarea) for q in range(p)]
+    duenos = [a] * (1 + p)
+    destinos = []
+    if len(sin_tarea) > 0 or a not in (0, len(rutas) - 1):
+        for b, ruta in enumerate(rutas):
+            if b != a:
+                nuevas += [np.insert(ruta, q, tarea) for q in range(len(ruta) + 1)]
+                duenos += [b] * (len(ruta) + 1)
+                destinos += [b] * (len(ruta) + 1)
+    resultado = sim.simular_lista_rutas(nuevas, duenos, pesos, tiempos_max, distancias)
+    comprometidas_nuevas = _comprometidas(nuevas, resultado["penalizada"], resultado["primera_falla"])
+    energias_nuevas = resultado["energia"]
+
+    # (cambio de tareas comprometidas, cambio de energía, rutas que cambian) de cada movimiento
+    movimientos = [
+        (comprometidas_nuevas[k] - comprometidas[a], energias_nuevas[k] - energias[a], [(a, k)])
+        for k in range(1, 1 + p)
+    ]
+    for k, b in enumerate(destinos, start=1 + p):
+        movimientos.append((
+            comprometidas_nuevas[0] + comprometidas_nuevas[k] - comprometidas[a] - comprometidas[b],
+            energias_nuevas[0] + energias_nuevas[k] - energias[a] - energias[b],
+            [(a, 0), (b, k)],
+        ))
+    if not movimientos:
+        return None
+    cambio, _, cambios = min(movimientos, key=lambda m: (m[0], m[1]))
+    if cambio >= 0:
+        return None
+    return [(r, nuevas[k], energias_nuevas[k], resultado["penalizada"][k], resultado["primera_falla"][k]) for r, k in cambios]
+
+def reparar_individuo(individuo, tareas, drones, distancias, max_movimientos=None):
+    """
+    Repara un individuo moviendo, de a una, las tareas donde fallan sus rutas penalizadas hasta que
+    ninguna queda penalizada, ningún movimiento ayuda o se alcanzan max_movimientos. Devuelve un
+    Individuo nuevo sin evaluar (que puede seguir siendo inviable si la reparación no alcanzó) o el
+    mismo si no se pudo mover nada.
+    """
+    max_movimientos = max_movimientos or config.REPARACION_MAX_MOVIMIENTOS
+    c_i, c_ii = individuo
+    num_rutas = len(c_ii) + 1
+    if num_rutas > len(drones): # decodificar_cromosoma descarta las rutas sobrantes
+        return individuo
+    rutas_decodificadas = sim.decodificar_cromosoma(individuo, drones)
+    rutas = [np.asarray(rutas_decodificadas[d], dtype=np.int64) for d in range(num_rutas)]
+    _, _, pesos, tiempos_max = arrays_tareas(tareas)
+
+    habilitado = events.HABILITADO
+    events.habilitar(False) # Las simulaciones de prueba no cuentan como eventos de la corrida
+    try:
+        resultado = sim.simular_lista_rutas(rutas, range(num_rutas), pesos, tiempos_max, distancias)
+        energias, penalizadas, fallas = resultado["energia"], resultado["penalizada"], resultado["primera_falla"]
+        movimientos = 0
+        while penalizadas.any() and movimientos < max_movimientos:
+            for a in np.flatnonzero(penalizadas):
+                cambios = _reubicar(rutas, a, (energias, penalizadas, fallas), pesos, tiempos_max, distancias)
+                if cambios is not None:
+                    break
+            else:
+                break # Ninguna ruta penalizada se puede mejorar moviendo su tarea en falla
+            for r, ruta, energia, penalizada, falla in cambios:
+                rutas[r], energias[r], penalizadas[r], fallas[r] = ruta, energia, penalizada, falla
+            movimientos += 1
+    finally:
+        events.habilitar(habilitado)
+
+    if movimientos == 0:
+        return individuo
+    if events.HABILITADO:
+        events.registrar("reparacion_movimientos", movimientos)
+    return Individuo(np.concatenate(rutas), np.cumsum([len(ruta) for ruta in rutas[:-1]]))
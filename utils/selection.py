@@ -1,4 +1,12 @@
 import random
+import numpy as np
+
+def generador():
+    """
+    Generador de NumPy sembrado desde `random`: así una semilla de random.seed()
+    sigue reproduciendo toda la corrida aunque la selección use NumPy.
+    """
+    return np.random.default_rng(random.getrandbits(64))
 
 def tournament_selection(pop, fitnesses, k):
     """Selección por torneo"""
@@ -9,12 +17,53 @@ def tournament_selection(pop, fitnesses, k):
 
     # Ahora mayor fitness = mejor individuo
     mejor_idx = fitness_candidatos.index(max(fitness_candidatos))
-    
+
     return candidatos[mejor_idx]
 
+def torneos(fitnesses, cantidad, k, rng=None):
+    """
+    `cantidad` torneos de k participantes de una vez: se sortea una matriz (cantidad, k) de índices
+    y se toma el de mayor fitness de cada fila (ante empates, el primero, como tournament_selection).
+    Devuelve los índices ganadores.
+    """
+    rng = rng or generador()
+    fitnesses = np.asarray(fitnesses, dtype=float)
+    participantes = rng.integers(0, len(fitnesses), size=(cantidad, max(2, k)))
+    ganadores = np.argmax(fitnesses[participantes], axis=1)
+    return participantes[np.arange(cantidad), ganadores]
+
+def ruleta(fitnesses, cantidad, rng=None):
+    """
+    `cantidad` giros independientes de la ruleta: la suma acumulada se calcula una sola vez
+    y cada giro es una búsqueda binaria. Devuelve los índices elegidos.
+    """
+    rng = rng or generador()
+    acumulados = np.cumsum(np.asarray(fitnesses, dtype=float))
+    if acumulados[-1] <= 0: # Todos con fitness 0 --> elección uniforme
+        return rng.integers(0, len(acumulados), size=cantidad)
+    giros = rng.random(cantidad) * acumulados[-1]
+    return np.minimum(np.searchsorted(acumulados, giros, side="right"), len(acumulados) - 1)
+
+def sus(fitnesses, cantidad, rng=None):
+    """
+    Stochastic Universal Sampling: un único giro con `cantidad` punteros equiespaciados.
+    Misma esperanza que la ruleta pero con menor varianza (cada individuo sale
+    floor o ceil de las veces que le corresponden). Devuelve los índices elegidos en orden aleatorio.
+    """
+    rng = rng or generador()
+    acumulados = np.cumsum(np.asarray(fitnesses, dtype=float))
+    if acumulados[-1] <= 0:
+        return rng.integers(0, len(acumulados), size=cantidad)
+    paso = acumulados[-1] / cantidad
+    punteros = rng.random() * paso + paso * np.arange(cantidad)
+    return rng.permutation(np.minimum(np.searchsorted(acumulados, punteros, side="right"), len(acumulados) - 1))
+
 def buscar_n_mejores(poblacion, fitness_scores, N_BEST):
     """Selección de padres (elitismo simple)."""
-    N_MEJORES = min(N_BEST, len(poblacion))  # evita errores porque en caso de haber una población menor a N_BEST toma el menor de los dos
-    # Ahora mayor fitness = mejor individuo, ordenar de mayor a menor
-    sorted_population = [x for _, x in sorted(zip(fitness_scores, poblacion), key=lambda pair: pair[0], reverse=True)]
-    return sorted_population[:N_MEJORES] # Devuelve los N mejores fitness (serían los máximos)
+    return [poblacion[i] for i in indices_n_mejores(fitness_scores, N_BEST)]
+
+def indices_n_mejores(fitness_scores, N_BEST):
+    """Índices de los N_BEST individuos de mayor fitness (ante empates, en el orden de la población)."""
+    N_MEJORES = min(N_BEST, len(fitness_scores))  # evita errores porque en caso de haber una población menor a N_BEST toma el menor de los dos
+    orden = np.argsort(-np.asarray(fitness_scores, dtype=float), kind="stable")
+    return orden[:N_MEJORES].tolist()